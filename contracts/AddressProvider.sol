@@ -13,6 +13,7 @@ import "../libraries/EnumerableMapping.sol";
 import "../libraries/AddressProviderKeys.sol";
 import "../libraries/AddressProviderMeta.sol";
 import "../libraries/Roles.sol";
+import "../libraries/UncheckedMath.sol";
 
 import "./access/AuthorizationBase.sol";
 
@@ -28,6 +29,7 @@ contract AddressProvider is IAddressProvider, AuthorizationBase, Initializable {
     using EnumerableExtensions for EnumerableMapping.AddressToAddressMap;
     using EnumerableExtensions for EnumerableMapping.Bytes32ToUIntMap;
     using AddressProviderMeta for AddressProviderMeta.Meta;
+    using UncheckedMath for uint256;
 
     mapping(bytes32 => address) public currentAddresses;
 
@@ -77,12 +79,19 @@ contract AddressProvider is IAddressProvider, AuthorizationBase, Initializable {
 
     /**
      * @notice Adds action.
+     * @dev Staker vaults in which the action already holds staked tokens are synced, so that
+     *      their total staked by actions includes these tokens.
      * @param action Address of action to add.
      */
     function addAction(address action) external override onlyGovernance returns (bool) {
         bool result = _actions.add(action);
         if (result) {
             _activeActions.add(action);
+            uint256 length = _stakerVaults.length();
+            for (uint256 i; i < length; i = i.uncheckedInc()) {
+                IStakerVault stakerVault = IStakerVault(_stakerVaults.valueAt(i));
+                if (stakerVault.balanceOf(action) > 0) stakerVault.syncStakedByActions();
+            }
             emit ActionListed(action);
         }
         return result;
@@ -54,7 +54,11 @@ contract StakerVault is IStakerVault, Authorization, Pausable, Initializable {
     // All the data fields required for the staking tracking
     uint256 private _poolTotalStaked;
 
+    // Sum of the balances of all actions registered in the address provider
+    uint256 internal _stakedByActions;
+
     event LpGaugeUpdated(address lpGauge_);
+    event StakedByActionsSynced(uint256 stakedByActions);
 
     constructor(IAddressProvider _addressProvider)
         Authorization(_addressProvider.getRoleManager())
@@ -105,6 +109,7 @@ contract StakerVault is IStakerVault, Authorization, Pausable, Initializable {
             uint256(accountInfo_.balance).uncheckedSub(amount)
         );
         accountInfo[account].balance += uint128(amount);
+        _updateStakedByActions(msg.sender, account, amount);
 
         emit Transfer(msg.sender, account, amount);
     }
@@ -150,6 +155,7 @@ contract StakerVault is IStakerVault, Authorization, Pausable, Initializable {
         /* Update token balances */
         accountInfo[src].balance = uint128(srcTokens.uncheckedSub(amount));
         accountInfo[dst].balance += uint128(amount);
+        _updateStakedByActions(src, dst, amount);
 
         /* Update allowance if necessary */
         if (startingAllowance != type(uint256).max) {
@@ -229,18 +235,30 @@ contract StakerVault is IStakerVault, Authorization, Pausable, Initializable {
     }
 
     /**
-     * @notice Get the total amount of tokens that are staked by actions
+     * @notice Recomputes the total amount of tokens staked by actions from their balances.
+     * @dev The total is kept up to date on stakes, unstakes and transfers. The address
+     *      provider calls this when an action already holding staked tokens is added.
      * @return Total amount staked by actions
      */
-    function getStakedByActions() external view override returns (uint256) {
+    function syncStakedByActions() external override returns (uint256) {
         address[] memory actions = addressProvider.allActions();
         uint256 total;
         for (uint256 i; i < actions.length; i = i.uncheckedInc()) {
             total += accountInfo[actions[i]].balance;
         }
+        _stakedByActions = total;
+        emit StakedByActionsSynced(total);
         return total;
     }
 
+    /**
+     * @notice Get the total amount of tokens that are staked by actions
+     * @return Total amount staked by actions
+     */
+    function getStakedByActions() external view override returns (uint256) {
+        return _stakedByActions;
+    }
+
     function allowance(address owner, address spender) external view override returns (uint256) {
         return _allowances[owner][spender];
     }
@@ -318,6 +336,7 @@ contract StakerVault is IStakerVault, Authorization, Pausable, Initializable {
         uint256 staked = token_.balanceOf(address(this)) - oldBal;
         require(staked == amount, Error.INVALID_AMOUNT);
         accountInfo[account].balance += uint128(staked);
+        _updateStakedByActions(address(0), account, staked);
 
         _poolTotalStaked += staked;
         emit Staked(account, amount);
@@ -360,6 +379,7 @@ contract StakerVault is IStakerVault, Authorization, Pausable, Initializable {
             _allowances[src][msg.sender] -= amount;
         }
         accountInfo[src].balance -= uint128(amount);
+        _updateStakedByActions(src, address(0), amount);
 
         _poolTotalStaked -= amount;
 
@@ -368,6 +388,26 @@ contract StakerVault is IStakerVault, Authorization, Pausable, Initializable {
         emit Unstaked(src, amount);
     }
 
+    /**
+     * @dev Updates the total staked by actions when `amount` moves from `src` to `dst`.
+     *      `src` is the zero address for stakes and `dst` for unstakes.
+     */
+    function _updateStakedByActions(
+        address src,
+        address dst,
+        uint256 amount
+    ) internal {
+        IAddressProvider addressProvider_ = addressProvider;
+        bool srcIsAction = src != address(0) && addressProvider_.isAction(src);
+        bool dstIsAction = dst != address(0) && addressProvider_.isAction(dst);
+        if (srcIsAction == dstIsAction) return;
+        if (dstIsAction) {
+            _stakedByActions += amount;
+        } else {
+            _stakedByActions -= amount;
+        }
+    }
+
     function _isAuthorizedToPause(address account) internal view override returns (bool) {
         return _roleManager().hasRole(Roles.GOVERNANCE, account);
     }
@@ -165,6 +165,14 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
     address public feeHandler;
     uint256 public estimatedGasUsage = 550_000;
 
+    /// @notice mapping of (payer -> account -> protocol -> index in `_userPositions` + 1)
+    mapping(address => mapping(bytes32 => mapping(bytes32 => uint256)))
+        internal _userPositionIndexes;
+
+    /// @notice mapping of (payer -> sum of remaining top-ups times max fee over all positions)
+    /// @dev multiplied by `estimatedGasUsage` to get the ETH required for gas
+    mapping(address => uint256) internal _userGasReserves;
+
     event TopUpHandlerUpdated(bytes32 protocol, address newHandler);
     event ActionFeeUpdated(uint256 actionFee);
     event FeeHandlerUpdated(address feeHandler);
@@ -238,6 +246,8 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
         record.depositTokenBalance = totalLockAmount.toUint128();
         _positions[msg.sender][account][protocol] = record;
         _userPositions[msg.sender].push(RecordMeta(account, protocol));
+        _userPositionIndexes[msg.sender][account][protocol] = _userPositions[msg.sender].length;
+        _userGasReserves[msg.sender] += _gasReserve(_positions[msg.sender][account][protocol]);
         _usersWithPositions.add(msg.sender);
 
         emit Register(
@@ -346,17 +356,7 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
      * usage of a top-up
      */
     function getEthRequiredForGas(address payer) external view override returns (uint256) {
-        uint256 totalEthRequired;
-        RecordMeta[] memory userRecordsMeta = _userPositions[payer];
-        uint256 gasUsagePerCall = estimatedGasUsage;
-        uint256 length = userRecordsMeta.length;
-        for (uint256 i; i < length; i = i.uncheckedInc()) {
-            RecordMeta memory meta = userRecordsMeta[i];
-            Record memory record = _positions[payer][meta.account][meta.protocol];
-            uint256 totalCalls = record.totalTopUpAmount.divRoundUp(record.singleTopUpAmount);
-            totalEthRequired += totalCalls * gasUsagePerCall * record.maxFee;
-        }
-        return totalEthRequired;
+        return _userGasReserves[payer] * estimatedGasUsage;
     }
 
     /**
@@ -431,18 +431,148 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
         uint256 maxWeiForGas
     ) public override notShutdown notPaused {
         require(controller.canKeeperExecuteAction(msg.sender), Error.NOT_ENOUGH_MERO_STAKED);
+        _execute(RecordKey(payer, account, protocol), beneficiary, msg.sender, maxWeiForGas, false);
+    }
+
+    /**
+     * @notice Tops up several positions in a single transaction.
+     * @dev A position that cannot be executed is skipped and a `TopUpFailed` event is emitted.
+     * Fees are paid once per deposit token for all the positions executed, so this contract
+     * is reported as the payer of `FeesPayed`. A `TopUpFeesDeferred` event attributes the fees
+     * of each position to its payer.
+     * @param keys Keys of the positions to top up.
+     * @param beneficiary Address of the keeper's wallet for fee accrual.
+     * @param maxWeiForGas the maximum extra amount of wei that the keeper is willing to pay
+     * for the gas of each position
+     * @return executed `true` for each position that was topped up, `false` if skipped.
+     */
+    function executeBatch(
+        RecordKey[] calldata keys,
+        address beneficiary,
+        uint256 maxWeiForGas
+    ) external override notShutdown notPaused returns (bool[] memory executed) {
+        require(controller.canKeeperExecuteAction(msg.sender), Error.NOT_ENOUGH_MERO_STAKED);
+
+        uint256 length = keys.length;
+        executed = new bool[](length);
+        address[] memory depositTokens = new address[](length);
+        uint256[] memory feeAmounts = new uint256[](length);
+        uint256 tokensCount;
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            RecordKey calldata key = keys[i];
+            address depositToken = _positions[key.payer][key.account][key.protocol].depositToken;
+            try this.executeFromBatch(key, beneficiary, msg.sender, maxWeiForGas) returns (
+                uint256 feeAmount
+            ) {
+                executed[i] = true;
+                uint256 j;
+                while (j < tokensCount && depositTokens[j] != depositToken) j = j.uncheckedInc();
+                if (j == tokensCount) {
+                    depositTokens[j] = depositToken;
+                    tokensCount = tokensCount.uncheckedInc();
+                }
+                feeAmounts[j] += feeAmount;
+                emit TopUpFeesDeferred(
+                    key.payer,
+                    key.account,
+                    key.protocol,
+                    depositToken,
+                    feeAmount
+                );
+            } catch (bytes memory reason) {
+                emit TopUpFailed(key.payer, key.account, key.protocol, reason);
+            }
+        }
+
+        for (uint256 j; j < tokensCount; j = j.uncheckedInc()) {
+            if (feeAmounts[j] == 0) continue;
+            _payFees(address(this), beneficiary, feeAmounts[j], depositTokens[j]);
+        }
+    }
+
+    /**
+     * @notice Tops up a single position of a batch without paying its fees.
+     * @dev Only callable by this contract from `executeBatch`, which pays the fees.
+     * @param key Key of the position to top up.
+     * @param beneficiary Address of the keeper's wallet for fee accrual.
+     * @param keeper Address of the keeper executing the batch, reimbursed for the gas.
+     * @param maxWeiForGas the maximum extra amount of wei that the keeper is willing to pay for the gas
+     * @return The amount of deposit tokens owed as fees.
+     */
+    function executeFromBatch(
+        RecordKey calldata key,
+        address beneficiary,
+        address keeper,
+        uint256 maxWeiForGas
+    ) external returns (uint256) {
+        require(msg.sender == address(this), Error.UNAUTHORIZED_ACCESS);
+        return _execute(key, beneficiary, keeper, maxWeiForGas, true);
+    }
+
+    /**
+     * @notice Check if action can be executed.
+     * @param protocol for which to get the health factor
+     * @param account for which to get the health factor
+     * @param extra data to be used by the topup handler
+     * @return healthFactor of the position
+     */
+    function getHealthFactor(
+        bytes32 protocol,
+        bytes32 account,
+        bytes calldata extra
+    ) public view override returns (uint256 healthFactor) {
+        ITopUpHandler topUpHandler_ = ITopUpHandler(_getHandler(protocol, true));
+        return topUpHandler_.getUserFactor(account, extra);
+    }
 
+    function getHandler(bytes32 protocol) public view override returns (address) {
+        return _getHandler(protocol, false);
+    }
+
+    /**
+     * @notice Get the record for a position.
+     * @param payer Registered payer of the position.
+     * @param account Address holding the position.
+     * @param protocol Protocol where the position is held.
+     */
+    function getPosition(
+        address payer,
+        bytes32 account,
+        bytes32 protocol
+    ) public view override returns (Record memory) {
+        return _positions[payer][account][protocol];
+    }
+
+    /**
+     * @dev Tops up a position if it's conditions are met.
+     * @param key Key of the position to top up.
+     * @param beneficiary Address of the keeper's wallet for fee accrual.
+     * @param keeper Address of the keeper to reimburse for the gas.
+     * @param maxWeiForGas the maximum extra amount of wei that the keeper is willing to pay for the gas
+     * @param deferFees If `true`, fees are not paid and their amount is returned instead.
+     * @return feeAmount The amount of deposit tokens owed as fees if `deferFees` is set, else 0.
+     */
+    function _execute(
+        RecordKey memory key,
+        address beneficiary,
+        address keeper,
+        uint256 maxWeiForGas,
+        bool deferFees
+    ) internal returns (uint256 feeAmount) {
         ExecuteLocalVars memory vars;
 
         vars.initialGas = gasleft();
 
-        Record storage position = _positions[payer][account][protocol];
+        Record storage position = _positions[key.payer][key.account][key.protocol];
         require(position.threshold != 0, Error.NO_POSITION_EXISTS);
         require(position.totalTopUpAmount > 0, Error.INSUFFICIENT_BALANCE);
         require(block.timestamp > position.registeredAt, Error.CANNOT_EXECUTE_IN_SAME_BLOCK);
 
-        vars.topUpHandler = _getHandler(protocol, true);
-        vars.userFactor = ITopUpHandler(vars.topUpHandler).getUserFactor(account, position.extra);
+        vars.topUpHandler = _getHandler(key.protocol, true);
+        vars.userFactor = ITopUpHandler(vars.topUpHandler).getUserFactor(
+            key.account,
+            position.extra
+        );
 
         // ensure that the position is actually below its set user factor threshold
         require(vars.userFactor < position.threshold, Error.INSUFFICIENT_THRESHOLD);
@@ -467,7 +597,7 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
             Error.ESTIMATED_GAS_TOO_HIGH
         );
 
-        vars.gasBankBalance = gasBank.balanceOf(payer);
+        vars.gasBankBalance = gasBank.balanceOf(key.payer);
         // ensure the user has enough funds in the gas bank to cover the gas
         require(
             vars.gasBankBalance + maxWeiForGas >= vars.estimatedRequiredWeiForGas,
@@ -515,7 +645,7 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
 
         // unstake deposit tokens including fees
         IStakerVault(vault).unstake(vars.depositAmountWithFees);
-        IStakerVault(vault).decreaseActionLockedBalance(payer, vars.depositAmountWithFees);
+        IStakerVault(vault).decreaseActionLockedBalance(key.payer, vars.depositAmountWithFees);
 
         // swap the amount without the fees
         // as the fees are paid in deposit token, not in action token
@@ -538,39 +668,45 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
             _approve(position.actionToken, vars.topUpHandler);
         }
         ITopUpHandler(vars.topUpHandler).topUp{value: value_}(
-            account,
+            key.account,
             position.actionToken,
             vars.actionTokenAmount,
             position.extra
         );
 
         // totalTopUpAmount is updated to reflect the new "balance" of the position
+        _userGasReserves[key.payer] -= _gasReserve(position);
         if (vars.totalTopUpAmount > vars.totalActionTokenAmount) {
             position.totalTopUpAmount -= vars.totalActionTokenAmount.toUint128();
         } else {
             position.totalTopUpAmount = 0;
         }
+        _userGasReserves[key.payer] += _gasReserve(position);
 
         position.depositTokenBalance -= vars.depositAmountWithFees.toUint128();
 
         vars.removePosition = position.totalTopUpAmount == 0 || position.depositTokenBalance == 0;
-        _payFees(payer, beneficiary, vars.depositTotalFeesAmount, position.depositToken);
+        if (deferFees) {
+            feeAmount = vars.depositTotalFeesAmount;
+        } else {
+            _payFees(key.payer, beneficiary, vars.depositTotalFeesAmount, position.depositToken);
+        }
         if (vars.removePosition) {
             if (position.depositTokenBalance > 0) {
                 // transfer any unused locked tokens to the payer
-                IStakerVault(vault).transfer(payer, position.depositTokenBalance);
+                IStakerVault(vault).transfer(key.payer, position.depositTokenBalance);
                 IStakerVault(vault).decreaseActionLockedBalance(
-                    payer,
+                    key.payer,
                     position.depositTokenBalance
                 );
             }
-            _removePosition(payer, account, protocol);
+            _removePosition(key.payer, key.account, key.protocol);
         }
 
         emit TopUp(
-            account,
-            protocol,
-            payer,
+            key.account,
+            key.protocol,
+            key.payer,
             position.depositToken,
             vars.depositAmountWithFees,
             position.actionToken,
@@ -593,46 +729,12 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
             vars.reimbursedWeiForGas + maxWeiForGas >= vars.requiredWeiForGas,
             Error.GAS_TOO_HIGH
         );
-        gasBank.withdrawFrom(payer, payable(msg.sender), vars.reimbursedWeiForGas);
+        gasBank.withdrawFrom(key.payer, payable(keeper), vars.reimbursedWeiForGas);
         if (vars.removePosition) {
-            gasBank.withdrawUnused(payer);
+            gasBank.withdrawUnused(key.payer);
         }
     }
 
-    /**
-     * @notice Check if action can be executed.
-     * @param protocol for which to get the health factor
-     * @param account for which to get the health factor
-     * @param extra data to be used by the topup handler
-     * @return healthFactor of the position
-     */
-    function getHealthFactor(
-        bytes32 protocol,
-        bytes32 account,
-        bytes calldata extra
-    ) public view override returns (uint256 healthFactor) {
-        ITopUpHandler topUpHandler_ = ITopUpHandler(_getHandler(protocol, true));
-        return topUpHandler_.getUserFactor(account, extra);
-    }
-
-    function getHandler(bytes32 protocol) public view override returns (address) {
-        return _getHandler(protocol, false);
-    }
-
-    /**
-     * @notice Get the record for a position.
-     * @param payer Registered payer of the position.
-     * @param account Address holding the position.
-     * @param protocol Protocol where the position is held.
-     */
-    function getPosition(
-        address payer,
-        bytes32 account,
-        bytes32 protocol
-    ) public view override returns (Record memory) {
-        return _positions[payer][account][protocol];
-    }
-
     function _updateTopUpHandler(
         bytes32 protocol,
         address oldHandler,
@@ -689,6 +791,7 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
         bytes32 account,
         bytes32 protocol
     ) internal {
+        _userGasReserves[payer] -= _gasReserve(_positions[payer][account][protocol]);
         delete _positions[payer][account][protocol];
         _removeUserPosition(payer, account, protocol);
         if (_userPositions[payer].length == 0) {
@@ -702,16 +805,29 @@ contract TopUpAction is ITopUpAction, Initializable, BaseAction {
         bytes32 account,
         bytes32 protocol
     ) internal {
+        mapping(bytes32 => mapping(bytes32 => uint256)) storage indexes = _userPositionIndexes[
+            payer
+        ];
+        uint256 index = indexes[account][protocol];
+        if (index == 0) return;
+        delete indexes[account][protocol];
+
         RecordMeta[] storage positionsMeta = _userPositions[payer];
         uint256 length = positionsMeta.length;
-        for (uint256 i; i < length; i = i.uncheckedInc()) {
-            RecordMeta storage positionMeta = positionsMeta[i];
-            if (positionMeta.account == account && positionMeta.protocol == protocol) {
-                positionsMeta[i] = positionsMeta[length - 1];
-                positionsMeta.pop();
-                return;
-            }
+        if (index != length) {
+            RecordMeta memory lastMeta = positionsMeta[length - 1];
+            positionsMeta[index - 1] = lastMeta;
+            indexes[lastMeta.account][lastMeta.protocol] = index;
         }
+        positionsMeta.pop();
+    }
+
+    /**
+     * @dev Returns the number of remaining top-ups of `record` times its max fee,
+     * i.e. the ETH required to pay for its gas per unit of gas used.
+     */
+    function _gasReserve(Record storage record) internal view returns (uint256) {
+        return record.totalTopUpAmount.divRoundUp(record.singleTopUpAmount) * record.maxFee;
     }
 
     /**
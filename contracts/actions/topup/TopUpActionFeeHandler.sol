@@ -29,6 +29,8 @@ contract TopUpActionFeeHandler is IActionFeeHandler, Authorization {
     mapping(address => uint256) public treasuryAmounts;
     mapping(address => mapping(address => uint256)) public keeperRecords;
     mapping(address => address) public keeperGauges;
+    // Keeper gauge -> number of LP tokens reporting fees to it
+    mapping(address => uint256) public keeperGaugeUsage;
     uint256 public keeperFeeFraction;
     uint256 public treasuryFeeFraction;
 
@@ -67,6 +69,7 @@ contract TopUpActionFeeHandler is IActionFeeHandler, Authorization {
         require(getKeeperGauge(lpToken_) == address(0), Error.ZERO_ADDRESS_NOT_ALLOWED);
         require(keeperGauge_ != address(0), Error.ZERO_ADDRESS_NOT_ALLOWED);
         keeperGauges[lpToken_] = keeperGauge_;
+        keeperGaugeUsage[keeperGauge_]++;
     }
 
     /**
@@ -152,11 +155,14 @@ contract TopUpActionFeeHandler is IActionFeeHandler, Authorization {
         override
         onlyGovernance
     {
+        address previousGauge_ = keeperGauges[lpToken_];
+        if (previousGauge_ != address(0)) keeperGaugeUsage[previousGauge_]--;
         if (keeperGauge_ == address(0)) {
             delete keeperGauges[lpToken_];
             return;
         }
         keeperGauges[lpToken_] = keeperGauge_;
+        keeperGaugeUsage[keeperGauge_]++;
         emit KeeperGaugeUpdated(lpToken_, keeperGauge_);
     }
 
@@ -174,4 +180,12 @@ contract TopUpActionFeeHandler is IActionFeeHandler, Authorization {
     function getKeeperGauge(address lpToken) public view override returns (address) {
         return keeperGauges[lpToken];
     }
+
+    /**
+     * @notice Returns whether fees of any LP token are reported to a keeper gauge.
+     * @param keeperGauge Keeper gauge to check.
+     */
+    function isKeeperGaugeUsed(address keeperGauge) external view override returns (bool) {
+        return keeperGaugeUsage[keeperGauge] > 0;
+    }
 }
@@ -6,6 +6,7 @@ import "@openzeppelin/contracts/utils/structs/EnumerableSet.sol";
 import "../../../interfaces/actions/topup/ITopUpAction.sol";
 import "../../../interfaces/actions/topup/ITopUpKeeperHelper.sol";
 import "../../../interfaces/actions/topup/ITopUpHandler.sol";
+import "../../../libraries/Errors.sol";
 import "../../../libraries/UncheckedMath.sol";
 
 /**
@@ -42,13 +43,15 @@ contract TopUpKeeperHelper is ITopUpKeeperHelper {
         while (true) {
             (address[] memory users, ) = _topupAction.usersWithPositions(cursor, howMany);
             if (users.length == 0) return (_shortenTopups(executableTopups, topupsAdded), 0);
+            ITopUpAction.RecordWithMeta[][] memory usersPositions = _listUsersPositions(users);
+            bool[] memory executable = _canExecuteBatch(_flattenPositions(usersPositions));
+            uint256 k;
             for (uint256 i; i < users.length; i = i.uncheckedInc()) {
-                address user = users[i];
-                ITopUpAction.RecordWithMeta[] memory positions = listPositions(user);
+                ITopUpAction.RecordWithMeta[] memory positions = usersPositions[i];
                 for (uint256 j; j < positions.length; j = j.uncheckedInc()) {
-                    ITopUpAction.RecordWithMeta memory position = positions[j];
-                    if (!_canExecute(user, position)) continue;
-                    executableTopups[topupsAdded] = _positionToTopup(user, position);
+                    k = k.uncheckedInc();
+                    if (!executable[k - 1]) continue;
+                    executableTopups[topupsAdded] = _positionToTopup(users[i], positions[j]);
                     topupsAdded = topupsAdded.uncheckedInc();
                     uint256 offset = j == positions.length - 1 ? 1 : 0;
                     if (topupsAdded == howMany) return (executableTopups, cursor + i + offset);
@@ -61,6 +64,7 @@ contract TopUpKeeperHelper is ITopUpKeeperHelper {
     /**
      * @notice Check if the action can be executed for the positions
      * of the given `keys`
+     * @dev Health factors are read with a single call per protocol.
      * @param keys Unique keys to check for
      * @return an array of boolean containing a result per input
      */
@@ -70,12 +74,17 @@ contract TopUpKeeperHelper is ITopUpKeeperHelper {
         override
         returns (bool[] memory)
     {
-        bool[] memory results = new bool[](keys.length);
-        for (uint256 i; i < keys.length; i = i.uncheckedInc()) {
+        uint256 length = keys.length;
+        ITopUpAction.RecordWithMeta[] memory positions = new ITopUpAction.RecordWithMeta[](length);
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
             ITopUpAction.RecordKey calldata key = keys[i];
-            results[i] = canExecute(key);
+            positions[i] = ITopUpAction.RecordWithMeta(
+                key.account,
+                key.protocol,
+                _topupAction.getPosition(key.payer, key.account, key.protocol)
+            );
         }
-        return results;
+        return _canExecuteBatch(positions);
     }
 
     /**
@@ -125,17 +134,108 @@ contract TopUpKeeperHelper is ITopUpKeeperHelper {
     }
 
     /**
-     * @dev Returns if a position can be executed.
-     * @param user The user paying for the position.
-     * @param position The position record with metadata.
-     * @return 'true' if it can be executed, 'false' if not.
+     * @dev Returns which of the given positions can be executed.
+     * Positions are grouped by protocol so that the health factors of all the accounts
+     * of a protocol are read with a single call to its handler.
+     * @param positions The position records with metadata.
+     * @return results 'true' for each position that can be executed, 'false' if not.
+     */
+    function _canExecuteBatch(ITopUpAction.RecordWithMeta[] memory positions)
+        private
+        view
+        returns (bool[] memory results)
+    {
+        uint256 length = positions.length;
+        results = new bool[](length);
+        bool[] memory visited = new bool[](length);
+        uint256[] memory indices = new uint256[](length);
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            if (visited[i]) continue;
+            bytes32 protocol = positions[i].protocol;
+            uint256 count;
+            for (uint256 j = i; j < length; j = j.uncheckedInc()) {
+                if (visited[j] || positions[j].protocol != protocol) continue;
+                visited[j] = true;
+                ITopUpAction.Record memory record = positions[j].record;
+                if (record.threshold == 0 || record.totalTopUpAmount == 0) continue;
+                indices[count] = j;
+                count = count.uncheckedInc();
+            }
+            if (count == 0) continue;
+
+            uint256[] memory factors = _getUserFactors(protocol, positions, indices, count);
+            for (uint256 k; k < count; k = k.uncheckedInc()) {
+                uint256 index = indices[k];
+                results[index] = factors[k] < positions[index].record.threshold;
+            }
+        }
+    }
+
+    /**
+     * @dev Reads the health factors of the first `count` positions referenced by `indices`,
+     * all of which must be held on `protocol`.
+     */
+    function _getUserFactors(
+        bytes32 protocol,
+        ITopUpAction.RecordWithMeta[] memory positions,
+        uint256[] memory indices,
+        uint256 count
+    ) private view returns (uint256[] memory) {
+        address handler = _topupAction.getHandler(protocol);
+        require(handler != address(0), Error.PROTOCOL_NOT_FOUND);
+        bytes32[] memory accounts = new bytes32[](count);
+        bytes[] memory extra = new bytes[](count);
+        for (uint256 k; k < count; k = k.uncheckedInc()) {
+            ITopUpAction.RecordWithMeta memory position = positions[indices[k]];
+            accounts[k] = position.account;
+            extra[k] = position.record.extra;
+        }
+        return ITopUpHandler(handler).getUserFactors(accounts, extra);
+    }
+
+    /**
+     * @dev Lists the positions of each of the given users.
+     * @param users The users paying for the positions.
+     * @return The positions of each user, in the same order as `users`.
      */
-    function _canExecute(address user, ITopUpAction.RecordWithMeta memory position)
+    function _listUsersPositions(address[] memory users)
         private
         view
-        returns (bool)
+        returns (ITopUpAction.RecordWithMeta[][] memory)
+    {
+        uint256 length = users.length;
+        ITopUpAction.RecordWithMeta[][] memory result = new ITopUpAction.RecordWithMeta[][](
+            length
+        );
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            result[i] = listPositions(users[i]);
+        }
+        return result;
+    }
+
+    /**
+     * @dev Concatenates the positions of several users into a single list.
+     * @param usersPositions The positions of each user.
+     * @return The positions of all users, in order.
+     */
+    function _flattenPositions(ITopUpAction.RecordWithMeta[][] memory usersPositions)
+        private
+        pure
+        returns (ITopUpAction.RecordWithMeta[] memory)
     {
-        return canExecute(ITopUpAction.RecordKey(user, position.account, position.protocol));
+        uint256 total;
+        for (uint256 i; i < usersPositions.length; i = i.uncheckedInc()) {
+            total += usersPositions[i].length;
+        }
+        ITopUpAction.RecordWithMeta[] memory result = new ITopUpAction.RecordWithMeta[](total);
+        uint256 k;
+        for (uint256 i; i < usersPositions.length; i = i.uncheckedInc()) {
+            for (uint256 j; j < usersPositions[i].length; j = j.uncheckedInc()) {
+                result[k] = usersPositions[i][j];
+                k = k.uncheckedInc();
+            }
+        }
+        return result;
     }
 
     /**
@@ -6,6 +6,7 @@ import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
 
 import "../../../../libraries/Errors.sol";
 import "../../../../libraries/AccountEncoding.sol";
+import "../../../../libraries/UncheckedMath.sol";
 
 import "../../../../interfaces/vendor/ILendingPool.sol";
 import "../../../../interfaces/vendor/IWETH.sol";
@@ -15,6 +16,7 @@ import "../../../../interfaces/actions/topup/ITopUpHandler.sol";
 contract AaveHandler is ITopUpHandler {
     using SafeERC20 for IERC20;
     using AccountEncoding for bytes32;
+    using UncheckedMath for uint256;
 
     uint16 public constant MERO_REFERRAL_CODE = 62314;
 
@@ -73,6 +75,21 @@ contract AaveHandler is ITopUpHandler {
         return healthFactor;
     }
 
+    function getUserFactors(bytes32[] calldata accounts, bytes[] calldata extra)
+        external
+        view
+        override
+        returns (uint256[] memory factors)
+    {
+        require(accounts.length == extra.length, Error.INVALID_ARGUMENT);
+        ILendingPool lendingPool_ = lendingPool;
+        uint256 length = accounts.length;
+        factors = new uint256[](length);
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            (, , , , , factors[i]) = lendingPool_.getUserAccountData(accounts[i].addr());
+        }
+    }
+
     /**
      * @dev Approves infinite spending for the given spender.
      * @param token The token to approve for.
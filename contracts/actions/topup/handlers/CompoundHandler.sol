@@ -27,13 +27,26 @@ contract CompoundHandler is ITopUpHandler, ExponentialNoError {
         uint256 cTokenBalance;
         uint256 borrowBalance;
         uint256 exchangeRateMantissa;
-        uint256 oraclePriceMantissa;
         Exp collateralFactor;
         Exp exchangeRate;
         Exp oraclePrice;
         Exp tokensToDenom;
     }
 
+    /**
+     * @dev Market data that does not depend on the account.
+     * Kept in memory so that it is only loaded once when computing
+     * the factors of several accounts.
+     */
+    struct MarketCache {
+        Comptroller comptroller;
+        PriceOracle oracle;
+        address[] assets;
+        Exp[] collateralFactors;
+        Exp[] oraclePrices;
+        uint256 length;
+    }
+
     Comptroller public immutable comptroller;
     ICTokenRegistry public immutable cTokenRegistry;
 
@@ -89,11 +102,28 @@ contract CompoundHandler is ITopUpHandler, ExponentialNoError {
      * @return User factor.
      */
     function getUserFactor(bytes32 account, bytes memory) external view override returns (uint256) {
-        (uint256 sumCollateral, uint256 sumBorrow) = _getAccountBorrowsAndSupply(account.addr());
-        if (sumBorrow == 0) {
-            return type(uint256).max;
+        return _getUserFactor(account.addr(), _newMarketCache(0));
+    }
+
+    /**
+     * @notice Returns the collateralization ratio of each of the given accounts.
+     * @dev Collateral factors and oracle prices are only loaded once per market.
+     * @param accounts accounts for which to check the factor.
+     * @return factors User factors, in the same order as `accounts`.
+     */
+    function getUserFactors(bytes32[] calldata accounts, bytes[] calldata extra)
+        external
+        view
+        override
+        returns (uint256[] memory factors)
+    {
+        require(accounts.length == extra.length, Error.INVALID_ARGUMENT);
+        MarketCache memory cache = _newMarketCache(comptroller.getAllMarkets().length);
+        uint256 length = accounts.length;
+        factors = new uint256[](length);
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            factors[i] = _getUserFactor(accounts[i].addr(), cache);
         }
-        return sumCollateral.scaledDiv(sumBorrow);
     }
 
     /**
@@ -136,14 +166,72 @@ contract CompoundHandler is ITopUpHandler, ExponentialNoError {
         IERC20(token).safeApprove(spender, type(uint256).max);
     }
 
-    function _getAccountBorrowsAndSupply(address account) internal view returns (uint256, uint256) {
+    function _getUserFactor(address account, MarketCache memory cache)
+        internal
+        view
+        returns (uint256)
+    {
+        (uint256 sumCollateral, uint256 sumBorrow) = _getAccountBorrowsAndSupply(account, cache);
+        if (sumBorrow == 0) {
+            return type(uint256).max;
+        }
+        return sumCollateral.scaledDiv(sumBorrow);
+    }
+
+    /**
+     * @dev Creates a market cache that can hold up to `capacity` markets.
+     * Markets that do not fit are loaded again on every lookup.
+     */
+    function _newMarketCache(uint256 capacity) internal view returns (MarketCache memory cache) {
+        cache.comptroller = comptroller;
+        cache.oracle = cache.comptroller.oracle();
+        cache.assets = new address[](capacity);
+        cache.collateralFactors = new Exp[](capacity);
+        cache.oraclePrices = new Exp[](capacity);
+    }
+
+    /**
+     * @dev Returns the collateral factor and the oracle price of `asset`,
+     * loading and caching them if this is the first lookup for `asset`.
+     */
+    function _getMarketData(MarketCache memory cache, CToken asset)
+        internal
+        view
+        returns (Exp memory collateralFactor, Exp memory oraclePrice)
+    {
+        uint256 length = cache.length;
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            if (cache.assets[i] == address(asset)) {
+                return (cache.collateralFactors[i], cache.oraclePrices[i]);
+            }
+        }
+
+        (, uint256 collateralFactorMantissa, ) = cache.comptroller.markets(address(asset));
+        collateralFactor = Exp({mantissa: collateralFactorMantissa});
+
+        // Get the normalized price of the asset
+        uint256 oraclePriceMantissa = cache.oracle.getUnderlyingPrice(asset);
+        require(oraclePriceMantissa != 0, Error.FAILED_METHOD_CALL);
+        oraclePrice = Exp({mantissa: oraclePriceMantissa});
+
+        if (length < cache.assets.length) {
+            cache.assets[length] = address(asset);
+            cache.collateralFactors[length] = collateralFactor;
+            cache.oraclePrices[length] = oraclePrice;
+            cache.length = length + 1;
+        }
+    }
+
+    function _getAccountBorrowsAndSupply(address account, MarketCache memory cache)
+        internal
+        view
+        returns (uint256, uint256)
+    {
         AccountLiquidityLocalVars memory vars; // Holds all our calculation results
         uint256 oErr;
 
-        Comptroller comptroller_ = comptroller;
-        PriceOracle oracle = comptroller_.oracle();
         // For each asset the account is in
-        CToken[] memory assets = comptroller_.getAssetsIn(account);
+        CToken[] memory assets = cache.comptroller.getAssetsIn(account);
         uint256 length_ = assets.length;
         for (uint256 i; i < length_; i = i.uncheckedInc()) {
             CToken asset = assets[i];
@@ -152,15 +240,9 @@ contract CompoundHandler is ITopUpHandler, ExponentialNoError {
             (oErr, vars.cTokenBalance, vars.borrowBalance, vars.exchangeRateMantissa) = asset
                 .getAccountSnapshot(account);
             require(oErr == 0, Error.FAILED_METHOD_CALL);
-            (, uint256 collateralFactorMantissa, ) = comptroller_.markets(address(asset));
-            vars.collateralFactor = Exp({mantissa: collateralFactorMantissa});
+            (vars.collateralFactor, vars.oraclePrice) = _getMarketData(cache, asset);
             vars.exchangeRate = Exp({mantissa: vars.exchangeRateMantissa});
 
-            // Get the normalized price of the asset
-            vars.oraclePriceMantissa = oracle.getUnderlyingPrice(asset);
-            require(vars.oraclePriceMantissa != 0, Error.FAILED_METHOD_CALL);
-            vars.oraclePrice = Exp({mantissa: vars.oraclePriceMantissa});
-
             // Pre-compute a conversion factor from tokens -> ether (normalized price value)
             vars.tokensToDenom = mul_(
                 mul_(vars.collateralFactor, vars.exchangeRate),
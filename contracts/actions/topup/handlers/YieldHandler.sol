@@ -84,8 +84,29 @@ contract YieldHandler is ITopUpHandler {
      * @dev This transaction will revert if the position has a collateral that uses transactional oracles
      * @param account account for which to get the factor (in our case it is the vaultId, packed as a bytes32)
      */
-    function getUserFactor(bytes32 account, bytes memory) external view returns (uint256 result) {
-        int256 _level = ICauldronCustom(address(cauldron)).level(bytes12(account));
-        result = _level < 0 ? 0 : uint256(_level) + 1e18;
+    function getUserFactor(bytes32 account, bytes memory) external view returns (uint256) {
+        return _getUserFactor(ICauldronCustom(address(cauldron)), account);
+    }
+
+    function getUserFactors(bytes32[] calldata accounts, bytes[] calldata extra)
+        external
+        view
+        returns (uint256[] memory factors)
+    {
+        require(accounts.length == extra.length, "Mismatched accounts and extra");
+        ICauldronCustom cauldron_ = ICauldronCustom(address(cauldron));
+        factors = new uint256[](accounts.length);
+        for (uint256 i; i < accounts.length; i++) {
+            factors[i] = _getUserFactor(cauldron_, accounts[i]);
+        }
+    }
+
+    function _getUserFactor(ICauldronCustom cauldron_, bytes32 account)
+        internal
+        view
+        returns (uint256)
+    {
+        int256 _level = cauldron_.level(bytes12(account));
+        return _level < 0 ? 0 : uint256(_level) + 1e18;
     }
 }
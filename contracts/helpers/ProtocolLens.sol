@@ -0,0 +1,122 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+
+import "../../libraries/AddressProviderHelpers.sol";
+import "../../libraries/UncheckedMath.sol";
+
+import "../../interfaces/IAddressProvider.sol";
+import "../../interfaces/IStakerVault.sol";
+import "../../interfaces/IVault.sol";
+import "../../interfaces/helpers/IProtocolLens.sol";
+import "../../interfaces/pool/ILiquidityPool.sol";
+import "../../interfaces/strategies/IStrategy.sol";
+import "../../interfaces/tokenomics/IInflationManager.sol";
+
+/**
+ * @notice Reads the state of the pools registered in the address provider,
+ * together with their vault, strategy, staker vault and inflation rates, in a single call.
+ */
+contract ProtocolLens is IProtocolLens {
+    using UncheckedMath for uint256;
+    using AddressProviderHelpers for IAddressProvider;
+
+    IAddressProvider internal _addressProvider;
+
+    constructor(address addressProvider_) {
+        _addressProvider = IAddressProvider(addressProvider_);
+    }
+
+    /**
+     * @notice Returns the state of the pools at index `cursor` to `cursor + howMany - 1`.
+     * @dev Uses cursor pagination.
+     * @param cursor The cursor for pagination (should start at 0 for first call).
+     * @param howMany Maximum number of pools to return in this pagination request.
+     * @return poolStates States of the pools.
+     * @return nextCursor The cursor to use for the next pagination request (0 when done).
+     */
+    function getPoolStates(uint256 cursor, uint256 howMany)
+        external
+        view
+        override
+        returns (PoolState[] memory poolStates, uint256 nextCursor)
+    {
+        uint256 poolsCount_ = _addressProvider.poolsCount();
+        if (cursor >= poolsCount_) return (new PoolState[](0), 0);
+        uint256 end_ = cursor + howMany;
+        if (end_ >= poolsCount_) {
+            end_ = poolsCount_;
+        } else {
+            nextCursor = end_;
+        }
+
+        IInflationManager inflationManager_ = _addressProvider.safeGetInflationManager();
+        poolStates = new PoolState[](end_ - cursor);
+        for (uint256 i = cursor; i < end_; i = i.uncheckedInc()) {
+            address pool_ = _addressProvider.getPoolAtIndex(i);
+            poolStates[i - cursor] = _getPoolState(pool_, inflationManager_);
+        }
+    }
+
+    function getAllPoolStates() external view override returns (PoolState[] memory) {
+        address[] memory pools_ = _addressProvider.allPools();
+        IInflationManager inflationManager_ = _addressProvider.safeGetInflationManager();
+        PoolState[] memory poolStates_ = new PoolState[](pools_.length);
+        for (uint256 i; i < pools_.length; i = i.uncheckedInc()) {
+            poolStates_[i] = _getPoolState(pools_[i], inflationManager_);
+        }
+        return poolStates_;
+    }
+
+    function getPoolState(address pool_) external view override returns (PoolState memory) {
+        return _getPoolState(pool_, _addressProvider.safeGetInflationManager());
+    }
+
+    function _getPoolState(address pool_, IInflationManager inflationManager_)
+        internal
+        view
+        returns (PoolState memory state_)
+    {
+        ILiquidityPool liquidityPool_ = ILiquidityPool(pool_);
+        state_.pool = pool_;
+        state_.underlying = liquidityPool_.getUnderlying();
+        state_.lpToken = liquidityPool_.getLpToken();
+        if (state_.lpToken != address(0)) {
+            state_.lpTotalSupply = IERC20(state_.lpToken).totalSupply();
+        }
+        state_.totalUnderlying = liquidityPool_.totalUnderlying();
+        state_.exchangeRate = liquidityPool_.exchangeRate();
+        state_.isShutdown = liquidityPool_.isShutdown();
+        state_.minWithdrawalFee = liquidityPool_.minWithdrawalFee();
+        state_.maxWithdrawalFee = liquidityPool_.maxWithdrawalFee();
+        state_.withdrawalFeeDecreasePeriod = liquidityPool_.withdrawalFeeDecreasePeriod();
+
+        IVault vault_ = liquidityPool_.vault();
+        if (address(vault_) != address(0)) {
+            state_.vault = address(vault_);
+            state_.vaultTotalUnderlying = vault_.getTotalUnderlying();
+            state_.targetAllocation = vault_.targetAllocation();
+            IStrategy strategy_ = vault_.strategy();
+            if (address(strategy_) != address(0)) {
+                state_.strategy = address(strategy_);
+                state_.strategyBalance = strategy_.balance();
+                state_.harvestable = strategy_.harvestable();
+            }
+        }
+
+        IStakerVault stakerVault_ = liquidityPool_.staker();
+        if (address(stakerVault_) != address(0)) {
+            state_.stakerVault = address(stakerVault_);
+            state_.totalStaked = stakerVault_.getPoolTotalStaked();
+            state_.stakedByActions = stakerVault_.getStakedByActions();
+            if (address(inflationManager_) != address(0)) {
+                state_.lpRate = inflationManager_.getLpRateForStakerVault(address(stakerVault_));
+            }
+        }
+
+        if (address(inflationManager_) != address(0)) {
+            state_.keeperRate = inflationManager_.getKeeperRateForPool(pool_);
+        }
+    }
+}
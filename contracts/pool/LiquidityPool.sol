@@ -33,12 +33,24 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         uint64 lastActionTimestamp;
     }
 
+    /**
+     * @dev Withdrawal fee parameters, packed in a single slot as they are all
+     * read when LP tokens are transferred
+     */
+    struct WithdrawalFeeConfig {
+        uint64 minWithdrawalFee;
+        uint64 maxWithdrawalFee;
+        uint64 withdrawalFeeDecreasePeriod;
+    }
+
+    struct ReserveConfig {
+        uint64 requiredReserves;
+        uint64 reserveDeviation;
+    }
+
     IVault public vault;
-    uint256 public reserveDeviation = 0.005e18;
-    uint256 public requiredReserves = ScaledMath.ONE;
-    uint256 public maxWithdrawalFee;
-    uint256 public minWithdrawalFee;
-    uint256 public withdrawalFeeDecreasePeriod = 1 weeks;
+    ReserveConfig internal _reserveConfig = ReserveConfig(uint64(ScaledMath.ONE), 0.005e18);
+    WithdrawalFeeConfig internal _withdrawalFeeConfig = WithdrawalFeeConfig(0, 0, 1 weeks);
 
     /**
      * @notice even through admin votes and later governance, the withdrawal
@@ -137,8 +149,8 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         require(!_shutdown, Error.ALREADY_SHUTDOWN);
 
         _shutdown = true;
-        maxWithdrawalFee = 0;
-        minWithdrawalFee = 0;
+        _withdrawalFeeConfig.maxWithdrawalFee = 0;
+        _withdrawalFeeConfig.minWithdrawalFee = 0;
 
         if (_shutdownStrategy) {
             vault.shutdownStrategy();
@@ -172,24 +184,16 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         address to,
         uint256 amount
     ) external override {
+        IStakerVault staker_ = staker;
         require(
-            msg.sender == address(lpToken) || msg.sender == address(staker),
+            msg.sender == address(lpToken) || msg.sender == address(staker_),
             Error.UNAUTHORIZED_ACCESS
         );
-        if (
-            addressProvider.isStakerVault(to, address(lpToken)) ||
-            addressProvider.isStakerVault(from, address(lpToken)) ||
-            addressProvider.isAction(to) ||
-            addressProvider.isAction(from) ||
-            addressProvider.isWhiteListedFeeHandler(to) ||
-            addressProvider.isWhiteListedFeeHandler(from)
-        ) {
+        // burns never update fees, so skip the exemption lookups
+        if (to == address(0) || _isFeeExempt(to, staker_) || _isFeeExempt(from, staker_)) {
             return;
         }
-
-        if (to != address(0)) {
-            _updateUserFeesOnDeposit(to, from, amount);
-        }
+        _updateUserFeesOnDeposit(to, from, amount);
     }
 
     /**
@@ -198,7 +202,7 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
      */
     function updateRequiredReserves(uint256 requireReserves_) external override onlyGovernance {
         require(requireReserves_ <= ScaledMath.ONE, Error.INVALID_AMOUNT);
-        requiredReserves = requireReserves_;
+        _setRequiredReserves(requireReserves_);
         _rebalanceVault();
         emit RequiredReservesUpdated(requireReserves_);
     }
@@ -209,7 +213,7 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
      */
     function updateReserveDeviation(uint256 reserveDeviation_) external override onlyGovernance {
         require(reserveDeviation_ <= (ScaledMath.DECIMAL_SCALE * 50) / 100, Error.INVALID_AMOUNT);
-        reserveDeviation = reserveDeviation_;
+        _setReserveDeviation(reserveDeviation_);
         _rebalanceVault();
         emit ReserveDeviationUpdated(reserveDeviation_);
     }
@@ -219,8 +223,8 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
      * @param minWithdrawalFee_ New min withdrawal fee.
      */
     function updateMinWithdrawalFee(uint256 minWithdrawalFee_) external override onlyGovernance {
-        _checkFeeInvariants(minWithdrawalFee_, maxWithdrawalFee);
-        minWithdrawalFee = minWithdrawalFee_;
+        _checkFeeInvariants(minWithdrawalFee_, _withdrawalFeeConfig.maxWithdrawalFee);
+        _setMinWithdrawalFee(minWithdrawalFee_);
         emit MinWithdrawalFeeUpdated(minWithdrawalFee_);
     }
 
@@ -229,8 +233,8 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
      * @param maxWithdrawalFee_ New max withdrawal fee.
      */
     function updateMaxWithdrawalFee(uint256 maxWithdrawalFee_) external override onlyGovernance {
-        _checkFeeInvariants(minWithdrawalFee, maxWithdrawalFee_);
-        maxWithdrawalFee = maxWithdrawalFee_;
+        _checkFeeInvariants(_withdrawalFeeConfig.minWithdrawalFee, maxWithdrawalFee_);
+        _setMaxWithdrawalFee(maxWithdrawalFee_);
         emit MaxWithdrawalFeeUpdated(maxWithdrawalFee_);
     }
 
@@ -243,7 +247,7 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         override
         onlyGovernance
     {
-        withdrawalFeeDecreasePeriod = withdrawalFeeDecreasePeriod_;
+        _setWithdrawalFeeDecreasePeriod(withdrawalFeeDecreasePeriod_);
         emit WithdrawalFeeDecreasePeriodUpdated(withdrawalFeeDecreasePeriod_);
     }
 
@@ -363,14 +367,12 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
             return withoutFeesLpAmount;
         }
 
-        WithdrawalFeeMeta memory meta = withdrawalFeeMetas[account];
-
         uint256 currentFeeRatio;
         if (!addressProvider.isAction(account)) {
-            currentFeeRatio = getNewCurrentFees(
-                meta.timeToWait,
-                meta.lastActionTimestamp,
-                meta.feeRatio
+            currentFeeRatio = _getNewCurrentFees(
+                withdrawalFeeMetas[account],
+                _withdrawalFeeConfig.minWithdrawalFee,
+                _getTime()
             );
         }
         uint256 scalingFactor = currentExchangeRate.scaledMul((ScaledMath.ONE - currentFeeRatio));
@@ -488,15 +490,13 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         override
         returns (uint256)
     {
-        WithdrawalFeeMeta memory meta = withdrawalFeeMetas[account];
-
         if (lpToken.balanceOf(account) == 0) {
             return 0;
         }
-        uint256 currentFee = getNewCurrentFees(
-            meta.timeToWait,
-            meta.lastActionTimestamp,
-            meta.feeRatio
+        uint256 currentFee = _getNewCurrentFees(
+            withdrawalFeeMetas[account],
+            _withdrawalFeeConfig.minWithdrawalFee,
+            _getTime()
         );
         return amount.scaledMul(currentFee);
     }
@@ -513,13 +513,34 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         uint256 lastActionTimestamp,
         uint256 feeRatio
     ) public view override returns (uint256) {
-        uint256 timeElapsed = _getTime() - lastActionTimestamp;
-        uint256 minFeePercentage = minWithdrawalFee;
-        if (timeElapsed >= timeToWait || minFeePercentage > feeRatio) {
-            return minFeePercentage;
-        }
-        uint256 elapsedShare = timeElapsed.scaledDiv(timeToWait);
-        return feeRatio - (feeRatio - minFeePercentage).scaledMul(elapsedShare);
+        return
+            _getNewCurrentFees(
+                timeToWait,
+                lastActionTimestamp,
+                feeRatio,
+                _withdrawalFeeConfig.minWithdrawalFee,
+                _getTime()
+            );
+    }
+
+    function minWithdrawalFee() external view override returns (uint256) {
+        return _withdrawalFeeConfig.minWithdrawalFee;
+    }
+
+    function maxWithdrawalFee() external view override returns (uint256) {
+        return _withdrawalFeeConfig.maxWithdrawalFee;
+    }
+
+    function withdrawalFeeDecreasePeriod() external view override returns (uint256) {
+        return _withdrawalFeeConfig.withdrawalFeeDecreasePeriod;
+    }
+
+    function requiredReserves() external view returns (uint256) {
+        return _reserveConfig.requiredReserves;
+    }
+
+    function reserveDeviation() external view returns (uint256) {
+        return _reserveConfig.reserveDeviation;
     }
 
     function _rebalanceVault() internal {
@@ -534,8 +555,28 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
     ) internal initializer {
         name = name_;
         vault = IVault(vault_);
-        maxWithdrawalFee = maxWithdrawalFee_;
-        minWithdrawalFee = minWithdrawalFee_;
+        _setMaxWithdrawalFee(maxWithdrawalFee_);
+        _setMinWithdrawalFee(minWithdrawalFee_);
+    }
+
+    function _setMinWithdrawalFee(uint256 minWithdrawalFee_) internal {
+        _withdrawalFeeConfig.minWithdrawalFee = minWithdrawalFee_.toUint64();
+    }
+
+    function _setMaxWithdrawalFee(uint256 maxWithdrawalFee_) internal {
+        _withdrawalFeeConfig.maxWithdrawalFee = maxWithdrawalFee_.toUint64();
+    }
+
+    function _setWithdrawalFeeDecreasePeriod(uint256 withdrawalFeeDecreasePeriod_) internal {
+        _withdrawalFeeConfig.withdrawalFeeDecreasePeriod = withdrawalFeeDecreasePeriod_.toUint64();
+    }
+
+    function _setRequiredReserves(uint256 requiredReserves_) internal {
+        _reserveConfig.requiredReserves = requiredReserves_.toUint64();
+    }
+
+    function _setReserveDeviation(uint256 reserveDeviation_) internal {
+        _reserveConfig.reserveDeviation = reserveDeviation_.toUint64();
     }
 
     function _approveStakerVaultSpendingLpTokens() internal {
@@ -562,9 +603,14 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         uint256 totalUnderlyingStaked = lockedLp.scaledMul(exchangeRate());
 
         uint256 underlyingBalance = _getBalanceUnderlying(true);
-        uint256 maximumDeviation = totalUnderlyingStaked.scaledMul(reserveDeviation);
+        ReserveConfig memory reserveConfig_ = _reserveConfig;
+        uint256 maximumDeviation = totalUnderlyingStaked.scaledMul(
+            reserveConfig_.reserveDeviation
+        );
 
-        uint256 nextTargetBalance = totalUnderlyingStaked.scaledMul(requiredReserves);
+        uint256 nextTargetBalance = totalUnderlyingStaked.scaledMul(
+            reserveConfig_.requiredReserves
+        );
 
         if (
             underlyingToWithdraw > underlyingBalance ||
@@ -587,42 +633,67 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         address from,
         uint256 amountAdded
     ) internal {
-        WithdrawalFeeMeta storage meta = withdrawalFeeMetas[account];
-        uint256 balance = lpToken.balanceOf(account) +
-            staker.stakedAndActionLockedBalanceOf(account);
-        uint256 newCurrentFeeRatio = getNewCurrentFees(
-            meta.timeToWait,
-            meta.lastActionTimestamp,
-            meta.feeRatio
+        WithdrawalFeeMeta memory meta = withdrawalFeeMetas[account];
+        WithdrawalFeeConfig memory feeConfig = _withdrawalFeeConfig;
+        uint256 currentTime = _getTime();
+        uint256 shareAdded = amountAdded.scaledDiv(
+            amountAdded +
+                lpToken.balanceOf(account) +
+                staker.stakedAndActionLockedBalanceOf(account)
         );
-        uint256 shareAdded = amountAdded.scaledDiv(amountAdded + balance);
         uint256 shareExisting = ScaledMath.ONE - shareAdded;
         uint256 feeOnDeposit;
+        uint256 lastActionTimestamp;
         if (from == address(0)) {
-            feeOnDeposit = maxWithdrawalFee;
-            meta.lastActionTimestamp = _getTime().toUint64();
+            feeOnDeposit = feeConfig.maxWithdrawalFee;
+            lastActionTimestamp = currentTime;
         } else {
-            WithdrawalFeeMeta memory fromMeta = withdrawalFeeMetas[from];
-            feeOnDeposit = getNewCurrentFees(
-                fromMeta.timeToWait,
-                fromMeta.lastActionTimestamp,
-                fromMeta.feeRatio
+            feeOnDeposit = _getNewCurrentFees(
+                withdrawalFeeMetas[from],
+                feeConfig.minWithdrawalFee,
+                currentTime
             );
-            uint256 minTime_ = _getTime() - meta.timeToWait;
-            if (meta.lastActionTimestamp < minTime_) {
-                meta.lastActionTimestamp = minTime_.toUint64();
+            lastActionTimestamp = meta.lastActionTimestamp;
+            uint256 minTime_ = currentTime - meta.timeToWait;
+            if (lastActionTimestamp < minTime_) {
+                lastActionTimestamp = minTime_;
             }
-            meta.lastActionTimestamp = ((shareExisting *
-                uint256(meta.lastActionTimestamp) +
-                shareAdded *
-                _getTime()) / (shareExisting + shareAdded)).toUint64();
+            lastActionTimestamp =
+                (shareExisting * lastActionTimestamp + shareAdded * currentTime) /
+                (shareExisting + shareAdded);
         }
 
-        uint256 newFeeRatio = shareExisting.scaledMul(newCurrentFeeRatio) +
-            shareAdded.scaledMul(feeOnDeposit);
+        WithdrawalFeeMeta memory newMeta = WithdrawalFeeMeta(
+            feeConfig.withdrawalFeeDecreasePeriod,
+            (shareExisting.scaledMul(
+                _getNewCurrentFees(meta, feeConfig.minWithdrawalFee, currentTime)
+            ) + shareAdded.scaledMul(feeOnDeposit)).toUint64(),
+            lastActionTimestamp.toUint64()
+        );
+        // only write when the state of the receiver actually changes
+        if (
+            newMeta.timeToWait != meta.timeToWait ||
+            newMeta.feeRatio != meta.feeRatio ||
+            newMeta.lastActionTimestamp != meta.lastActionTimestamp
+        ) {
+            withdrawalFeeMetas[account] = newMeta;
+        }
+    }
 
-        meta.feeRatio = newFeeRatio.toUint64();
-        meta.timeToWait = withdrawalFeeDecreasePeriod.toUint64();
+    /**
+     * @dev Transfers from or to staker vaults, actions and whitelisted fee handlers do not update
+     *      fees. The staker vault of a pool is unique and never changes once set, so it is
+     *      compared directly instead of being looked up in the address provider.
+     */
+    function _isFeeExempt(address account, IStakerVault staker_) internal view returns (bool) {
+        if (account == address(0)) return false;
+        bool isStakerVault_ = address(staker_) == address(0)
+            ? addressProvider.isStakerVault(account, address(lpToken))
+            : account == address(staker_);
+        return
+            isStakerVault_ ||
+            addressProvider.isAction(account) ||
+            addressProvider.isWhiteListedFeeHandler(account);
     }
 
     function _getBalanceUnderlying() internal view virtual returns (uint256);
@@ -640,6 +711,36 @@ abstract contract LiquidityPool is ILiquidityPool, Authorization, Pausable, Init
         return block.timestamp;
     }
 
+    function _getNewCurrentFees(
+        WithdrawalFeeMeta memory meta,
+        uint256 minFeePercentage,
+        uint256 currentTime
+    ) internal pure returns (uint256) {
+        return
+            _getNewCurrentFees(
+                meta.timeToWait,
+                meta.lastActionTimestamp,
+                meta.feeRatio,
+                minFeePercentage,
+                currentTime
+            );
+    }
+
+    function _getNewCurrentFees(
+        uint256 timeToWait,
+        uint256 lastActionTimestamp,
+        uint256 feeRatio,
+        uint256 minFeePercentage,
+        uint256 currentTime
+    ) internal pure returns (uint256) {
+        uint256 timeElapsed = currentTime - lastActionTimestamp;
+        if (timeElapsed >= timeToWait || minFeePercentage > feeRatio) {
+            return minFeePercentage;
+        }
+        uint256 elapsedShare = timeElapsed.scaledDiv(timeToWait);
+        return feeRatio - (feeRatio - minFeePercentage).scaledMul(elapsedShare);
+    }
+
     function _checkFeeInvariants(uint256 minFee, uint256 maxFee) internal pure {
         require(maxFee >= minFee, Error.INVALID_AMOUNT);
         require(maxFee <= _MAX_WITHDRAWAL_FEE, Error.INVALID_AMOUNT);
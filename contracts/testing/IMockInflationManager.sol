@@ -5,4 +5,10 @@ import "../../interfaces/tokenomics/IInflationManager.sol";
 
 interface IMockInflationManager is IInflationManager {
     function callKillKeeperGauge(address _keeperGauge) external;
+
+    function callClearGaugeIndexes(address _keeperGauge, address _ammGauge) external;
+
+    function getKeeperGaugePoolCount(address _keeperGauge) external view returns (uint256);
+
+    function getAmmGaugeToken(address _ammGauge) external view returns (address);
 }
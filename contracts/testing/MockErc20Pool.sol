@@ -12,17 +12,17 @@ contract MockErc20Pool is Erc20Pool {
     constructor(IController _controller) Erc20Pool(_controller) {}
 
     function setMinWithdrawalFee(uint256 _newFee) external onlyGovernance returns (bool) {
-        minWithdrawalFee = _newFee;
+        _setMinWithdrawalFee(_newFee);
         return true;
     }
 
     function setMaxWithdrawalFee(uint256 _newFee) external onlyGovernance returns (bool) {
-        maxWithdrawalFee = _newFee;
+        _setMaxWithdrawalFee(_newFee);
         return true;
     }
 
     function setWithdrawalFeeDecreasePeriod(uint256 period) external onlyGovernance returns (bool) {
-        withdrawalFeeDecreasePeriod = period;
+        _setWithdrawalFeeDecreasePeriod(period);
         return true;
     }
 
@@ -31,12 +31,12 @@ contract MockErc20Pool is Erc20Pool {
     }
 
     function setMaxBackingReserveDeviationRatio(uint256 newRatio) external onlyGovernance {
-        reserveDeviation = newRatio;
+        _setReserveDeviation(newRatio);
         _rebalanceVault();
     }
 
     function setRequiredBackingReserveRatio(uint256 newRatio) external onlyGovernance {
-        requiredReserves = newRatio;
+        _setRequiredReserves(newRatio);
         _rebalanceVault();
     }
 
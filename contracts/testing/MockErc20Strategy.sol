@@ -20,6 +20,8 @@ contract MockErc20Strategy is Authorization {
 
     address public strategist;
 
+    uint256 public harvestable;
+
     modifier onlyVault() {
         require(msg.sender == _vault, Error.UNAUTHORIZED_ACCESS);
         _;
@@ -102,12 +104,19 @@ contract MockErc20Strategy is Authorization {
         return true;
     }
 
-    function harvestable() external pure returns (uint256) {
-        return 0;
+    function setHarvestable(uint256 harvestable_) external {
+        harvestable = harvestable_;
+    }
+
+    // Does not transfer anything in mock, profits need to be sent to the strategy separately
+    function harvest() external onlyVault returns (uint256) {
+        uint256 harvested = harvestable;
+        harvestable = 0;
+        return harvested;
     }
 
-    function harvest() external pure returns (uint256) {
-        return 0;
+    function vault() external view returns (address) {
+        return _vault;
     }
 
     function hasPendingFunds() external pure returns (bool) {
@@ -9,19 +9,19 @@ contract MockEthPool is EthPool {
     constructor(IController _controller) EthPool(_controller) {}
 
     function setMinWithdrawalFee(uint256 newFee) external onlyGovernance returns (bool) {
-        minWithdrawalFee = newFee;
-        _checkFeeInvariants(newFee, maxWithdrawalFee);
+        _setMinWithdrawalFee(newFee);
+        _checkFeeInvariants(newFee, _withdrawalFeeConfig.maxWithdrawalFee);
         return true;
     }
 
     function setMaxWithdrawalFee(uint256 newFee) external onlyGovernance returns (bool) {
-        maxWithdrawalFee = newFee;
-        _checkFeeInvariants(minWithdrawalFee, newFee);
+        _setMaxWithdrawalFee(newFee);
+        _checkFeeInvariants(_withdrawalFeeConfig.minWithdrawalFee, newFee);
         return true;
     }
 
     function setWithdrawalFeeDecreasePeriod(uint256 period) external onlyGovernance returns (bool) {
-        withdrawalFeeDecreasePeriod = period;
+        _setWithdrawalFeeDecreasePeriod(period);
         return true;
     }
 
@@ -30,12 +30,12 @@ contract MockEthPool is EthPool {
     }
 
     function setMaxBackingReserveDeviationRatio(uint256 newRatio) external onlyGovernance {
-        reserveDeviation = newRatio;
+        _setReserveDeviation(newRatio);
         _rebalanceVault();
     }
 
     function setRequiredBackingReserveRatio(uint256 newRatio) external onlyGovernance {
-        requiredReserves = newRatio;
+        _setRequiredReserves(newRatio);
         _rebalanceVault();
     }
 
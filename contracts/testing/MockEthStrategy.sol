@@ -20,6 +20,8 @@ contract MockEthStrategy is Authorization {
 
     address public strategist;
 
+    uint256 public harvestable;
+
     modifier onlyVault() {
         require(msg.sender == _vault, Error.UNAUTHORIZED_ACCESS);
         _;
@@ -99,11 +101,18 @@ contract MockEthStrategy is Authorization {
         return false;
     }
 
-    function harvestable() external pure returns (uint256) {
-        return 0;
+    function setHarvestable(uint256 harvestable_) external {
+        harvestable = harvestable_;
+    }
+
+    // Does not transfer anything in mock, profits need to be sent to the strategy separately
+    function harvest() external onlyVault returns (uint256) {
+        uint256 harvested = harvestable;
+        harvestable = 0;
+        return harvested;
     }
 
-    function harvest() external pure returns (uint256) {
-        return 0;
+    function vault() external view returns (address) {
+        return _vault;
     }
 }
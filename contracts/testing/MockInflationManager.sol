@@ -10,4 +10,25 @@ contract MockInflationManager is InflationManager, IMockInflationManager {
     function callKillKeeperGauge(address _keeperGauge) external override {
         IKeeperGauge(_keeperGauge).kill();
     }
+
+    /**
+     * @dev Simulates gauges set before the gauge indexes were introduced.
+     */
+    function callClearGaugeIndexes(address _keeperGauge, address _ammGauge) external override {
+        delete _keeperGaugePoolCounts[_keeperGauge];
+        delete _ammGaugeTokens[_ammGauge];
+    }
+
+    function getKeeperGaugePoolCount(address _keeperGauge)
+        external
+        view
+        override
+        returns (uint256)
+    {
+        return _keeperGaugePoolCounts[_keeperGauge];
+    }
+
+    function getAmmGaugeToken(address _ammGauge) external view override returns (address) {
+        return _ammGaugeTokens[_ammGauge];
+    }
 }
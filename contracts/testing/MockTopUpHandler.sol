@@ -42,6 +42,18 @@ contract MockTopUpHandler is ITopUpHandler, Initializable {
         address addr = address(bytes20(account));
         return userFactors.getUserFactor(addr);
     }
+
+    function getUserFactors(bytes32[] calldata accounts, bytes[] calldata)
+        external
+        view
+        override
+        returns (uint256[] memory factors)
+    {
+        factors = new uint256[](accounts.length);
+        for (uint256 i; i < accounts.length; i++) {
+            factors[i] = userFactors.getUserFactor(address(bytes20(accounts[i])));
+        }
+    }
 }
 
 contract MockUserFactors {
@@ -29,6 +29,22 @@ abstract contract MockVaultMethods is Vault {
     function withdrawFromReserve(address coin, uint256 amount) external {
         _reserve().withdraw(coin, amount);
     }
+
+    function depositManyToReserve(address[] calldata coins, uint256[] calldata amounts)
+        external
+    {
+        IVaultReserve reserve_ = _reserve();
+        for (uint256 i; i < coins.length; i++) {
+            IERC20(coins[i]).approve(address(reserve_), amounts[i]);
+        }
+        reserve_.depositMany(coins, amounts);
+    }
+
+    function withdrawManyFromReserve(address[] calldata coins, uint256[] calldata amounts)
+        external
+    {
+        _reserve().withdrawMany(coins, amounts);
+    }
 }
 
 contract MockErc20Vault is Erc20Vault, MockVaultMethods {
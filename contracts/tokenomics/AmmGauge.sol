@@ -58,15 +58,27 @@ contract AmmGauge is Authorization, IAmmGauge {
             msg.sender == beneficiary || _roleManager().hasRole(Roles.GAUGE_ZAP, msg.sender),
             Error.UNAUTHORIZED_ACCESS
         );
-        _userCheckpoint(beneficiary);
-        uint256 amount = perUserShare[beneficiary];
+        uint256 amount = _collectRewards(beneficiary);
         if (amount == 0) return 0;
-        delete perUserShare[beneficiary];
         addressProvider.getInflationManager().mintRewards(beneficiary, amount);
-        emit RewardClaimed(beneficiary, amount);
         return amount;
     }
 
+    /**
+     * @notice Calculates the token rewards a user should receive without minting them.
+     * @dev Only callable by a claim zap, which mints the rewards of several gauges at once.
+     * @param beneficiary Address to collect rewards for.
+     * @return Amount of rewards collected.
+     */
+    function collectRewards(address beneficiary) external override returns (uint256) {
+        require(
+            _roleManager().hasRole(Roles.GAUGE_ZAP, msg.sender) &&
+                addressProvider.getInflationManager().gauges(msg.sender),
+            Error.UNAUTHORIZED_ACCESS
+        );
+        return _collectRewards(beneficiary);
+    }
+
     function poolCheckpoint(uint256 updateEndTime)
         external
         override
@@ -163,6 +175,15 @@ contract AmmGauge is Authorization, IAmmGauge {
         }
     }
 
+    function _collectRewards(address beneficiary) internal returns (uint256) {
+        _userCheckpoint(beneficiary);
+        uint256 amount = perUserShare[beneficiary];
+        if (amount == 0) return 0;
+        delete perUserShare[beneficiary];
+        emit RewardClaimed(beneficiary, amount);
+        return amount;
+    }
+
     function _userCheckpoint(address user) internal virtual {
         poolCheckpoint();
         perUserShare[user] += balances[user].scaledMul(
@@ -42,6 +42,17 @@ contract InflationManager is Authorization, IInflationManager {
 
     mapping(address => bool) public override gauges;
 
+    // Inflation decay until which gauges are being checkpointed in batches
+    uint256 public override checkpointEndTime;
+    // Number of gauges of each kind checkpointed until `checkpointEndTime`
+    mapping(GaugeKind => uint256) public override checkpointCursors;
+
+    // keeperGauge -> number of pools using it
+    mapping(address => uint256) internal _keeperGaugePoolCounts;
+    // ammGauge -> AMM token
+    mapping(address => address) internal _ammGaugeTokens;
+    bool public override gaugeIndexesInitialized;
+
     event NewKeeperWeight(address indexed pool, uint256 newWeight);
     event NewLpWeight(address indexed pool, uint256 newWeight);
     event NewAmmTokenWeight(address indexed token, uint256 newWeight);
@@ -107,19 +118,51 @@ contract InflationManager is Authorization, IInflationManager {
      */
     function checkpointAllGauges(uint256 updateEndTime) external override {
         require(msg.sender == minter, Error.UNAUTHORIZED_ACCESS);
-        uint256 length = _keeperGauges.length();
-        for (uint256 i; i < length; i = i.uncheckedInc()) {
-            IKeeperGauge(_keeperGauges.valueAt(i)).poolCheckpoint(updateEndTime);
-        }
-        address[] memory stakerVaults = addressProvider.allStakerVaults();
-        for (uint256 i; i < stakerVaults.length; i = i.uncheckedInc()) {
-            IStakerVault(stakerVaults[i]).poolCheckpoint(updateEndTime);
+        // Gauges already checkpointed in batches for this decay are skipped
+        bool resume = checkpointEndTime == updateEndTime;
+        for (uint256 i; i <= uint256(GaugeKind.Amm); i = i.uncheckedInc()) {
+            GaugeKind kind = GaugeKind(i);
+            uint256 start = resume ? checkpointCursors[kind] : 0;
+            _checkpointGauges(kind, start, _gaugesCount(kind), updateEndTime);
         }
+    }
 
-        length = _ammGauges.length();
-        for (uint256 i; i < length; i = i.uncheckedInc()) {
-            IAmmGauge(_ammGauges.valueAt(i)).poolCheckpoint(updateEndTime);
+    /**
+     * @notice Checkpoints a batch of gauges until the inflation decay which is due.
+     * @dev Once the inflation decay is due, gauges need to be checkpointed until the decay
+     *      before the inflation rates are updated. This allows to do so over several
+     *      transactions, after which the update only checkpoints the remaining gauges.
+     *      Batches of a kind need to be checkpointed in order, starting from 0.
+     * @param kind Kind of the gauges to checkpoint.
+     * @param cursor Index of the first gauge to checkpoint.
+     * @param count Maximum number of gauges to checkpoint.
+     * @return Index of the next gauge to checkpoint, equal to the number of gauges once done.
+     */
+    function checkpointGauges(
+        GaugeKind kind,
+        uint256 cursor,
+        uint256 count
+    ) external override returns (uint256) {
+        uint256 updateEndTime = Minter(minter).getNextInflationDecay();
+        require(
+            updateEndTime != 0 && block.timestamp >= updateEndTime,
+            Error.INFLATION_DECAY_NOT_DUE
+        );
+        if (checkpointEndTime != updateEndTime) {
+            checkpointEndTime = updateEndTime;
+            delete checkpointCursors[GaugeKind.Keeper];
+            delete checkpointCursors[GaugeKind.Lp];
+            delete checkpointCursors[GaugeKind.Amm];
         }
+        require(cursor == checkpointCursors[kind], Error.INVALID_INDEX);
+
+        uint256 end = cursor + count;
+        uint256 length = _gaugesCount(kind);
+        if (end > length) end = length;
+        _checkpointGauges(kind, cursor, end, updateEndTime);
+        checkpointCursors[kind] = end;
+        emit GaugesCheckpointed(kind, updateEndTime, end);
+        return end;
     }
 
     /**
@@ -148,13 +191,23 @@ contract InflationManager is Authorization, IInflationManager {
         onlyRoles2(Roles.GOVERNANCE, Roles.INFLATION_ADMIN)
     {
         require(pools.length == weights.length, Error.INVALID_ARGUMENT);
+        _checkpointKeeperGauges();
         for (uint256 i; i < pools.length; i = i.uncheckedInc()) {
             require(_keeperGauges.contains(pools[i]), Error.INVALID_ARGUMENT);
-            _executeKeeperPoolWeight(pools[i], weights[i]);
+            _setKeeperPoolWeight(pools[i], weights[i]);
         }
     }
 
-    function whitelistGauge(address gauge) external override onlyRole(Roles.CONTROLLER) {
+    /**
+     * @notice Allows a gauge to mint rewards.
+     * @dev Governance can also whitelist claim zaps, which mint the rewards of other gauges.
+     * @param gauge Address of the gauge to whitelist.
+     */
+    function whitelistGauge(address gauge)
+        external
+        override
+        onlyRoles2(Roles.GOVERNANCE, Roles.CONTROLLER)
+    {
         gauges[gauge] = true;
     }
 
@@ -197,12 +250,13 @@ contract InflationManager is Authorization, IInflationManager {
         onlyRoles2(Roles.GOVERNANCE, Roles.INFLATION_ADMIN)
     {
         require(lpTokens_.length == weights_.length, "Invalid length of arguments");
+        _checkpointStakerVaults();
         for (uint256 i; i < lpTokens_.length; i = i.uncheckedInc()) {
             address stakerVault_ = addressProvider.getStakerVault(lpTokens_[i]);
             // Require both that gauge is registered and that pool is still in action
             require(IStakerVault(stakerVault_).lpGauge() != address(0), Error.ADDRESS_NOT_FOUND);
             _ensurePoolExists(lpTokens_[i]);
-            _executeLpPoolWeight(lpTokens_[i], weights_[i]);
+            _setLpPoolWeight(lpTokens_[i], weights_[i]);
         }
     }
 
@@ -232,9 +286,10 @@ contract InflationManager is Authorization, IInflationManager {
         onlyRoles2(Roles.GOVERNANCE, Roles.INFLATION_ADMIN)
     {
         require(tokens_.length == weights_.length, "Invalid length of arguments");
+        _checkpointAmmGauges();
         for (uint256 i; i < tokens_.length; i = i.uncheckedInc()) {
             require(_ammGauges.contains(tokens_[i]), "amm gauge not found");
-            _executeAmmTokenWeight(tokens_[i], weights_[i]);
+            _setAmmTokenWeight(tokens_[i], weights_[i]);
         }
     }
 
@@ -251,25 +306,26 @@ contract InflationManager is Authorization, IInflationManager {
         onlyGovernance
         returns (bool)
     {
-        uint256 length = _keeperGauges.length();
-        bool keeperGaugeExists = false;
-        for (uint256 i; i < length; i = i.uncheckedInc()) {
-            if (address(_keeperGauges.valueAt(i)) == _keeperGauge) {
-                keeperGaugeExists = true;
-                break;
-            }
-        }
+        bool keeperGaugeExists = _keeperGaugePoolCounts[_keeperGauge] > 0;
         // Check to make sure that once weight-based dist is deactivated, only one gauge can exist
-        if (!keeperGaugeExists && weightBasedKeeperDistributionDeactivated && length >= 1) {
+        if (
+            !keeperGaugeExists &&
+            weightBasedKeeperDistributionDeactivated &&
+            _keeperGauges.length() >= 1
+        ) {
             return false;
         }
         (bool exists, address keeperGauge) = _keeperGauges.tryGet(pool);
         require(!exists || keeperGauge != _keeperGauge, Error.INVALID_ARGUMENT);
 
-        if (exists && !IKeeperGauge(keeperGauge).killed()) {
-            IKeeperGauge(keeperGauge).kill();
+        if (exists) {
+            _decrementKeeperGaugePoolCount(keeperGauge);
+            if (!IKeeperGauge(keeperGauge).killed()) {
+                IKeeperGauge(keeperGauge).kill();
+            }
         }
         _keeperGauges.set(pool, _keeperGauge);
+        _keeperGaugePoolCounts[_keeperGauge]++;
         gauges[_keeperGauge] = true;
         return true;
     }
@@ -278,6 +334,30 @@ contract InflationManager is Authorization, IInflationManager {
         _removeKeeperGauge(pool);
     }
 
+    /**
+     * @notice Builds the indexes from keeper and AMM gauges to their pools and tokens.
+     * @dev The indexes are only maintained for gauges set since they were introduced, so this
+     *      needs to be called once when upgrading from a version without them, atomically
+     *      through `MeroProxyAdmin.upgradeAndCall`. The indexes are rebuilt from the gauges
+     *      set, so the result does not depend on the caller.
+     */
+    function initializeGaugeIndexes() external override {
+        require(!gaugeIndexesInitialized, Error.CONTRACT_INITIALIZED);
+        gaugeIndexesInitialized = true;
+        uint256 length = _keeperGauges.length();
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            delete _keeperGaugePoolCounts[_keeperGauges.valueAt(i)];
+        }
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            _keeperGaugePoolCounts[_keeperGauges.valueAt(i)]++;
+        }
+        length = _ammGauges.length();
+        for (uint256 i; i < length; i = i.uncheckedInc()) {
+            (address token, address ammGauge) = _ammGauges.at(i);
+            _ammGaugeTokens[ammGauge] = token;
+        }
+    }
+
     /**
      * @notice Sets the AmmGauge for a particular AMM token.
      * @param token Address of the amm token.
@@ -291,17 +371,16 @@ contract InflationManager is Authorization, IInflationManager {
         returns (bool)
     {
         require(IAmmGauge(_ammGauge).isAmmToken(token), Error.ADDRESS_NOT_WHITELISTED);
-        uint256 length = _ammGauges.length();
-        for (uint256 i; i < length; i = i.uncheckedInc()) {
-            if (address(_ammGauges.valueAt(i)) == _ammGauge) {
-                return false;
-            }
-        }
-        if (_ammGauges.contains(token)) {
-            address ammGauge = _ammGauges.get(token);
+        if (_ammGaugeTokens[_ammGauge] != address(0)) return false;
+        (bool exists, address ammGauge) = _ammGauges.tryGet(token);
+        // also covers gauges set before the indexes were initialized
+        if (exists && ammGauge == _ammGauge) return false;
+        if (exists) {
+            delete _ammGaugeTokens[ammGauge];
             IAmmGauge(ammGauge).kill();
         }
         _ammGauges.set(token, _ammGauge);
+        _ammGaugeTokens[_ammGauge] = token;
         gauges[_ammGauge] = true;
         return true;
     }
@@ -312,6 +391,9 @@ contract InflationManager is Authorization, IInflationManager {
         _executeAmmTokenWeight(token_, 0);
         IAmmGauge(ammGauge_).kill();
         _ammGauges.remove(token_);
+        delete _ammGaugeTokens[ammGauge_];
+        // The last gauge is moved to the removed index, which may have been checkpointed
+        delete checkpointCursors[GaugeKind.Amm];
         // Do not delete from the gauges map to allow claiming of remaining balances
         emit AmmGaugeDelisted(token_, ammGauge_);
         return true;
@@ -329,6 +411,10 @@ contract InflationManager is Authorization, IInflationManager {
         return _ammGauges.valuesArray();
     }
 
+    function getGaugesCount(GaugeKind kind) external view override returns (uint256) {
+        return _gaugesCount(kind);
+    }
+
     function getLpRateForStakerVault(address stakerVault) external view override returns (uint256) {
         uint256 totalLpPoolWeight_ = totalLpPoolWeight;
         address minter_ = minter;
@@ -376,33 +462,88 @@ contract InflationManager is Authorization, IInflationManager {
     }
 
     function _executeKeeperPoolWeight(address pool_, uint256 weight_) internal {
+        _checkpointKeeperGauges();
+        _setKeeperPoolWeight(pool_, weight_);
+    }
+
+    function _executeLpPoolWeight(address lpToken_, uint256 weight_) internal {
+        _checkpointStakerVaults();
+        _setLpPoolWeight(lpToken_, weight_);
+    }
+
+    function _executeAmmTokenWeight(address token_, uint256 weight_) internal {
+        _checkpointAmmGauges();
+        _setAmmTokenWeight(token_, weight_);
+    }
+
+    function _setKeeperPoolWeight(address pool_, uint256 weight_) internal {
+        totalKeeperPoolWeight = totalKeeperPoolWeight - keeperPoolWeights[pool_] + weight_;
+        keeperPoolWeights[pool_] = weight_;
+        emit NewKeeperWeight(pool_, weight_);
+    }
+
+    function _setLpPoolWeight(address lpToken_, uint256 weight_) internal {
+        totalLpPoolWeight = totalLpPoolWeight - lpPoolWeights[lpToken_] + weight_;
+        lpPoolWeights[lpToken_] = weight_;
+        emit NewLpWeight(lpToken_, weight_);
+    }
+
+    function _setAmmTokenWeight(address token_, uint256 weight_) internal {
+        totalAmmTokenWeight = totalAmmTokenWeight - ammWeights[token_] + weight_;
+        ammWeights[token_] = weight_;
+        emit NewAmmTokenWeight(token_, weight_);
+    }
+
+    /**
+     * @dev Changing a weight changes the rate of all the gauges of its kind,
+     *      so they all need to be checkpointed, but only once per batch of weights.
+     */
+    function _checkpointKeeperGauges() internal {
         uint256 length = _keeperGauges.length();
         for (uint256 i; i < length; i = i.uncheckedInc()) {
             IKeeperGauge(_keeperGauges.valueAt(i)).poolCheckpoint();
         }
-        totalKeeperPoolWeight = totalKeeperPoolWeight - keeperPoolWeights[pool_] + weight_;
-        keeperPoolWeights[pool_] = weight_;
-        emit NewKeeperWeight(pool_, weight_);
     }
 
-    function _executeLpPoolWeight(address lpToken_, uint256 weight_) internal {
+    function _checkpointStakerVaults() internal {
         address[] memory stakerVaults = addressProvider.allStakerVaults();
         for (uint256 i; i < stakerVaults.length; i = i.uncheckedInc()) {
             IStakerVault(stakerVaults[i]).poolCheckpoint();
         }
-        totalLpPoolWeight = totalLpPoolWeight - lpPoolWeights[lpToken_] + weight_;
-        lpPoolWeights[lpToken_] = weight_;
-        emit NewLpWeight(lpToken_, weight_);
     }
 
-    function _executeAmmTokenWeight(address token_, uint256 weight_) internal {
+    function _checkpointAmmGauges() internal {
         uint256 length = _ammGauges.length();
         for (uint256 i; i < length; i = i.uncheckedInc()) {
             IAmmGauge(_ammGauges.valueAt(i)).poolCheckpoint();
         }
-        totalAmmTokenWeight = totalAmmTokenWeight - ammWeights[token_] + weight_;
-        ammWeights[token_] = weight_;
-        emit NewAmmTokenWeight(token_, weight_);
+    }
+
+    /**
+     * @dev Checkpoints the gauges of `kind` with an index in [`start`, `end`)
+     *      until `updateEndTime`.
+     */
+    function _checkpointGauges(
+        GaugeKind kind,
+        uint256 start,
+        uint256 end,
+        uint256 updateEndTime
+    ) internal {
+        if (kind == GaugeKind.Keeper) {
+            for (uint256 i = start; i < end; i = i.uncheckedInc()) {
+                IKeeperGauge(_keeperGauges.valueAt(i)).poolCheckpoint(updateEndTime);
+            }
+        } else if (kind == GaugeKind.Lp) {
+            if (start >= end) return;
+            address[] memory stakerVaults = addressProvider.allStakerVaults();
+            for (uint256 i = start; i < end; i = i.uncheckedInc()) {
+                IStakerVault(stakerVaults[i]).poolCheckpoint(updateEndTime);
+            }
+        } else {
+            for (uint256 i = start; i < end; i = i.uncheckedInc()) {
+                IAmmGauge(_ammGauges.valueAt(i)).poolCheckpoint(updateEndTime);
+            }
+        }
     }
 
     function _removeKeeperGauge(address pool) internal {
@@ -410,26 +551,36 @@ contract InflationManager is Authorization, IInflationManager {
         address keeperGauge = _keeperGauges.get(pool);
 
         // Checking if the Keeper Gauge is still in use
-        address[] memory pools_ = addressProvider.allPools();
         address[] memory actions_ = addressProvider.allActions();
-        for (uint256 i; i < pools_.length; i = i.uncheckedInc()) {
-            ILiquidityPool pool_ = ILiquidityPool(pools_[i]);
-            address lpToken_ = pool_.getLpToken();
-            for (uint256 j; j < actions_.length; j = j.uncheckedInc()) {
-                IAction action_ = IAction(actions_[j]);
-                IActionFeeHandler feeHandler_ = IActionFeeHandler(action_.feeHandler());
-                address keeperGauge_ = feeHandler_.getKeeperGauge(lpToken_);
-                require(keeperGauge_ != keeperGauge, Error.GAUGE_STILL_ACTIVE);
-            }
+        for (uint256 i; i < actions_.length; i = i.uncheckedInc()) {
+            IActionFeeHandler feeHandler_ = IActionFeeHandler(IAction(actions_[i]).feeHandler());
+            require(!feeHandler_.isKeeperGaugeUsed(keeperGauge), Error.GAUGE_STILL_ACTIVE);
         }
 
         _executeKeeperPoolWeight(pool, 0);
         _keeperGauges.remove(pool);
+        _decrementKeeperGaugePoolCount(keeperGauge);
+        // The last gauge is moved to the removed index, which may have been checkpointed
+        delete checkpointCursors[GaugeKind.Keeper];
         IKeeperGauge(keeperGauge).kill();
         // Do not delete from the gauges map to allow claiming of remaining balances
         emit KeeperGaugeDelisted(pool, keeperGauge);
     }
 
+    /**
+     * @dev Gauges set before the indexes were initialized are not counted.
+     */
+    function _decrementKeeperGaugePoolCount(address keeperGauge) internal {
+        uint256 count = _keeperGaugePoolCounts[keeperGauge];
+        if (count > 0) _keeperGaugePoolCounts[keeperGauge] = count.uncheckedSub(1);
+    }
+
+    function _gaugesCount(GaugeKind kind) internal view returns (uint256) {
+        if (kind == GaugeKind.Keeper) return _keeperGauges.length();
+        if (kind == GaugeKind.Lp) return addressProvider.allStakerVaults().length;
+        return _ammGauges.length();
+    }
+
     function _ensurePoolExists(address lpToken) internal view {
         address pool = addressProvider.safeGetPoolForToken(lpToken);
         require(pool != address(0), Error.ADDRESS_NOT_FOUND);
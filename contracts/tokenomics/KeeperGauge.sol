@@ -1,6 +1,8 @@
 // SPDX-License-Identifier: GPL-3.0-or-later
 pragma solidity 0.8.10;
 
+import "@openzeppelin/contracts/utils/math/SafeCast.sol";
+
 import "../../interfaces/IController.sol";
 import "../../interfaces/tokenomics/IKeeperGauge.sol";
 
@@ -15,11 +17,27 @@ contract KeeperGauge is IKeeperGauge, Authorization {
     using AddressProviderHelpers for IAddressProvider;
     using ScaledMath for uint256;
     using UncheckedMath for uint256;
+    using SafeCast for uint256;
+
+    // Packed in a single slot, as a checkpoint can be pushed by `reportFees`
+    struct RewardCheckpoint {
+        uint128 epoch;
+        uint128 cumulativeRewards;
+    }
 
+    /**
+     * @dev Rewards of the epochs in which a keeper earned fees are accumulated in
+     * `checkpoints` once the epoch is over, so claiming does not iterate over epochs.
+     * `lastFeeEpoch` is the last epoch with fees, not yet included in `checkpoints`,
+     * and `claimedRewards` the accumulated rewards of the epochs before `nextEpochToClaim`.
+     */
     struct KeeperRecord {
         mapping(uint256 => uint256) feesInPeriod;
         uint256 nextEpochToClaim;
         bool firstEpochSet;
+        uint256 lastFeeEpoch;
+        uint256 claimedRewards;
+        RewardCheckpoint[] checkpoints;
     }
 
     mapping(address => KeeperRecord) public keeperRecords;
@@ -70,12 +88,18 @@ contract KeeperGauge is IKeeperGauge, Authorization {
         lpTokenAddress; // silencing compiler warning
         require(addressProvider.isWhiteListedFeeHandler(msg.sender), Error.ADDRESS_NOT_WHITELISTED);
         require(!killed, Error.CONTRACT_PAUSED);
-        if (!keeperRecords[beneficiary].firstEpochSet) {
-            keeperRecords[beneficiary].firstEpochSet = true;
-            keeperRecords[beneficiary].nextEpochToClaim = epoch;
+        KeeperRecord storage record = keeperRecords[beneficiary];
+        uint256 epoch_ = epoch;
+        if (!record.firstEpochSet) {
+            record.firstEpochSet = true;
+            record.nextEpochToClaim = epoch_;
+            record.lastFeeEpoch = epoch_;
+        } else if (record.lastFeeEpoch < epoch_) {
+            _checkpointKeeper(record);
+            record.lastFeeEpoch = epoch_;
         }
-        keeperRecords[beneficiary].feesInPeriod[epoch] += amount;
-        perPeriodTotalFees[epoch] += amount;
+        record.feesInPeriod[epoch_] += amount;
+        perPeriodTotalFees[epoch_] += amount;
     }
 
     /**
@@ -104,7 +128,10 @@ contract KeeperGauge is IKeeperGauge, Authorization {
     }
 
     function claimableRewards(address beneficiary) external view override returns (uint256) {
-        return _calcTotalClaimable(beneficiary, keeperRecords[beneficiary].nextEpochToClaim, epoch);
+        KeeperRecord storage record = keeperRecords[beneficiary];
+        uint256 endEpoch = epoch;
+        if (endEpoch <= record.nextEpochToClaim) return 0;
+        return _rewardsBefore(record, endEpoch) - record.claimedRewards;
     }
 
     function poolCheckpoint() public override returns (bool) {
@@ -131,18 +158,33 @@ contract KeeperGauge is IKeeperGauge, Authorization {
             endEpoch = epoch;
         }
 
-        uint256 totalClaimable = _calcTotalClaimable(
-            beneficiary,
-            keeperRecords[beneficiary].nextEpochToClaim,
-            endEpoch
-        );
-        keeperRecords[beneficiary].nextEpochToClaim = endEpoch;
+        KeeperRecord storage record = keeperRecords[beneficiary];
+        require(endEpoch > record.nextEpochToClaim, Error.ZERO_TRANSFER_NOT_ALLOWED);
+        uint256 totalClaimable = _collectRewards(record, endEpoch);
         require(totalClaimable > 0, Error.ZERO_TRANSFER_NOT_ALLOWED);
         _mintRewards(beneficiary, totalClaimable);
 
         return totalClaimable;
     }
 
+    /**
+     * @notice Calculates the rewards of a keeper up to the current epoch without minting them.
+     * @dev Only callable by a claim zap, which mints the rewards of several gauges at once.
+     * @param beneficiary Address to collect rewards for.
+     * @return Amount of rewards collected.
+     */
+    function collectRewards(address beneficiary) external override returns (uint256) {
+        require(
+            _roleManager().hasRole(Roles.GAUGE_ZAP, msg.sender) &&
+                addressProvider.getInflationManager().gauges(msg.sender),
+            Error.UNAUTHORIZED_ACCESS
+        );
+        uint256 endEpoch = epoch;
+        KeeperRecord storage record = keeperRecords[beneficiary];
+        if (endEpoch <= record.nextEpochToClaim) return 0;
+        return _collectRewards(record, endEpoch);
+    }
+
     function _poolCheckpoint(uint256 timeElapsed) internal {
         uint256 currentRate = addressProvider.getInflationManager().getKeeperRateForPool(pool);
         perPeriodTotalInflation[epoch] += currentRate * timeElapsed;
@@ -152,20 +194,81 @@ contract KeeperGauge is IKeeperGauge, Authorization {
         addressProvider.getInflationManager().mintRewards(beneficiary, amount);
     }
 
-    function _calcTotalClaimable(
-        address beneficiary,
-        uint256 startEpoch,
-        uint256 endEpoch
-    ) internal view returns (uint256) {
-        uint256 totalClaimable;
-        for (uint256 i = startEpoch; i < endEpoch; i = i.uncheckedInc()) {
-            uint256 periodTotalFees = perPeriodTotalFees[i];
-            if (periodTotalFees > 0) {
-                totalClaimable += (
-                    keeperRecords[beneficiary].feesInPeriod[i].scaledDiv(periodTotalFees)
-                ).scaledMul(perPeriodTotalInflation[i]);
+    function _collectRewards(KeeperRecord storage record, uint256 endEpoch)
+        internal
+        returns (uint256)
+    {
+        uint256 rewards = _rewardsBefore(record, endEpoch);
+        uint256 totalClaimable = rewards - record.claimedRewards;
+        record.nextEpochToClaim = endEpoch;
+        record.claimedRewards = rewards;
+        return totalClaimable;
+    }
+
+    function _checkpointKeeper(KeeperRecord storage record) internal {
+        uint256 lastFeeEpoch_ = record.lastFeeEpoch;
+        uint256 epochRewards = _epochRewards(record, lastFeeEpoch_);
+        if (epochRewards == 0) return;
+        RewardCheckpoint[] storage checkpoints_ = record.checkpoints;
+        uint256 length = checkpoints_.length;
+        uint256 cumulativeRewards = length == 0
+            ? 0
+            : checkpoints_[length.uncheckedSub(1)].cumulativeRewards;
+        checkpoints_.push(
+            RewardCheckpoint(
+                lastFeeEpoch_.toUint128(),
+                (cumulativeRewards + epochRewards).toUint128()
+            )
+        );
+    }
+
+    function _epochRewards(KeeperRecord storage record, uint256 epoch_)
+        internal
+        view
+        returns (uint256)
+    {
+        uint256 periodTotalFees = perPeriodTotalFees[epoch_];
+        if (periodTotalFees == 0) return 0;
+        return
+            record.feesInPeriod[epoch_].scaledDiv(periodTotalFees).scaledMul(
+                perPeriodTotalInflation[epoch_]
+            );
+    }
+
+    /**
+     * @dev Returns the accumulated rewards of the keeper for the epochs before `endEpoch`.
+     * The last epoch with fees is not checkpointed yet, so when `endEpoch` is after it (e.g.
+     * the current epoch) its rewards are computed separately and added to the last checkpoint.
+     * Otherwise, the checkpoints are binary searched, which is logarithmic in the number of
+     * epochs with fees. `endEpoch` must not be after the current epoch.
+     */
+    function _rewardsBefore(KeeperRecord storage record, uint256 endEpoch)
+        internal
+        view
+        returns (uint256)
+    {
+        if (!record.firstEpochSet) return 0;
+        RewardCheckpoint[] storage checkpoints_ = record.checkpoints;
+        uint256 length = checkpoints_.length;
+        uint256 lastFeeEpoch_ = record.lastFeeEpoch;
+        if (lastFeeEpoch_ < endEpoch) {
+            uint256 cumulativeRewards = length == 0
+                ? 0
+                : checkpoints_[length.uncheckedSub(1)].cumulativeRewards;
+            return cumulativeRewards + _epochRewards(record, lastFeeEpoch_);
+        }
+
+        // number of checkpoints of epochs before `endEpoch`
+        uint256 low;
+        uint256 high = length;
+        while (low < high) {
+            uint256 mid = (low + high) / 2;
+            if (checkpoints_[mid].epoch < endEpoch) {
+                low = mid.uncheckedInc();
+            } else {
+                high = mid;
             }
         }
-        return totalClaimable;
+        return low == 0 ? 0 : checkpoints_[low.uncheckedSub(1)].cumulativeRewards;
     }
 }
@@ -61,14 +61,27 @@ contract LpGauge is ILpGauge, IRewardsGauge, Authorization {
             msg.sender == beneficiary || _roleManager().hasRole(Roles.GAUGE_ZAP, msg.sender),
             Error.UNAUTHORIZED_ACCESS
         );
-        userCheckpoint(beneficiary);
-        uint256 amount = perUserShare[beneficiary];
+        uint256 amount = _collectRewards(beneficiary);
         if (amount == 0) return 0;
-        delete perUserShare[beneficiary];
         _mintRewards(beneficiary, amount);
         return amount;
     }
 
+    /**
+     * @notice Calculates the token rewards a user should receive without minting them.
+     * @dev Only callable by a claim zap, which mints the rewards of several gauges at once.
+     * @param beneficiary Address to collect rewards for.
+     * @return Amount of rewards collected.
+     */
+    function collectRewards(address beneficiary) external override returns (uint256) {
+        require(
+            _roleManager().hasRole(Roles.GAUGE_ZAP, msg.sender) &&
+                inflationManager.gauges(msg.sender),
+            Error.UNAUTHORIZED_ACCESS
+        );
+        return _collectRewards(beneficiary);
+    }
+
     /**
      * @notice Checkpoint function for the pool statistics.
      */
@@ -128,6 +141,14 @@ contract LpGauge is ILpGauge, IRewardsGauge, Authorization {
         return true;
     }
 
+    function _collectRewards(address beneficiary) internal returns (uint256) {
+        userCheckpoint(beneficiary);
+        uint256 amount = perUserShare[beneficiary];
+        if (amount == 0) return 0;
+        delete perUserShare[beneficiary];
+        return amount;
+    }
+
     function _mintRewards(address beneficiary, uint256 amount) internal {
         inflationManager.mintRewards(beneficiary, amount);
     }
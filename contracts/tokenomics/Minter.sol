@@ -188,6 +188,16 @@ contract Minter is IMinter, Authorization, ReentrancyGuard {
         return currentInflationAmountAmm;
     }
 
+    /**
+     * @notice Returns the time at which the inflation rates next decay.
+     * @dev Gauges need to be checkpointed until this time before the rates are updated.
+     * @return Time of the next inflation decay or 0 if the inflation has not started.
+     */
+    function getNextInflationDecay() external view override returns (uint256) {
+        if (lastEvent == 0) return 0;
+        return lastInflationDecay + _INFLATION_DECAY_PERIOD;
+    }
+
     function _executeInflationRateUpdate() internal {
         uint256 nextInflationDecay = lastInflationDecay + _INFLATION_DECAY_PERIOD;
         if (block.timestamp >= nextInflationDecay) {
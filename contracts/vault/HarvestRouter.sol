@@ -0,0 +1,157 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+import "../../interfaces/IAddressProvider.sol";
+import "../../interfaces/IERC20Full.sol";
+import "../../interfaces/IHarvestRouter.sol";
+import "../../interfaces/IVault.sol";
+import "../../interfaces/pool/ILiquidityPool.sol";
+import "../../interfaces/strategies/IStrategy.sol";
+
+import "../../libraries/AddressProviderHelpers.sol";
+import "../../libraries/DecimalScale.sol";
+import "../../libraries/Errors.sol";
+import "../../libraries/ScaledMath.sol";
+import "../../libraries/UncheckedMath.sol";
+
+import "../access/Authorization.sol";
+
+/**
+ * @notice Harvests several vaults in a single transaction.
+ * @dev Needs the maintenance role to call `Vault.harvest`.
+ */
+contract HarvestRouter is IHarvestRouter, Authorization {
+    using ScaledMath for uint256;
+    using UncheckedMath for uint256;
+    using DecimalScale for uint256;
+    using AddressProviderHelpers for IAddressProvider;
+
+    IAddressProvider public immutable addressProvider;
+
+    uint256 public override harvestGasEstimate;
+
+    constructor(IAddressProvider addressProvider_)
+        Authorization(addressProvider_.getRoleManager())
+    {
+        addressProvider = addressProvider_;
+        harvestGasEstimate = 500_000;
+    }
+
+    /**
+     * @notice Sets the estimated gas used to harvest a single vault.
+     * @param harvestGasEstimate_ The new gas estimate.
+     */
+    function setHarvestGasEstimate(uint256 harvestGasEstimate_) external override onlyGovernance {
+        require(harvestGasEstimate_ > 0, Error.INVALID_ARGUMENT);
+        harvestGasEstimate = harvestGasEstimate_;
+        emit HarvestGasEstimateSet(harvestGasEstimate_);
+    }
+
+    /**
+     * @notice Harvests the vaults of all the pools registered in the address provider.
+     * @param minGasMultiple Minimum value of the harvestable rewards relative to the gas cost.
+     * @return The number of vaults harvested.
+     */
+    function harvestAll(uint256 minGasMultiple)
+        external
+        override
+        onlyRole(Roles.MAINTENANCE)
+        returns (uint256)
+    {
+        address[] memory pools_ = addressProvider.allPools();
+        address[] memory vaults_ = new address[](pools_.length);
+        for (uint256 i; i < pools_.length; i = i.uncheckedInc()) {
+            vaults_[i] = address(ILiquidityPool(pools_[i]).vault());
+        }
+        return _harvestMany(vaults_, minGasMultiple);
+    }
+
+    /**
+     * @notice Harvests `vaults`, skipping the ones not worth harvesting.
+     * @dev A vault is skipped if it has no strategy or if the value in ETH of the harvestable
+     *      rewards of its strategy is below `minGasMultiple` times the estimated gas cost
+     *      of harvesting it. All vaults with a strategy are harvested if `minGasMultiple` is 0.
+     * @param vaults Vaults to harvest.
+     * @param minGasMultiple Minimum value of the harvestable rewards relative to the gas cost.
+     * @return The number of vaults harvested.
+     */
+    function harvestMany(address[] calldata vaults, uint256 minGasMultiple)
+        external
+        override
+        onlyRole(Roles.MAINTENANCE)
+        returns (uint256)
+    {
+        return _harvestMany(vaults, minGasMultiple);
+    }
+
+    /**
+     * @notice Returns whether `vault` would be harvested by `harvestMany` with `minGasMultiple`.
+     * @dev Uses the gas price of the current transaction, which is usually 0 in calls.
+     */
+    function shouldHarvest(address vault, uint256 minGasMultiple)
+        external
+        view
+        override
+        returns (bool)
+    {
+        return _shouldHarvest(IVault(vault), minGasMultiple);
+    }
+
+    function _harvestMany(address[] memory vaults_, uint256 minGasMultiple_)
+        internal
+        returns (uint256)
+    {
+        bool[] memory toHarvest_ = new bool[](vaults_.length);
+        uint256 count_;
+        for (uint256 i; i < vaults_.length; i = i.uncheckedInc()) {
+            if (_shouldHarvest(IVault(vaults_[i]), minGasMultiple_)) {
+                toHarvest_[i] = true;
+                count_ = count_.uncheckedInc();
+            }
+        }
+        if (count_ == 0) return 0;
+
+        address[] memory harvested_ = new address[](count_);
+        uint256[] memory profits_ = new uint256[](count_);
+        uint256[] memory losses_ = new uint256[](count_);
+        uint256 j;
+        for (uint256 i; i < vaults_.length; i = i.uncheckedInc()) {
+            if (!toHarvest_[i]) continue;
+            IVault vault_ = IVault(vaults_[i]);
+            uint256 totalUnderlyingBefore_ = vault_.getTotalUnderlying();
+            vault_.harvest();
+            uint256 totalUnderlyingAfter_ = vault_.getTotalUnderlying();
+            harvested_[j] = address(vault_);
+            if (totalUnderlyingAfter_ > totalUnderlyingBefore_) {
+                profits_[j] = totalUnderlyingAfter_.uncheckedSub(totalUnderlyingBefore_);
+            } else {
+                losses_[j] = totalUnderlyingBefore_.uncheckedSub(totalUnderlyingAfter_);
+            }
+            j = j.uncheckedInc();
+        }
+        emit VaultsHarvested(harvested_, profits_, losses_);
+        return count_;
+    }
+
+    function _shouldHarvest(IVault vault_, uint256 minGasMultiple_) internal view returns (bool) {
+        if (address(vault_) == address(0)) return false;
+        IStrategy strategy_ = vault_.strategy();
+        if (address(strategy_) == address(0)) return false;
+
+        uint256 minValue_ = (tx.gasprice * harvestGasEstimate).scaledMul(minGasMultiple_);
+        if (minValue_ == 0) return true;
+        uint256 harvestable_ = strategy_.harvestable();
+        if (harvestable_ == 0) return false;
+        return _getValueInEth(vault_.getUnderlying(), harvestable_) >= minValue_;
+    }
+
+    function _getValueInEth(address underlying_, uint256 amount_)
+        internal
+        view
+        returns (uint256)
+    {
+        if (underlying_ == address(0)) return amount_;
+        uint256 price_ = addressProvider.getOracleProvider().getPriceETH(underlying_);
+        return amount_.scaleFrom(IERC20Full(underlying_).decimals()).scaledMul(price_);
+    }
+}
@@ -478,7 +478,7 @@ abstract contract Vault is IVault, Authorization, VaultStorageV1, Initializable
         IVaultReserve reserve_ = _reserve();
         uint256 underlyingReserves = reserve_.getBalance(address(this), getUnderlying());
         if (currentDebt > underlyingReserves) {
-            _emergencyStop(underlyingReserves);
+            _emergencyStop(reserve_, underlyingReserves);
         } else if (reserve_.canWithdraw(address(this))) {
             reserve_.withdraw(getUnderlying(), currentDebt);
             currentDebt = 0;
@@ -528,27 +528,25 @@ abstract contract Vault is IVault, Authorization, VaultStorageV1, Initializable
         uint256 reserveShare = totalFeeAmount.scaledMul(reserveFee);
         uint256 govShare = totalFeeAmount - strategistShare - reserveShare;
 
-        _depositToReserve(reserveShare);
+        if (reserveShare > 0) {
+            _depositToReserve(reserveShare);
+        }
         if (govShare > 0) {
             _depositToRewardHandler(govShare);
         }
         return strategistShare;
     }
 
-    function _emergencyStop(uint256 underlyingReserves) internal {
+    function _emergencyStop(IVaultReserve reserve_, uint256 underlyingReserves) internal {
         // debt limit exceeded: withdraw funds from strategy
         uint256 withdrawn = strategy.withdrawAll();
 
         uint256 actualDebt = _computeNewAllocated(currentAllocated, withdrawn);
 
-        if (_reserve().canWithdraw(address(this))) {
-            // check if debt can be covered with reserve funds
-            if (underlyingReserves >= actualDebt) {
-                _reserve().withdraw(getUnderlying(), actualDebt);
-            } else if (underlyingReserves > 0) {
-                // debt can not be covered with reserves
-                _reserve().withdraw(getUnderlying(), underlyingReserves);
-            }
+        // check if debt can be covered with reserve funds, else withdraw what is available
+        uint256 fromReserve = underlyingReserves >= actualDebt ? actualDebt : underlyingReserves;
+        if (fromReserve > 0 && reserve_.canWithdraw(address(this))) {
+            reserve_.withdraw(getUnderlying(), fromReserve);
         }
 
         // too much money lost, stop the strategy
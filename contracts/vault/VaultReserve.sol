@@ -6,6 +6,7 @@ import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 
 import "../../interfaces/IVaultReserve.sol";
 import "../../libraries/Errors.sol";
+import "../../libraries/UncheckedMath.sol";
 
 import "../access/Authorization.sol";
 import "../vault/Vault.sol";
@@ -16,6 +17,7 @@ import "../vault/Vault.sol";
  */
 contract VaultReserve is IVaultReserve, Authorization {
     using SafeERC20 for IERC20;
+    using UncheckedMath for uint256;
 
     uint256 internal constant _INITIAL_WITHDRAWAL_DELAY = 3 days;
 
@@ -42,14 +44,31 @@ contract VaultReserve is IVaultReserve, Authorization {
     function deposit(address token, uint256 amount) external payable override onlyVault {
         if (token == address(0)) {
             require(msg.value == amount, Error.INVALID_AMOUNT);
-            _balances[msg.sender][token] += msg.value;
         } else {
             require(msg.value == 0, Error.INVALID_VALUE);
-            IERC20(token).safeTransferFrom(msg.sender, address(this), amount);
-            _balances[msg.sender][token] += amount;
         }
+        _deposit(token, amount);
+    }
 
-        emit Deposit(msg.sender, token, amount);
+    /**
+     * @notice Deposit funds of several tokens into vault reserve.
+     * @notice Only callable by a whitelisted vault.
+     * @param tokens Tokens to deposit.
+     * @param amounts Amounts to deposit, `amounts[i]` being the amount of `tokens[i]`.
+     */
+    function depositMany(address[] calldata tokens, uint256[] calldata amounts)
+        external
+        payable
+        override
+        onlyVault
+    {
+        require(tokens.length == amounts.length, Error.INVALID_ARGUMENT);
+        uint256 ethAmount;
+        for (uint256 i; i < tokens.length; i = i.uncheckedInc()) {
+            if (tokens[i] == address(0)) ethAmount += amounts[i];
+            _deposit(tokens[i], amounts[i]);
+        }
+        require(msg.value == ethAmount, Error.INVALID_VALUE);
     }
 
     /**
@@ -59,21 +78,45 @@ contract VaultReserve is IVaultReserve, Authorization {
      * @param amount Amount to withdraw.
      */
     function withdraw(address token, uint256 amount) external override onlyVault {
-        require(canWithdraw(msg.sender), Error.RESERVE_ACCESS_EXCEEDED);
-        uint256 accountBalance = _balances[msg.sender][token];
-        require(accountBalance >= amount, Error.INSUFFICIENT_BALANCE);
+        _startWithdrawal();
+        _withdraw(token, amount);
+    }
 
-        _balances[msg.sender][token] -= amount;
-        _lastWithdrawal[msg.sender] = block.timestamp;
+    /**
+     * @notice Withdraw funds of several tokens from vault reserve.
+     * @notice Only callable by a whitelisted vault.
+     * @dev The withdrawal delay is checked and reset once for all tokens.
+     * @param tokens Tokens to withdraw.
+     * @param amounts Amounts to withdraw, `amounts[i]` being the amount of `tokens[i]`.
+     */
+    function withdrawMany(address[] calldata tokens, uint256[] calldata amounts)
+        external
+        override
+        onlyVault
+    {
+        require(tokens.length == amounts.length, Error.INVALID_ARGUMENT);
+        _startWithdrawal();
+        for (uint256 i; i < tokens.length; i = i.uncheckedInc()) {
+            _withdraw(tokens[i], amounts[i]);
+        }
+    }
 
-        if (token == address(0)) {
-            // solhint-disable-next-line avoid-low-level-calls
-            (bool success, ) = payable(msg.sender).call{value: amount}("");
-            require(success, Error.FAILED_TRANSFER);
-        } else {
-            IERC20(token).safeTransfer(msg.sender, amount);
+    /**
+     * @notice Check token balances of a specific vault.
+     * @param vault Vault to check balances of.
+     * @param tokens Tokens to check balances in.
+     * @return balances Token balances of vault.
+     */
+    function getBalances(address vault, address[] calldata tokens)
+        external
+        view
+        override
+        returns (uint256[] memory balances)
+    {
+        balances = new uint256[](tokens.length);
+        for (uint256 i; i < tokens.length; i = i.uncheckedInc()) {
+            balances[i] = _balances[vault][tokens[i]];
         }
-        emit Withdraw(msg.sender, token, amount);
     }
 
     /**
@@ -92,4 +135,32 @@ contract VaultReserve is IVaultReserve, Authorization {
     function canWithdraw(address vault) public view override returns (bool) {
         return block.timestamp >= _lastWithdrawal[vault] + minWithdrawalDelay;
     }
+
+    function _deposit(address token, uint256 amount) internal {
+        if (token != address(0)) {
+            IERC20(token).safeTransferFrom(msg.sender, address(this), amount);
+        }
+        _balances[msg.sender][token] += amount;
+        emit Deposit(msg.sender, token, amount);
+    }
+
+    function _startWithdrawal() internal {
+        require(canWithdraw(msg.sender), Error.RESERVE_ACCESS_EXCEEDED);
+        _lastWithdrawal[msg.sender] = block.timestamp;
+    }
+
+    function _withdraw(address token, uint256 amount) internal {
+        uint256 accountBalance = _balances[msg.sender][token];
+        require(accountBalance >= amount, Error.INSUFFICIENT_BALANCE);
+        _balances[msg.sender][token] = accountBalance - amount;
+
+        if (token == address(0)) {
+            // solhint-disable-next-line avoid-low-level-calls
+            (bool success, ) = payable(msg.sender).call{value: amount}("");
+            require(success, Error.FAILED_TRANSFER);
+        } else {
+            IERC20(token).safeTransfer(msg.sender, amount);
+        }
+        emit Withdraw(msg.sender, token, amount);
+    }
 }
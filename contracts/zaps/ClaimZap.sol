@@ -0,0 +1,91 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+import "../../interfaces/zaps/IClaimZap.sol";
+import "../../interfaces/IAddressProvider.sol";
+import "../../interfaces/IMeroLocker.sol";
+import "../../interfaces/tokenomics/IInflationManager.sol";
+import "../../interfaces/tokenomics/IRewardsGauge.sol";
+
+import "../../libraries/AddressProviderHelpers.sol";
+import "../../libraries/Errors.sol";
+import "../../libraries/UncheckedMath.sol";
+
+/**
+ * This is a Zap contract to claim the rewards of several LP, AMM and keeper gauges at once.
+ * The rewards of all the gauges are minted in a single call to the `Minter`.
+ * @dev The zap needs the gauge zap role and to be whitelisted as a gauge in the `InflationManager`.
+ */
+contract ClaimZap is IClaimZap {
+    using UncheckedMath for uint256;
+    using SafeERC20 for IERC20;
+    using AddressProviderHelpers for IAddressProvider;
+
+    IAddressProvider public immutable addressProvider;
+    IMeroLocker public immutable meroLocker;
+
+    constructor(
+        IAddressProvider addressProvider_,
+        IMeroLocker meroLocker_,
+        IERC20 meroToken_
+    ) {
+        addressProvider = addressProvider_;
+        meroLocker = meroLocker_;
+        if (address(meroLocker_) != address(0)) {
+            meroToken_.safeApprove(address(meroLocker_), type(uint256).max);
+        }
+    }
+
+    /**
+     * @notice Claims the rewards of the sender from all the given gauges.
+     * @param gauges Gauges to claim the rewards from.
+     * @param lock Whether to lock the claimed MERO in the `MeroLocker` for the sender.
+     * @return The amount of MERO claimed.
+     */
+    function claimRewards(address[] calldata gauges, bool lock)
+        external
+        override
+        returns (uint256)
+    {
+        if (!lock) return _claimRewards(msg.sender, gauges, msg.sender);
+        require(address(meroLocker) != address(0), Error.ADDRESS_NOT_FOUND);
+        uint256 amount = _claimRewards(msg.sender, gauges, address(this));
+        if (amount > 0) meroLocker.lockFor(msg.sender, amount);
+        emit RewardsClaimed(msg.sender, amount, true);
+        return amount;
+    }
+
+    /**
+     * @notice Claims the rewards of a beneficiary from all the given gauges.
+     * @dev Like claiming from the gauges, this does not require the beneficiary's approval.
+     * @param beneficiary Address to claim the rewards for.
+     * @param gauges Gauges to claim the rewards from.
+     * @return The amount of MERO claimed.
+     */
+    function claimRewardsFor(address beneficiary, address[] calldata gauges)
+        external
+        override
+        returns (uint256)
+    {
+        return _claimRewards(beneficiary, gauges, beneficiary);
+    }
+
+    function _claimRewards(
+        address beneficiary,
+        address[] calldata gauges,
+        address recipient
+    ) internal returns (uint256) {
+        IInflationManager inflationManager = addressProvider.getInflationManager();
+        uint256 amount;
+        for (uint256 i; i < gauges.length; i = i.uncheckedInc()) {
+            // The zap mints whatever gauges report, so they must be known to the inflation manager
+            require(inflationManager.gauges(gauges[i]), Error.GAUGE_DOES_NOT_EXIST);
+            amount += IRewardsGauge(gauges[i]).collectRewards(beneficiary);
+        }
+        if (amount > 0) inflationManager.mintRewards(recipient, amount);
+        if (recipient == beneficiary) emit RewardsClaimed(beneficiary, amount, false);
+        return amount;
+    }
+}
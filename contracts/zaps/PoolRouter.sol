@@ -0,0 +1,187 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+import "../../interfaces/zaps/IPoolRouter.sol";
+import "../../interfaces/IAddressProvider.sol";
+import "../../interfaces/IStakerVault.sol";
+import "../../interfaces/pool/ILiquidityPool.sol";
+import "../../libraries/Errors.sol";
+import "../../libraries/UncheckedMath.sol";
+
+/**
+ * This is a Zap contract to deposit into or redeem from several pools in a single transaction.
+ * Deposited tokens are pulled once per underlying and the LP tokens are minted to the sender.
+ */
+contract PoolRouter is IPoolRouter {
+    using UncheckedMath for uint256;
+    using SafeERC20 for IERC20;
+
+    IAddressProvider public immutable addressProvider;
+
+    constructor(IAddressProvider addressProvider_) {
+        addressProvider = addressProvider_;
+    }
+
+    receive() external payable {}
+
+    /**
+     * @notice Deposits into each pool of `operations` for the sender.
+     * @dev ETH deposits are paid with `msg.value`, which must match their total amount.
+     * Minted LP tokens are staked for the sender if `stake` is set.
+     * @param operations The deposits to make.
+     * @return mintedLpTokens_ The amount of LP tokens minted for each deposit.
+     */
+    function deposit(PoolOperation[] calldata operations)
+        external
+        payable
+        override
+        returns (uint256[] memory mintedLpTokens_)
+    {
+        uint256 length_ = operations.length;
+        address[] memory pools_ = new address[](length_);
+        address[] memory underlyings_ = new address[](length_);
+        uint256[] memory depositAmounts_ = new uint256[](length_);
+        mintedLpTokens_ = new uint256[](length_);
+
+        uint256 ethAmount_;
+        for (uint256 i; i < length_; i = i.uncheckedInc()) {
+            pools_[i] = operations[i].pool;
+            require(addressProvider.isPool(pools_[i]), Error.ADDRESS_NOT_FOUND);
+            underlyings_[i] = ILiquidityPool(pools_[i]).getUnderlying();
+            depositAmounts_[i] = operations[i].amount;
+            if (underlyings_[i] == address(0)) ethAmount_ += depositAmounts_[i];
+        }
+        require(ethAmount_ == msg.value, Error.INVALID_VALUE);
+        _pullTokens(underlyings_, depositAmounts_);
+
+        for (uint256 i; i < length_; i = i.uncheckedInc()) {
+            mintedLpTokens_[i] = _deposit(
+                ILiquidityPool(pools_[i]),
+                underlyings_[i],
+                operations[i]
+            );
+        }
+        emit Deposited(msg.sender, pools_, depositAmounts_, mintedLpTokens_);
+    }
+
+    /**
+     * @notice Redeems from each pool of `operations` for the sender.
+     * @dev The LP tokens must be approved to this contract and, if `stake` is set, the staked
+     * tokens must also be approved in the staker vault. Staked tokens are only unstaked for the
+     * part of `amount` not covered by the LP token balance of the sender.
+     * @param operations The redemptions to make.
+     * @return redeemAmounts_ The amount of underlying received for each redemption.
+     */
+    function redeem(PoolOperation[] calldata operations)
+        external
+        override
+        returns (uint256[] memory redeemAmounts_)
+    {
+        uint256 length_ = operations.length;
+        address[] memory pools_ = new address[](length_);
+        uint256[] memory redeemedLpTokens_ = new uint256[](length_);
+        redeemAmounts_ = new uint256[](length_);
+
+        for (uint256 i; i < length_; i = i.uncheckedInc()) {
+            pools_[i] = operations[i].pool;
+            require(addressProvider.isPool(pools_[i]), Error.ADDRESS_NOT_FOUND);
+            redeemedLpTokens_[i] = operations[i].amount;
+            redeemAmounts_[i] = _redeem(ILiquidityPool(pools_[i]), operations[i]);
+        }
+        emit Redeemed(msg.sender, pools_, redeemedLpTokens_, redeemAmounts_);
+    }
+
+    function _deposit(
+        ILiquidityPool pool_,
+        address underlying_,
+        PoolOperation calldata operation_
+    ) internal returns (uint256) {
+        uint256 ethValue_;
+        if (underlying_ == address(0)) {
+            ethValue_ = operation_.amount;
+        } else {
+            _approve(underlying_, address(pool_));
+        }
+
+        if (!operation_.stake) {
+            return
+                pool_.depositFor{value: ethValue_}(
+                    msg.sender,
+                    operation_.amount,
+                    operation_.minOut
+                );
+        }
+
+        uint256 minted_ = pool_.depositFor{value: ethValue_}(
+            address(this),
+            operation_.amount,
+            operation_.minOut
+        );
+        IStakerVault staker_ = pool_.staker();
+        _approve(pool_.getLpToken(), address(staker_));
+        staker_.stakeFor(msg.sender, minted_);
+        return minted_;
+    }
+
+    function _redeem(ILiquidityPool pool_, PoolOperation calldata operation_)
+        internal
+        returns (uint256)
+    {
+        IERC20 lpToken_ = IERC20(pool_.getLpToken());
+        uint256 amount_ = operation_.amount;
+        uint256 lpBalance_ = lpToken_.balanceOf(msg.sender);
+        if (operation_.stake && lpBalance_ < amount_) {
+            // Unstaked to the sender so that the transfer below moves their withdrawal fees
+            pool_.staker().unstakeFor(msg.sender, msg.sender, amount_ - lpBalance_);
+        }
+        lpToken_.safeTransferFrom(msg.sender, address(this), amount_);
+
+        uint256 redeemed_ = pool_.redeem(amount_, operation_.minOut);
+        address underlying_ = pool_.getUnderlying();
+        if (underlying_ == address(0)) {
+            // solhint-disable-next-line avoid-low-level-calls
+            (bool success_, ) = payable(msg.sender).call{value: redeemed_}("");
+            require(success_, Error.FAILED_TRANSFER);
+        } else {
+            IERC20(underlying_).safeTransfer(msg.sender, redeemed_);
+        }
+        return redeemed_;
+    }
+
+    /**
+     * @dev Transfers the total amount of each ERC20 underlying from the sender in one transfer.
+     */
+    function _pullTokens(address[] memory underlyings_, uint256[] memory amounts_) internal {
+        uint256 length_ = underlyings_.length;
+        for (uint256 i; i < length_; i = i.uncheckedInc()) {
+            address underlying_ = underlyings_[i];
+            if (underlying_ == address(0)) continue;
+
+            bool pulled_;
+            uint256 total_ = amounts_[i];
+            for (uint256 j; j < i; j = j.uncheckedInc()) {
+                if (underlyings_[j] == underlying_) {
+                    pulled_ = true;
+                    break;
+                }
+            }
+            if (pulled_) continue;
+            for (uint256 j = i.uncheckedInc(); j < length_; j = j.uncheckedInc()) {
+                if (underlyings_[j] == underlying_) total_ += amounts_[j];
+            }
+            IERC20(underlying_).safeTransferFrom(msg.sender, address(this), total_);
+        }
+    }
+
+    /**
+     * @dev Approves infinite spending for the given spender.
+     * @param token The token to approve for.
+     * @param spender The spender to approve.
+     */
+    function _approve(address token, address spender) internal {
+        if (IERC20(token).allowance(address(this), spender) > 0) return;
+        IERC20(token).safeApprove(spender, type(uint256).max);
+    }
+}
@@ -0,0 +1,23 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+interface IHarvestRouter {
+    /**
+     * @dev `profits` and `losses` are the change of the total underlying of each harvested vault
+     */
+    event VaultsHarvested(address[] vaults, uint256[] profits, uint256[] losses);
+
+    event HarvestGasEstimateSet(uint256 harvestGasEstimate);
+
+    function harvestMany(address[] calldata vaults, uint256 minGasMultiple)
+        external
+        returns (uint256);
+
+    function harvestAll(uint256 minGasMultiple) external returns (uint256);
+
+    function setHarvestGasEstimate(uint256 harvestGasEstimate) external;
+
+    function shouldHarvest(address vault, uint256 minGasMultiple) external view returns (bool);
+
+    function harvestGasEstimate() external view returns (uint256);
+}
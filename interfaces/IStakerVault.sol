@@ -43,6 +43,8 @@ interface IStakerVault {
 
     function poolCheckpoint(uint256 updateEndTime) external returns (bool);
 
+    function syncStakedByActions() external returns (uint256);
+
     function allowance(address owner, address spender) external view returns (uint256);
 
     function getToken() external view returns (address);
@@ -74,4 +74,6 @@ interface IVault {
     function getUnderlying() external view returns (address);
 
     function strategy() external view returns (IStrategy);
+
+    function targetAllocation() external view returns (uint256);
 }
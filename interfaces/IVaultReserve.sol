@@ -8,9 +8,18 @@ interface IVaultReserve {
 
     function deposit(address token, uint256 amount) external payable;
 
+    function depositMany(address[] calldata tokens, uint256[] calldata amounts) external payable;
+
     function withdraw(address token, uint256 amount) external;
 
+    function withdrawMany(address[] calldata tokens, uint256[] calldata amounts) external;
+
     function getBalance(address vault, address token) external view returns (uint256);
 
+    function getBalances(address vault, address[] calldata tokens)
+        external
+        view
+        returns (uint256[] memory);
+
     function canWithdraw(address vault) external view returns (bool);
 }
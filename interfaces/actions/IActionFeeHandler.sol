@@ -22,4 +22,6 @@ interface IActionFeeHandler {
     function updateTreasuryFee(uint256 newTreasuryFee) external;
 
     function getKeeperGauge(address lpToken) external view returns (address);
+
+    function isKeeperGaugeUsed(address keeperGauge) external view returns (bool);
 }
@@ -60,6 +60,21 @@ interface ITopUpAction is IAction {
         uint256 topupAmount
     );
 
+    event TopUpFeesDeferred(
+        address indexed payer,
+        bytes32 indexed account,
+        bytes32 indexed protocol,
+        address depositToken,
+        uint256 feeAmount
+    );
+
+    event TopUpFailed(
+        address indexed payer,
+        bytes32 indexed account,
+        bytes32 indexed protocol,
+        bytes reason
+    );
+
     function register(
         bytes32 account,
         bytes32 protocol,
@@ -82,6 +97,12 @@ interface ITopUpAction is IAction {
         uint256 maxWeiForGas
     ) external;
 
+    function executeBatch(
+        RecordKey[] calldata keys,
+        address beneficiary,
+        uint256 maxWeiForGas
+    ) external returns (bool[] memory executed);
+
     function resetPosition(
         bytes32 account,
         bytes32 protocol,
@@ -30,4 +30,16 @@ interface ITopUpHandler {
      * @param account account for which to get the factor
      */
     function getUserFactor(bytes32 account, bytes memory extra) external view returns (uint256);
+
+    /**
+     * @notice Returns the factor of each of the given accounts, see `getUserFactor`
+     * @dev Implementations should load data shared between accounts (e.g. prices)
+     * only once per call
+     * @param accounts accounts for which to get the factor
+     * @param extra arbitrary data for each account, in the same order as `accounts`
+     */
+    function getUserFactors(bytes32[] calldata accounts, bytes[] calldata extra)
+        external
+        view
+        returns (uint256[] memory);
 }
@@ -0,0 +1,37 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+interface IProtocolLens {
+    struct PoolState {
+        address pool;
+        address underlying;
+        address lpToken;
+        uint256 lpTotalSupply;
+        uint256 totalUnderlying;
+        uint256 exchangeRate;
+        bool isShutdown;
+        address vault;
+        uint256 vaultTotalUnderlying;
+        uint256 targetAllocation;
+        address strategy;
+        uint256 strategyBalance;
+        uint256 harvestable;
+        address stakerVault;
+        uint256 totalStaked;
+        uint256 stakedByActions;
+        uint256 lpRate;
+        uint256 keeperRate;
+        uint256 minWithdrawalFee;
+        uint256 maxWithdrawalFee;
+        uint256 withdrawalFeeDecreasePeriod;
+    }
+
+    function getPoolStates(uint256 cursor, uint256 howMany)
+        external
+        view
+        returns (PoolState[] memory poolStates, uint256 nextCursor);
+
+    function getAllPoolStates() external view returns (PoolState[] memory);
+
+    function getPoolState(address pool) external view returns (PoolState memory);
+}
@@ -95,6 +95,12 @@ interface ILiquidityPool {
 
     function getWithdrawalFee(address account, uint256 amount) external view returns (uint256);
 
+    function minWithdrawalFee() external view returns (uint256);
+
+    function maxWithdrawalFee() external view returns (uint256);
+
+    function withdrawalFeeDecreasePeriod() external view returns (uint256);
+
     function exchangeRate() external view returns (uint256);
 
     function totalUnderlying() external view returns (uint256);
@@ -2,10 +2,17 @@
 pragma solidity 0.8.10;
 
 interface IInflationManager {
+    enum GaugeKind {
+        Keeper,
+        Lp,
+        Amm
+    }
+
     event KeeperGaugeListed(address indexed pool, address indexed keeperGauge);
     event AmmGaugeListed(address indexed token, address indexed ammGauge);
     event KeeperGaugeDelisted(address indexed pool, address indexed keeperGauge);
     event AmmGaugeDelisted(address indexed token, address indexed ammGauge);
+    event GaugesCheckpointed(GaugeKind indexed kind, uint256 updateEndTime, uint256 nextCursor);
 
     /** Pool functions */
 
@@ -27,14 +34,30 @@ interface IInflationManager {
 
     function checkpointAllGauges(uint256 updateEndTime) external;
 
+    function checkpointGauges(
+        GaugeKind kind,
+        uint256 cursor,
+        uint256 count
+    ) external returns (uint256);
+
     function mintRewards(address beneficiary, uint256 amount) external;
 
     function checkPointInflation() external;
 
     function removeKeeperGauge(address pool) external;
 
+    function initializeGaugeIndexes() external;
+
     function getAllAmmGauges() external view returns (address[] memory);
 
+    function getGaugesCount(GaugeKind kind) external view returns (uint256);
+
+    function checkpointEndTime() external view returns (uint256);
+
+    function gaugeIndexesInitialized() external view returns (bool);
+
+    function checkpointCursors(GaugeKind kind) external view returns (uint256);
+
     function getLpRateForStakerVault(address stakerVault) external view returns (uint256);
 
     function getKeeperRateForPool(address pool) external view returns (uint256);
@@ -17,4 +17,6 @@ interface IMinter {
     function getKeeperInflationRate() external view returns (uint256);
 
     function getAmmInflationRate() external view returns (uint256);
+
+    function getNextInflationDecay() external view returns (uint256);
 }
@@ -3,4 +3,6 @@ pragma solidity 0.8.10;
 
 interface IRewardsGauge {
     function claimRewards(address beneficiary) external returns (uint256);
+
+    function collectRewards(address beneficiary) external returns (uint256);
 }
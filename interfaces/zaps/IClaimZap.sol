@@ -0,0 +1,12 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+interface IClaimZap {
+    event RewardsClaimed(address indexed beneficiary, uint256 amount, bool locked);
+
+    function claimRewards(address[] calldata gauges, bool lock) external returns (uint256);
+
+    function claimRewardsFor(address beneficiary, address[] calldata gauges)
+        external
+        returns (uint256);
+}
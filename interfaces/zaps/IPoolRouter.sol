@@ -0,0 +1,38 @@
+// SPDX-License-Identifier: GPL-3.0-or-later
+pragma solidity 0.8.10;
+
+interface IPoolRouter {
+    /**
+     * @param pool Liquidity pool to deposit into or redeem from.
+     * @param amount Underlying to deposit, or LP tokens to redeem.
+     * @param minOut Minimum LP tokens minted, or underlying redeemed.
+     * @param stake Whether to stake the minted LP tokens, or to unstake the redeemed ones.
+     */
+    struct PoolOperation {
+        address pool;
+        uint256 amount;
+        uint256 minOut;
+        bool stake;
+    }
+
+    event Deposited(
+        address indexed account,
+        address[] pools,
+        uint256[] depositAmounts,
+        uint256[] mintedLpTokens
+    );
+
+    event Redeemed(
+        address indexed account,
+        address[] pools,
+        uint256[] redeemedLpTokens,
+        uint256[] redeemAmounts
+    );
+
+    function deposit(PoolOperation[] calldata operations)
+        external
+        payable
+        returns (uint256[] memory);
+
+    function redeem(PoolOperation[] calldata operations) external returns (uint256[] memory);
+}
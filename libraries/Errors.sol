@@ -117,4 +117,5 @@ library Error {
     string internal constant ROUND_NOT_COMPLETE = "Round not complete";
     string internal constant NOT_ENOUGH_MERO_STAKED = "Not enough MERO tokens staked";
     string internal constant RESERVE_ACCESS_EXCEEDED = "Reserve access exceeded";
+    string internal constant INFLATION_DECAY_NOT_DUE = "inflation decay not due yet";
 }
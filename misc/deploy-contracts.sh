@@ -76,6 +76,8 @@ brownie run --network $NETWORK_ID scripts/deploy_vault_reserve.py
 brownie run --network $NETWORK_ID scripts/deploy_oracle_provider.py
 brownie run --network $NETWORK_ID scripts/deploy_swapper_router.py
 brownie run --network $NETWORK_ID scripts/deploy_apy_helper.py
+brownie run --network $NETWORK_ID scripts/deploy_protocol_lens.py
+brownie run --network $NETWORK_ID scripts/deploy_harvest_router.py
 
 brownie run --network $NETWORK_ID scripts/deploy_pool_factory.py
 
@@ -98,6 +100,7 @@ POOL_NAME="meroeth" brownie run --network $NETWORK_ID scripts/deploy_pool.py
 POOL_NAME="merousdc" brownie run --network $NETWORK_ID scripts/deploy_pool.py
 POOL_NAME="merousdt" brownie run --network $NETWORK_ID scripts/deploy_pool.py
 brownie run --network $NETWORK_ID scripts/deploy_pool_migration_zap.py
+brownie run --network $NETWORK_ID scripts/deploy_pool_router.py
 
 
 brownie run --network $NETWORK_ID scripts/deploy_gas_bank.py
@@ -0,0 +1,43 @@
+"""Backfills the exchange rate history of every pool registered in the address provider.
+
+Histories are appended to `EXCHANGE_RATES_DIR` (one file per pool) from
+`FROM_BLOCK`, or from the last stored block when rerun. `EXCHANGE_RATES_SOURCE`
+is either `events` (deposit events, default) or `archive` (`exchangeRate()`
+calls every `BLOCK_STEP` blocks, requires an archive node).
+"""
+
+import os
+
+from brownie import AddressProvider, interface, web3  # type: ignore
+
+from support.exchange_rates import (
+    ExchangeRateStore,
+    backfill_from_archive,
+    backfill_from_events,
+    rolling_apys,
+)
+from support.utils import abort, with_deployed
+
+EXCHANGE_RATES_DIR = os.environ.get("EXCHANGE_RATES_DIR", "exchange-rates")
+EXCHANGE_RATES_SOURCE = os.environ.get("EXCHANGE_RATES_SOURCE", "events")
+FROM_BLOCK = int(os.environ.get("FROM_BLOCK", "0"))
+BLOCK_STEP = int(os.environ.get("BLOCK_STEP", "7200"))
+
+
+@with_deployed(AddressProvider)
+def main(address_provider):
+    if EXCHANGE_RATES_SOURCE not in ("events", "archive"):
+        abort("EXCHANGE_RATES_SOURCE should be `events` or `archive`")
+    to_block = web3.eth.block_number
+    for pool_address in address_provider.allPools():
+        pool = interface.ILiquidityPool(pool_address)
+        store = ExchangeRateStore.for_pool(EXCHANGE_RATES_DIR, pool_address)
+        if EXCHANGE_RATES_SOURCE == "archive":
+            added = backfill_from_archive(store, pool, web3, FROM_BLOCK, to_block, BLOCK_STEP)
+        else:
+            added = backfill_from_events(store, pool, web3, FROM_BLOCK, to_block)
+        records = store.load()
+        print(f"{pool_address}: {added} new records, {len(records)} total")
+        if len(records) > 0:
+            apys = rolling_apys(records)
+            print("  APY " + ", ".join(f"{name} {apy[-1]:.2%}" for name, apy in apys.items()))
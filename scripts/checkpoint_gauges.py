@@ -0,0 +1,81 @@
+"""Checkpoints all the gauges in batches once the inflation decay is due.
+
+When the inflation rates decay, every keeper gauge, LP gauge and AMM gauge has
+to be checkpointed until the decay before the new rates apply. Rather than
+doing so in the single transaction updating the rates, this checkpoints the
+gauges with `InflationManager.checkpointGauges`, resuming from the cursors
+stored on-chain. The size of each batch is derived from gas estimates so that
+transactions stay under `CHECKPOINT_GAS_LIMIT`.
+
+The update of the rates itself (`Minter.executeInflationRateUpdate`) then only
+has to checkpoint the gauges added since, and is sent when `CHECKPOINT_UPDATE=1`.
+"""
+
+import os
+import time
+from functools import partial
+
+from brownie import InflationManager, Minter, chain  # type: ignore
+
+from support.utils import abort, get_deployer, make_tx_params, with_deployed, with_gas_usage
+
+CHECKPOINT_GAS_LIMIT = int(os.environ.get("CHECKPOINT_GAS_LIMIT", "5000000"))
+CHECKPOINT_UPDATE = os.environ.get("CHECKPOINT_UPDATE", "0") == "1"
+
+GAUGE_KINDS = {"keeper": 0, "lp": 1, "amm": 2}
+
+
+def batch_size(estimate_gas, remaining, gas_limit):
+    """Returns the largest number of gauges, at most `remaining`, that can be
+    checkpointed with less than `gas_limit` gas.
+
+    `estimate_gas(count)` estimates the gas used to checkpoint `count` gauges.
+    The size is first extrapolated from the cost of one and two gauges, then
+    halved until its estimate fits. At least one gauge is always returned.
+    """
+    if remaining <= 1:
+        return remaining
+    one = estimate_gas(1)
+    per_gauge = max(estimate_gas(2) - one, 1)
+    count = min(remaining, max(1, 1 + (gas_limit - one) // per_gauge))
+    while count > 1 and estimate_gas(count) > gas_limit:
+        count //= 2
+    return count
+
+
+def _estimate_gas(inflation_manager, sender, kind, cursor, count):
+    return inflation_manager.checkpointGauges.estimate_gas(kind, cursor, count, {"from": sender})
+
+
+def _start_cursor(inflation_manager, next_decay, kind):
+    if inflation_manager.checkpointEndTime() != next_decay:
+        return 0
+    return inflation_manager.checkpointCursors(kind)
+
+
+@with_gas_usage
+@with_deployed(Minter)
+@with_deployed(InflationManager)
+def main(inflation_manager, minter):
+    next_decay = minter.getNextInflationDecay()
+    if next_decay == 0:
+        abort("inflation has not started")
+    if chain.time() < next_decay:
+        remaining = next_decay - chain.time()
+        abort(f"inflation decay not due until {time.ctime(next_decay)} ({remaining}s)")
+
+    deployer = get_deployer()
+    tx_params = {"from": deployer, **make_tx_params()}
+    for name, kind in GAUGE_KINDS.items():
+        cursor = _start_cursor(inflation_manager, next_decay, kind)
+        total = inflation_manager.getGaugesCount(kind)
+        while cursor < total:
+            estimate_gas = partial(_estimate_gas, inflation_manager, deployer, kind, cursor)
+            count = batch_size(estimate_gas, total - cursor, CHECKPOINT_GAS_LIMIT)
+            tx = inflation_manager.checkpointGauges(kind, cursor, count, tx_params)
+            cursor = inflation_manager.checkpointCursors(kind)
+            print(f"{name} gauges: {cursor}/{total} checkpointed ({tx.gas_used} gas)")
+
+    if CHECKPOINT_UPDATE:
+        tx = minter.executeInflationRateUpdate(tx_params)
+        print(f"inflation rates updated ({tx.gas_used} gas)")
@@ -0,0 +1,41 @@
+"""Deploys the `ClaimZap` and allows it to claim and mint gauge rewards.
+
+The zap locks claimed MERO in the locker registered in the address provider,
+if any. The deployer needs the governance role.
+"""
+
+from brownie import (  # type: ignore
+    ZERO_ADDRESS,
+    AddressProvider,
+    ClaimZap,
+    InflationManager,
+    MeroToken,
+    RoleManager,
+)
+
+from support.constants import AddressProviderKeys
+from support.utils import (
+    as_singleton,
+    get_deployer,
+    make_tx_params,
+    with_deployed,
+    with_gas_usage,
+)
+
+
+@with_gas_usage
+@as_singleton(ClaimZap)
+@with_deployed(MeroToken)
+@with_deployed(InflationManager)
+@with_deployed(AddressProvider)
+@with_deployed(RoleManager)
+def main(role_manager, address_provider, inflation_manager, mero_token):
+    deployer = get_deployer()
+    mero_locker = address_provider.getAddress(AddressProviderKeys.MERO_LOCKER.value, False)
+    if mero_locker == ZERO_ADDRESS:
+        print("no MERO locker registered, claimed rewards cannot be locked")
+    zap = deployer.deploy(ClaimZap, address_provider, mero_locker, mero_token, **make_tx_params())
+    tx_params = {"from": deployer, **make_tx_params()}
+    role_manager.addGaugeZap(zap, tx_params)
+    inflation_manager.whitelistGauge(zap, tx_params)
+    return zap
@@ -0,0 +1,23 @@
+from brownie import HarvestRouter, AddressProvider, RoleManager
+
+from support.constants import Roles  # type: ignore
+from support.utils import (
+    get_deployer,
+    as_singleton,
+    make_tx_params,
+    with_deployed,
+    with_gas_usage,
+)
+
+
+@with_gas_usage
+@as_singleton(HarvestRouter)
+@with_deployed(RoleManager)
+@with_deployed(AddressProvider)
+def main(address_provider, role_manager):
+    deployer = get_deployer()
+    harvest_router = deployer.deploy(HarvestRouter, address_provider, **make_tx_params())
+    role_manager.grantRole(
+        Roles.MAINTENANCE.value, harvest_router, {"from": deployer, **make_tx_params()}
+    )
+    return harvest_router
@@ -0,0 +1,54 @@
+"""Replaces the keeper gauge of a pool with a newly deployed `KeeperGauge`.
+
+Keeper gauges are not upgradeable, so gauges deployed before rewards were
+checkpointed per keeper are migrated by rotating them: the new gauge is
+registered in the `InflationManager`, which kills the previous one, and the
+fee handler reports fees to the new gauge from then on. Rewards accrued in the
+previous gauge can still be claimed from it after it has been killed.
+"""
+
+import os
+
+from brownie import (  # type: ignore
+    ZERO_ADDRESS,
+    AddressProvider,
+    InflationManager,
+    KeeperGauge,
+    TopUpAction,
+    interface,
+)
+
+from support.utils import abort, get_deployer, make_tx_params, with_deployed, with_gas_usage
+
+LP_TOKEN = os.environ.get("LP_TOKEN")
+
+
+def _find_pool(address_provider, symbol):
+    for pool in address_provider.allPools():
+        lp_token = interface.ILiquidityPool(pool).getLpToken()
+        if interface.IERC20Full(lp_token).symbol() == symbol:
+            return pool, lp_token
+    abort(f"pool with LP token {symbol} not found")
+
+
+@with_gas_usage
+@with_deployed(AddressProvider)
+@with_deployed(InflationManager)
+@with_deployed(TopUpAction)
+def main(top_up_action, inflation_manager, address_provider):
+    if not LP_TOKEN:
+        abort("LP_TOKEN env variable should be set")
+    deployer = get_deployer()
+    pool, lp_token = _find_pool(interface.IAddressProvider(address_provider), LP_TOKEN)
+    previous_gauge = inflation_manager.getKeeperGaugeForPool(pool)
+
+    tx_params = {"from": deployer, **make_tx_params()}
+    keeper_gauge = deployer.deploy(KeeperGauge, address_provider, pool, **make_tx_params())  # type: ignore
+    inflation_manager.setKeeperGauge(pool, keeper_gauge, tx_params)
+    fee_handler = interface.IActionFeeHandler(interface.IAction(top_up_action).feeHandler())
+    if fee_handler.getKeeperGauge(lp_token) == ZERO_ADDRESS:
+        fee_handler.setInitialKeeperGaugeForToken(lp_token, keeper_gauge, tx_params)
+    else:
+        fee_handler.updateKeeperGauge(lp_token, keeper_gauge, tx_params)
+    print(f"keeper gauge of {pool} migrated from {previous_gauge} to {keeper_gauge}")
+    return keeper_gauge
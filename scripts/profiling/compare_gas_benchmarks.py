@@ -0,0 +1,32 @@
+"""Compares gas benchmark results written by `brownie test tests/benchmarks --gas-benchmark`
+with a baseline and fails if any benchmark regressed.
+"""
+
+import os
+import sys
+
+from support.gas_benchmark import (
+    DEFAULT_TOLERANCE,
+    compare_results,
+    format_comparison,
+    load_results,
+)
+
+GAS_RESULTS = os.environ.get("GAS_RESULTS", "reports/gas_benchmarks.json")
+GAS_BASELINE = os.environ.get("GAS_BASELINE", "scripts/profiling/gas_baseline.json")
+GAS_TOLERANCE = float(os.environ.get("GAS_TOLERANCE", DEFAULT_TOLERANCE))
+
+
+def main():
+    results = load_results(GAS_RESULTS)
+    baseline = load_results(GAS_BASELINE)
+    print(format_comparison(results, baseline))
+
+    regressions = compare_results(results, baseline, GAS_TOLERANCE)
+    for regression in regressions:
+        print(
+            f"gas regression: {regression.id} {regression.baseline} -> "
+            f"{regression.current} ({regression.change:+.2%})"
+        )
+    if regressions:
+        sys.exit(1)
@@ -0,0 +1,122 @@
+"""Compares the RPC cost of finding executable top-ups by walking
+`usersWithPositions`/`getUserPositions`/`getPosition` with the cost of
+scanning from the local position index, for a growing number of positions.
+
+Requires the dev deployment used by `scripts/register_position.py`.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from decimal import Decimal as D
+
+from brownie import AddressProvider, TopUpAction, TopUpKeeperHelper, accounts, web3  # type: ignore
+
+from scripts.register_position import register_position
+from support.keeper import IndexedScanner, PositionIndexer, PositionStore
+from support.utils import with_deployed
+
+POSITION_COUNTS = [10, 50, 100, 200]
+PAGE_SIZE = 100
+# below the factor reported by the mock handler so that no position is executable
+# and the scan cost only depends on the number of positions
+THRESHOLD = D("1.2")
+
+
+class RequestCounter:
+    def __init__(self, provider):
+        self.provider = provider
+        self.counts: Counter = Counter()
+        self._make_request = provider.make_request
+
+    def __enter__(self):
+        def make_request(method, params):
+            self.counts[method] += 1
+            return self._make_request(method, params)
+
+        self.counts.clear()
+        self.provider.make_request = make_request
+        return self
+
+    def __exit__(self, *_):
+        self.provider.make_request = self._make_request
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+
+def legacy_scan(top_up_action, keeper_helper):
+    keys = []
+    cursor = 0
+    while True:
+        users, cursor = top_up_action.usersWithPositions(cursor, PAGE_SIZE)
+        for user in users:
+            for account, protocol in top_up_action.getUserPositions(user):
+                top_up_action.getPosition(user, account, protocol)
+                keys.append((user, account, protocol))
+        if cursor == 0:
+            break
+    for i in range(0, len(keys), PAGE_SIZE):
+        keeper_helper.batchCanExecute(keys[i : i + PAGE_SIZE])
+
+
+@with_deployed(TopUpKeeperHelper)
+@with_deployed(AddressProvider)
+@with_deployed(TopUpAction)
+def main(top_up_action, address_provider, keeper_helper):
+    indexer = PositionIndexer(web3, top_up_action, PositionStore())
+    scanner = IndexedScanner(
+        indexer, keeper_helper, top_up_action, chunk_size=PAGE_SIZE
+    )
+    counter = RequestCounter(web3.provider)
+
+    registered = 0
+    rows = []
+    for target in POSITION_COUNTS:
+        while registered < target:
+            register_position(
+                top_up_action,
+                address_provider,
+                accounts[0],
+                f"{registered:024x}",
+                THRESHOLD,
+            )
+            registered += 1
+
+        # initial catch-up is paid once, not on every scan
+        indexer.sync()
+
+        with counter:
+            started_at = time.monotonic()
+            legacy_scan(top_up_action, keeper_helper)
+            legacy_time = time.monotonic() - started_at
+        legacy_calls = counter.total
+
+        with counter:
+            started_at = time.monotonic()
+            asyncio.run(scanner.scan())
+            indexed_time = time.monotonic() - started_at
+        indexed_calls = counter.total
+        indexed_health_calls = counter.counts["eth_call"]
+
+        rows.append(
+            (
+                target,
+                legacy_calls,
+                legacy_time,
+                indexed_calls,
+                indexed_calls - indexed_health_calls,
+                indexed_time,
+            )
+        )
+
+    print(
+        f"{'positions':>10} {'legacy rpc':>11} {'legacy s':>9} "
+        f"{'index rpc':>10} {'index rpc (excl. health)':>25} {'index s':>8}"
+    )
+    for target, legacy_calls, legacy_time, calls, non_health, indexed_time in rows:
+        print(
+            f"{target:>10} {legacy_calls:>11} {legacy_time:>9.2f} "
+            f"{calls:>10} {non_health:>25} {indexed_time:>8.2f}"
+        )
@@ -0,0 +1,64 @@
+"""Compares the gas used to top up positions one transaction at a time with
+the gas used to top them up with a single `executeBatch` transaction,
+for a growing number of positions.
+
+Requires the dev deployment used by `scripts/register_position.py`.
+"""
+
+from brownie import AddressProvider, TopUpAction, accounts, chain  # type: ignore
+
+from scripts.register_position import register_position
+from support.utils import encode_account, scale, with_deployed
+
+POSITION_COUNTS = [1, 2, 5, 10, 20]
+
+
+def _register_positions(top_up_action, address_provider, payer, count):
+    keys = []
+    for i in range(count):
+        extra_data = f"{i:024x}"
+        tx = register_position(top_up_action, address_provider, payer, extra_data)
+        protocol = tx.events["Register"]["protocol"]
+        keys.append((payer.address, encode_account(payer, extra_data), protocol))
+    chain.sleep(1)
+    chain.mine()
+    return keys
+
+
+@with_deployed(AddressProvider)
+@with_deployed(TopUpAction)
+def main(top_up_action, address_provider):
+    keeper = accounts[0]
+    tx_params = {"from": keeper, "priority_fee": scale(1, 9)}
+
+    rows = []
+    for count in POSITION_COUNTS:
+        chain.snapshot()
+        keys = _register_positions(top_up_action, address_provider, keeper, count)
+
+        single_gas = 0
+        for payer, account, protocol in keys:
+            tx = top_up_action.execute(payer, account, keeper, protocol, 0, tx_params)
+            single_gas += tx.gas_used
+
+        chain.revert()
+        keys = _register_positions(top_up_action, address_provider, keeper, count)
+        tx = top_up_action.executeBatch(keys, keeper, 0, tx_params)
+        assert all(tx.return_value), "some positions could not be executed"
+        batch_gas = tx.gas_used
+        chain.revert()
+
+        rows.append((count, single_gas, batch_gas))
+
+    print(
+        f"{'positions':>10} {'single gas':>12} {'batch gas':>12} "
+        f"{'single/pos':>11} {'batch/pos':>11} {'saved/pos':>10}"
+    )
+    for count, single_gas, batch_gas in rows:
+        single_per_position = single_gas // count
+        batch_per_position = batch_gas // count
+        print(
+            f"{count:>10} {single_gas:>12} {batch_gas:>12} "
+            f"{single_per_position:>11} {batch_per_position:>11} "
+            f"{single_per_position - batch_per_position:>10}"
+        )
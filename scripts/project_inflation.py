@@ -0,0 +1,85 @@
+"""Projects the MERO emissions of each gauge over the next years.
+
+Weights are read from `INFLATION_FILE` (`config/inflation/initial_inflation.json`
+by default). `WHAT_IF` changes some of them to compare a proposal with the
+current weights, e.g. `WHAT_IF=lp.meroDAI=0.5,keeper.meroUSDT=0`.
+
+The Minter parameters are the ones of `deploy_minter` unless a `Minter` is
+deployed on the network, in which case its parameters are used and its current
+rates are checked against the model.
+"""
+
+import os
+
+from brownie import Minter  # type: ignore
+
+from support.models.inflation import (
+    BLOCK_TIME,
+    DAY,
+    INFLATION_CONFIG,
+    INFLATION_DECAY_PERIOD,
+    KINDS,
+    MinterParams,
+    chain_rates,
+    find_period,
+    load_weights,
+    project,
+)
+from support.utils import abort
+
+INFLATION_FILE = os.environ.get("INFLATION_FILE", str(INFLATION_CONFIG))
+YEARS = int(os.environ.get("YEARS", "4"))
+STEP = os.environ.get("STEP", "day")
+WHAT_IF = os.environ.get("WHAT_IF")
+
+STEPS = {"day": DAY, "block": BLOCK_TIME}
+
+
+def _apply_what_if(weights, what_if):
+    for change in what_if.split(","):
+        key, _, weight = change.partition("=")
+        kind, _, name = key.partition(".")
+        if kind not in KINDS or not name or not weight:
+            abort(f"invalid WHAT_IF change {change}, expected kind.name=weight")
+        weights = weights.update(kind, **{name: float(weight)})
+    return weights
+
+
+def _minter_params():
+    if len(Minter) == 0:
+        return MinterParams()
+    minter = Minter[0]
+    params = MinterParams.from_minter(minter)
+    rates = chain_rates(minter)
+    period = find_period(params, rates)
+    if period is None:
+        abort(f"on-chain rates {rates} do not match the model")
+    print(f"on-chain rates match decay period {period}")
+    return params
+
+
+def _print_yearly(projection, steps_per_year):
+    for kind in KINDS:
+        for name, emissions in projection.gauges[kind].items():
+            yearly = [
+                emissions[i : i + steps_per_year].sum()
+                for i in range(0, len(emissions), steps_per_year)
+            ]
+            print(f"  {kind} {name}: " + ", ".join(f"{amount:,.0f}" for amount in yearly))
+
+
+def main():
+    if STEP not in STEPS:
+        abort(f"STEP should be one of {', '.join(STEPS)}")
+    params = _minter_params()
+    weights = load_weights(INFLATION_FILE)
+    duration = YEARS * INFLATION_DECAY_PERIOD
+    steps_per_year = INFLATION_DECAY_PERIOD // STEPS[STEP]
+
+    projection = project(params, weights, duration, step=STEPS[STEP])
+    print(f"MERO emitted per year over {YEARS} years:")
+    _print_yearly(projection, steps_per_year)
+    if WHAT_IF:
+        what_if = project(params, _apply_what_if(weights, WHAT_IF), duration, step=STEPS[STEP])
+        print(f"with {WHAT_IF}:")
+        _print_yearly(what_if, steps_per_year)
@@ -9,7 +9,6 @@ from support.utils import encode_account, scale, with_deployed
 from brownie import LpToken, TopUpAction, DummyERC20, Erc20Pool, AddressProvider  # type: ignore
 from brownie import accounts
 
-
 TOTAL_DEPOSIT = 5_000
 SINGLE_TOP_UP = 1_000
 TOTAL_TOP_UP = 3_000
@@ -17,10 +16,9 @@ THRESHOLD = D("1.5")
 PROTOCOL = "Aave"
 
 
-@with_deployed(AddressProvider)
-@with_deployed(TopUpAction)
-def main(top_up_action, address_provider):
-    account = accounts[0]
+def register_position(
+    top_up_action, address_provider, account, extra_data=None, threshold=THRESHOLD
+):
     pool = Erc20Pool.at(address_provider.allPools()[0])
     underlying = DummyERC20.at(pool.getUnderlying())
     lp_token = LpToken.at(pool.lpToken())
@@ -44,12 +42,12 @@ def main(top_up_action, address_provider):
     protocol = [v for v in protocols if v.rstrip(b"\x00").decode() == PROTOCOL][0]
 
     lp_token.approve(top_up_action, total_top_up, args)
-    tx = top_up_action.register(
-        encode_account(account),
+    return top_up_action.register(
+        encode_account(account, extra_data),
         protocol,
         total_top_up,
         TopUpRecord(
-            threshold=scale(THRESHOLD, 18),
+            threshold=scale(threshold, 18),
             priorityFee=scale(1, 9),
             maxFee=max_fee,
             actionToken=underlying,
@@ -59,4 +57,10 @@ def main(top_up_action, address_provider):
         ),
         {**args, "value": eth_deposit},
     )
+
+
+@with_deployed(AddressProvider)
+@with_deployed(TopUpAction)
+def main(top_up_action, address_provider):
+    tx = register_position(top_up_action, address_provider, accounts[0])
     print("topup transaction,", tx, tx.status)
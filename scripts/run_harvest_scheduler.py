@@ -0,0 +1,61 @@
+"""Polls the deployed Convex strategies and reports when harvesting their vault is profitable.
+Set `HARVEST_EXECUTE=1` to also harvest them; the deployer needs the maintenance role.
+"""
+
+import os
+
+from brownie import AddressProvider, MeroEthCvx, MeroTriHopCvx, interface, web3  # type: ignore
+
+from support.constants import AddressProviderKeys
+from support.harvest_scheduler import (
+    HarvestConfig,
+    HarvestScheduler,
+    deployed_strategies,
+    make_target,
+    oracle_pricer,
+)
+from support.utils import get_chain_id, get_deployer, with_deployed
+
+HARVEST_EXECUTE = os.environ.get("HARVEST_EXECUTE", "0") == "1"
+HARVEST_APY = float(os.environ.get("HARVEST_APY", "0.05"))
+HARVEST_MIN_PROFIT_MULTIPLE = float(os.environ.get("HARVEST_MIN_PROFIT_MULTIPLE", "1"))
+HARVEST_POLL_INTERVAL = float(os.environ.get("HARVEST_POLL_INTERVAL", "60"))
+HARVEST_MAX_POLLS = os.environ.get("HARVEST_MAX_POLLS")
+
+STRATEGY_CONTAINERS = {"MeroTriHopCvx": MeroTriHopCvx, "MeroEthCvx": MeroEthCvx}
+
+
+@with_deployed(AddressProvider)
+def main(address_provider):
+    targets = [
+        make_target(name, STRATEGY_CONTAINERS[name].at(address))
+        for name, address in deployed_strategies(get_chain_id())
+    ]
+    oracle = interface.IOracleProvider(
+        address_provider.getAddress(AddressProviderKeys.ORACLE_PROVIDER.value)
+    )
+    scheduler = HarvestScheduler(
+        targets,
+        get_deployer(),
+        web3,
+        oracle_pricer(oracle),
+        HarvestConfig(
+            apy=HARVEST_APY,
+            min_profit_multiple=HARVEST_MIN_PROFIT_MULTIPLE,
+            poll_interval=HARVEST_POLL_INTERVAL,
+            execute=HARVEST_EXECUTE,
+        ),
+    )
+    max_polls = int(HARVEST_MAX_POLLS) if HARVEST_MAX_POLLS else None
+    for estimates, results in scheduler.run(max_polls):
+        for estimate in estimates:
+            print(
+                f"{estimate.target.name} {estimate.target.strategy}: "
+                f"harvestable {estimate.value / 1e18:.4f} ETH, "
+                f"gas cost {estimate.gas_cost / 1e18:.4f} ETH, "
+                f"next harvest {estimate.next_harvest or 'unknown'}"
+                + (" -> harvest" if estimate.should_harvest else "")
+            )
+        for result in results:
+            status = "harvested" if result.success else f"failed: {result.error}"
+            print(f"  {result.target.name} {result.target.vault}: {status}")
@@ -0,0 +1,51 @@
+"""Runs the top-up keeper against the deployed TopUpAction
+Use `scripts/register_position.py` to create a position in dev environment
+"""
+
+import asyncio
+import os
+
+from brownie import TopUpAction, TopUpKeeperHelper, web3  # type: ignore
+
+from support.keeper import (
+    EngineConfig,
+    ExecutorConfig,
+    ScannerConfig,
+    TopUpKeeper,
+    TopupExecutor,
+    TopupScanner,
+)
+from support.utils import get_deployer, with_deployed
+
+KEEPER_CONCURRENCY = int(os.environ.get("KEEPER_CONCURRENCY", "8"))
+KEEPER_MAX_IN_FLIGHT = int(os.environ.get("KEEPER_MAX_IN_FLIGHT", "4"))
+KEEPER_MAX_BLOCKS = os.environ.get("KEEPER_MAX_BLOCKS")
+
+
+async def _run(keeper: TopUpKeeper, max_blocks):
+    async for report in keeper.run(max_blocks):
+        executed = sum(1 for result in report.results if result.success)
+        print(
+            f"block {report.block_number}: {len(report.topups)} executable, "
+            f"{executed} executed, scan took {report.scan_duration:.2f}s"
+        )
+        for result in report.results:
+            if result.error is not None:
+                print(f"  failed to execute {result.key}: {result.error}")
+
+
+@with_deployed(TopUpKeeperHelper)
+@with_deployed(TopUpAction)
+def main(top_up_action, keeper_helper):
+    keeper_account = get_deployer()
+    scanner = TopupScanner(
+        keeper_helper, top_up_action, ScannerConfig(concurrency=KEEPER_CONCURRENCY)
+    )
+    executor = TopupExecutor(
+        top_up_action,
+        keeper_account,
+        config=ExecutorConfig(max_in_flight=KEEPER_MAX_IN_FLIGHT),
+    )
+    keeper = TopUpKeeper(scanner, executor, web3, EngineConfig())
+    max_blocks = int(KEEPER_MAX_BLOCKS) if KEEPER_MAX_BLOCKS else None
+    asyncio.run(_run(keeper, max_blocks))
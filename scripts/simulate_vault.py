@@ -0,0 +1,73 @@
+"""Replays deposits and redemptions of a pool on the vault model and reports
+the strategy interactions and reserve shortfalls for a range of bounds.
+
+The vault parameters are read from `config/pools/{POOL_NAME}/pooldata.json`.
+The trace is read from `VAULT_TRACE` (CSV with `action`, `amount` and
+`timestamp` columns, amounts in tokens) or, when it is not set, from the
+`Deposit`, `DepositFor` and `Redeem` events of the pool at `POOL_ADDRESS`
+since `FROM_BLOCK`.
+"""
+
+import os
+
+from brownie import interface, web3  # type: ignore
+
+from support.models.vault import (
+    SCALE,
+    PoolParams,
+    load_trace_csv,
+    load_vault_params,
+    sweep,
+    trace_from_events,
+)
+from support.utils import abort, get_chain_id, scale
+
+POOL_NAME = os.environ.get("POOL_NAME")
+POOL_ADDRESS = os.environ.get("POOL_ADDRESS")
+VAULT_TRACE = os.environ.get("VAULT_TRACE")
+FROM_BLOCK = int(os.environ.get("FROM_BLOCK", "0"))
+DECIMALS = int(os.environ.get("DECIMALS", "18"))
+BOUNDS = os.environ.get("BOUNDS", "0.01,0.025,0.05,0.1")
+REQUIRED_RESERVES = os.environ.get("REQUIRED_RESERVES", "0")
+RESERVE_DEVIATION = os.environ.get("RESERVE_DEVIATION", "0")
+
+POOL_EVENTS = ("Deposit", "DepositFor", "Redeem")
+
+
+def _load_pool_events(pool_address, from_block):
+    pool = interface.ILiquidityPool(pool_address)
+    events = []
+    for event_type in POOL_EVENTS:
+        events.extend(pool.events.get_sequence(from_block, event_type=event_type))
+    timestamps = {}
+    for event in events:
+        if event["blockNumber"] not in timestamps:
+            block = web3.eth.get_block(event["blockNumber"])
+            timestamps[event["blockNumber"]] = block["timestamp"]
+    return [
+        {**event, "timestamp": timestamps[event["blockNumber"]]}  # type: ignore
+        for event in events
+    ]
+
+
+def main():
+    if not POOL_NAME:
+        abort("POOL_NAME env variable should be set")
+    if VAULT_TRACE:
+        trace = load_trace_csv(VAULT_TRACE, DECIMALS)
+    elif POOL_ADDRESS:
+        trace = trace_from_events(_load_pool_events(POOL_ADDRESS, FROM_BLOCK))
+    else:
+        abort("VAULT_TRACE or POOL_ADDRESS env variable should be set")
+
+    vault_params = load_vault_params(POOL_NAME, get_chain_id())  # type: ignore
+    pool_params = PoolParams(int(scale(REQUIRED_RESERVES)), int(scale(RESERVE_DEVIATION)))
+    bounds = [int(scale(bound)) for bound in BOUNDS.split(",")]
+    print(f"replaying {len(trace)} operations on {POOL_NAME}")
+    for overrides, report in sweep(trace, vault_params, pool_params, bound=bounds):
+        print(
+            f"bound {overrides['bound'] / SCALE:.4f}: "
+            f"{report.strategy_interactions} strategy interactions, "
+            f"{len(report.shortfalls)} shortfalls "
+            f"({report.shortfall_amount / 10**DECIMALS:.4f} tokens)"
+        )
@@ -0,0 +1,166 @@
+"""Stores the history of the LP token exchange rates of pools and computes their APYs.
+
+Each pool has an append-only file of fixed size records `(block, timestamp, rate)`
+in a directory, with `rate` the exchange rate as a float (1.0 for 1e18). Files
+are read as NumPy memory maps, so charts can be rendered without loading the
+history in memory or querying the chain again.
+
+The history can be backfilled in two ways:
+
+* with archive calls to `exchangeRate()` every `step` blocks;
+* from `Deposit` and `DepositFor` events, whose deposited over minted amounts
+  is the exchange rate at that block up to rounding. `Redeem` events are not
+  used as their amounts are net of withdrawal fees.
+
+Rolling APYs are computed on the whole history at once by interpolating the
+rate one window earlier.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+SCALE = 10**18
+SECONDS_PER_YEAR = 365 * 86400
+WINDOWS = {"1d": 86400, "7d": 7 * 86400, "30d": 30 * 86400}
+DEPOSIT_EVENTS = ("Deposit", "DepositFor")
+
+RECORD_DTYPE = np.dtype([("block", "<u8"), ("timestamp", "<u8"), ("rate", "<f8")])
+
+
+class ExchangeRateStore:
+    """Append-only history of the exchange rates of a pool.
+
+    Records are kept sorted by block: records older than or at the last stored
+    block are ignored when appending, so backfills can safely be rerun.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    @classmethod
+    def for_pool(cls, directory, pool: str) -> "ExchangeRateStore":
+        return cls(Path(directory) / f"{str(pool).lower()}.bin")
+
+    def __len__(self) -> int:
+        if not self.path.exists():
+            return 0
+        return os.path.getsize(self.path) // RECORD_DTYPE.itemsize
+
+    @property
+    def last_block(self) -> Optional[int]:
+        size = len(self)
+        if size == 0:
+            return None
+        return int(self.load()[size - 1]["block"])
+
+    def load(self) -> np.ndarray:
+        """Returns the records as a read-only memory map (or an empty array)."""
+        if len(self) == 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", shape=(len(self),))
+
+    def append(self, blocks: Sequence[int], timestamps: Sequence[int], rates: Sequence) -> int:
+        """Appends records with increasing blocks and returns how many were written.
+
+        `rates` are the raw exchange rates scaled by 1e18.
+        """
+        records = np.empty(len(blocks), dtype=RECORD_DTYPE)
+        records["block"] = blocks
+        records["timestamp"] = timestamps
+        records["rate"] = np.asarray([int(rate) for rate in rates], dtype=object) / SCALE
+        order = np.argsort(records["block"], kind="stable")
+        records = records[order]
+        # keep a single record per block and only blocks after the last stored one
+        if len(records) > 0:
+            keep = np.ones(len(records), dtype=bool)
+            keep[1:] = records["block"][1:] != records["block"][:-1]
+            last_block = self.last_block
+            if last_block is not None:
+                keep &= records["block"] > last_block
+            records = records[keep]
+        if len(records) == 0:
+            return 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(records.tobytes())
+        return len(records)
+
+
+def rolling_apy(timestamps, rates, window: int) -> np.ndarray:
+    """Returns the APY over the `window` seconds preceding each record.
+
+    The rate at the start of the window is linearly interpolated between records.
+    The APY is `nan` for records less than `window` seconds after the first one.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    rates = np.asarray(rates, dtype=np.float64)
+    start = timestamps - window
+    start_rates = np.interp(start, timestamps, rates)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        apy = (rates / start_rates) ** (SECONDS_PER_YEAR / window) - 1
+    if len(timestamps) > 0:
+        apy[start < timestamps[0]] = np.nan
+    return apy
+
+
+def rolling_apys(records: np.ndarray, windows: Optional[Dict[str, int]] = None):
+    """Computes `rolling_apy` for each window (1, 7 and 30 days by default)."""
+    windows = windows or WINDOWS
+    return {
+        name: rolling_apy(records["timestamp"], records["rate"], window)
+        for name, window in windows.items()
+    }
+
+
+def _timestamps(web3, blocks: Iterable[int]) -> Dict[int, int]:
+    return {block: web3.eth.get_block(block)["timestamp"] for block in set(blocks)}
+
+
+def backfill_from_archive(
+    store: ExchangeRateStore, pool, web3, from_block: int, to_block: int, step: int = 1
+) -> int:
+    """Samples `pool.exchangeRate()` every `step` blocks; requires an archive node."""
+    last_block = store.last_block
+    if last_block is not None:
+        from_block = max(from_block, last_block + 1)
+    blocks = list(range(from_block, to_block + 1, step))
+    rates = [pool.exchangeRate(block_identifier=block) for block in blocks]
+    timestamps = _timestamps(web3, blocks)
+    return store.append(blocks, [timestamps[block] for block in blocks], rates)
+
+
+def rates_from_events(events: Iterable) -> Dict[int, int]:
+    """Returns the exchange rate (scaled by 1e18) at each block with a deposit.
+
+    `events` are decoded pool events with `event`, `args`, `blockNumber` and `logIndex` keys.
+    The last deposit of a block gives its rate.
+    """
+    rates = {}
+    for event in sorted(events, key=lambda e: (e["blockNumber"], e["logIndex"])):
+        if event["event"] not in DEPOSIT_EVENTS:
+            continue
+        minted = event["args"]["mintedLpTokens"]
+        if minted > 0:
+            rates[event["blockNumber"]] = event["args"]["depositAmount"] * SCALE // minted
+    return rates
+
+
+def backfill_from_events(
+    store: ExchangeRateStore, pool, web3, from_block: int, to_block: Optional[int] = None
+) -> int:
+    """Derives exchange rates from the deposit events of `pool` (a brownie contract)."""
+    last_block = store.last_block
+    if last_block is not None:
+        from_block = max(from_block, last_block + 1)
+    events = []
+    for event_type in DEPOSIT_EVENTS:
+        events.extend(pool.events.get_sequence(from_block, to_block, event_type=event_type))
+    rates = rates_from_events(events)
+    blocks = sorted(rates)
+    timestamps = _timestamps(web3, blocks)
+    return store.append(
+        blocks, [timestamps[block] for block in blocks], [rates[block] for block in blocks]
+    )
@@ -0,0 +1,152 @@
+"""Helpers to record gas usage of contract calls across parameter sweeps,
+store the results as JSON and compare them against a stored baseline.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Union
+
+DEFAULT_TOLERANCE = 0.02
+
+
+def benchmark_id(name: str, params: Mapping[str, Any]) -> str:
+    if not params:
+        return name
+    formatted = ",".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{name}[{formatted}]"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    params: Dict[str, Any]
+    samples: List[int] = field(default_factory=list)
+
+    @property
+    def id(self) -> str:
+        return benchmark_id(self.name, self.params)
+
+    @property
+    def mean(self) -> int:
+        return sum(self.samples) // len(self.samples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "count": len(self.samples),
+            "min": min(self.samples),
+            "max": max(self.samples),
+            "mean": self.mean,
+        }
+
+
+class Regression(NamedTuple):
+    id: str
+    baseline: int
+    current: int
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline
+
+
+class GasRecorder:
+    """Collects the gas used by transactions, grouped by benchmark name and parameters.
+
+    Recording the same benchmark several times keeps every sample, and the
+    comparison uses their mean.
+    """
+
+    def __init__(self):
+        self._results: Dict[str, BenchmarkResult] = {}
+
+    def record(self, name: str, tx_or_gas: Union[int, Any], **params) -> int:
+        gas_used = tx_or_gas if isinstance(tx_or_gas, int) else tx_or_gas.gas_used
+        key = benchmark_id(name, params)
+        if key not in self._results:
+            self._results[key] = BenchmarkResult(name, params)
+        self._results[key].samples.append(gas_used)
+        return gas_used
+
+    def __len__(self):
+        return len(self._results)
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        return {key: self._results[key].to_dict() for key in sorted(self._results)}
+
+    def save(self, path: Union[str, Path]):
+        save_results(path, self.results())
+
+
+def merge_results(*results: Mapping[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Merges results recorded separately (e.g. by different test workers).
+    The mean of a benchmark recorded more than once is weighted by its sample count.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for key, value in result.items():
+            if key not in merged:
+                merged[key] = dict(value)
+                continue
+            current = merged[key]
+            count = current["count"] + value["count"]
+            total = current["mean"] * current["count"] + value["mean"] * value["count"]
+            current.update(
+                count=count,
+                min=min(current["min"], value["min"]),
+                max=max(current["max"], value["max"]),
+                mean=total // count,
+            )
+    return {key: merged[key] for key in sorted(merged)}
+
+
+def save_results(path: Union[str, Path], results: Mapping[str, Dict[str, Any]]):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+        fp.write("\n")
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    with Path(path).open() as fp:
+        return json.load(fp)
+
+
+def compare_results(
+    current: Mapping[str, Dict[str, Any]],
+    baseline: Mapping[str, Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Regression]:
+    """Returns the benchmarks whose mean gas usage grew by more than `tolerance`
+    (as a fraction of the baseline). Benchmarks missing from either side are ignored.
+    """
+    regressions = []
+    for key in sorted(current.keys() & baseline.keys()):
+        baseline_gas = baseline[key]["mean"]
+        current_gas = current[key]["mean"]
+        if current_gas > baseline_gas * (1 + tolerance):
+            regressions.append(Regression(key, baseline_gas, current_gas))
+    return regressions
+
+
+def format_comparison(
+    current: Mapping[str, Dict[str, Any]],
+    baseline: Optional[Mapping[str, Dict[str, Any]]] = None,
+) -> str:
+    baseline = baseline or {}
+    width = max([len(key) for key in current] + [len("benchmark")])
+    lines = [f"{'benchmark':<{width}} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for key, result in current.items():
+        current_gas = result["mean"]
+        if key in baseline:
+            baseline_gas = baseline[key]["mean"]
+            change = (current_gas - baseline_gas) / baseline_gas
+            lines.append(
+                f"{key:<{width}} {baseline_gas:>10} {current_gas:>10} {change:>+8.2%}"
+            )
+        else:
+            lines.append(f"{key:<{width}} {'-':>10} {current_gas:>10} {'new':>8}")
+    return "\n".join(lines)
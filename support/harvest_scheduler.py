@@ -0,0 +1,202 @@
+"""Decides when harvesting vault strategies is worth its gas cost.
+
+A strategy accrues rewards at a rate ``r`` (in wei of ETH per second) that
+only compound once harvested and reinvested at a yield ``y`` per second.
+Harvesting every ``T`` seconds costs ``G / T`` per second in gas and forgoes
+about ``r * y * T / 2`` per second of yield on the rewards left unharvested,
+so the cost is minimized by harvesting every ``T* = sqrt(2 * G / (r * y))``
+seconds, that is once ``r * T*`` rewards have accrued.
+
+The reward rate of each strategy is estimated from consecutive polls of
+`harvestable()`; until a rate is known, a strategy is harvested as soon as
+its rewards are worth `min_profit_multiple` times the gas cost.
+"""
+
+import json
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from brownie import ZERO_ADDRESS, interface  # type: ignore
+
+DEPLOYMENTS_MAP = Path(__file__).parent.parent / "config" / "deployments" / "map.json"
+STRATEGY_CONTRACTS = ("MeroTriHopCvx", "MeroEthCvx")
+SECONDS_PER_YEAR = 365 * 86400
+ETH_PRICE = 10**18
+
+Pricer = Callable[[str], int]
+
+
+@dataclass
+class HarvestConfig:
+    apy: float = 0.05
+    min_profit_multiple: float = 1.0
+    poll_interval: float = 60.0
+    execute: bool = False
+    required_confs: int = 1
+
+
+class HarvestTarget(NamedTuple):
+    name: str
+    strategy: object
+    vault: object
+    underlying: str
+    decimals: int
+
+
+class HarvestEstimate(NamedTuple):
+    target: HarvestTarget
+    timestamp: int
+    harvestable: int
+    value: int
+    gas: int
+    gas_cost: int
+    reward_rate: Optional[float]
+    optimal_interval: Optional[float]
+    next_harvest: Optional[int]
+    should_harvest: bool
+
+
+class HarvestResult(NamedTuple):
+    target: HarvestTarget
+    tx: Optional[object]
+    error: Optional[Exception]
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.tx is not None and self.tx.status == 1
+
+
+def deployed_strategies(
+    chain_id: int, names: Iterable[str] = STRATEGY_CONTRACTS, path: Path = DEPLOYMENTS_MAP
+) -> List[Tuple[str, str]]:
+    """Returns the `(contract name, address)` of the strategies deployed on `chain_id`."""
+    with open(path) as f:
+        deployments = json.load(f).get(str(chain_id), {})
+    return [(name, address) for name in names for address in deployments.get(name, [])]
+
+
+def make_target(name: str, strategy, vault=None) -> HarvestTarget:
+    if vault is None:
+        vault = interface.IVault(strategy.vault())
+    underlying = vault.getUnderlying()
+    decimals = 18 if underlying == ZERO_ADDRESS else interface.IERC20Full(underlying).decimals()
+    return HarvestTarget(name, strategy, vault, str(underlying), decimals)
+
+
+def oracle_pricer(oracle) -> Pricer:
+    """Prices underlyings in ETH (scaled by 1e18) with an `IOracleProvider`."""
+
+    def price(underlying: str) -> int:
+        return ETH_PRICE if underlying == ZERO_ADDRESS else oracle.getPriceETH(underlying)
+
+    return price
+
+
+def optimal_harvest_interval(gas_cost: int, reward_rate: float, apy: float) -> float:
+    """Returns the interval in seconds between harvests minimizing gas and forgone yield.
+
+    `gas_cost` is in wei, `reward_rate` in wei per second and `apy` is the yield
+    earned by the harvested rewards once reinvested.
+    """
+    yield_per_second = apy / SECONDS_PER_YEAR
+    if reward_rate <= 0 or yield_per_second <= 0:
+        return math.inf
+    return math.sqrt(2 * gas_cost / (reward_rate * yield_per_second))
+
+
+class HarvestScheduler:
+    """Polls the harvestable rewards of strategies and harvests their vault
+    when it is profitable.
+
+    `keeper` must be allowed to call `Vault.harvest` (maintenance role), as the
+    gas of the harvest is estimated with `eth_estimateGas` from this account.
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[HarvestTarget],
+        keeper,
+        web3,
+        pricer: Optional[Pricer] = None,
+        config: Optional[HarvestConfig] = None,
+    ):
+        self.targets = list(targets)
+        self.keeper = keeper
+        self.web3 = web3
+        self.pricer = pricer or (lambda _: ETH_PRICE)
+        self.config = config or HarvestConfig()
+        self._observations: Dict[str, Tuple[int, int]] = {}
+
+    def poll(self, timestamp: Optional[int] = None) -> List[HarvestEstimate]:
+        if timestamp is None:
+            timestamp = self.web3.eth.get_block("latest")["timestamp"]
+        gas_price = self.web3.eth.gas_price
+        return [self.estimate(target, timestamp, gas_price) for target in self.targets]
+
+    def estimate(self, target: HarvestTarget, timestamp: int, gas_price: int) -> HarvestEstimate:
+        harvestable = target.strategy.harvestable()
+        value = harvestable * self.pricer(target.underlying) // 10**target.decimals
+        gas = target.vault.harvest.estimate_gas({"from": self.keeper})
+        gas_cost = gas * gas_price
+        reward_rate = self._update_reward_rate(str(target.strategy), timestamp, value)
+
+        optimal_interval = next_harvest = None
+        should_harvest = value > 0 and value >= gas_cost * self.config.min_profit_multiple
+        if reward_rate:
+            optimal_interval = optimal_harvest_interval(gas_cost, reward_rate, self.config.apy)
+            optimal_value = max(reward_rate * optimal_interval, gas_cost)
+            should_harvest = should_harvest and value >= optimal_value
+            if math.isfinite(optimal_value):
+                next_harvest = timestamp + math.ceil(max(optimal_value - value, 0) / reward_rate)
+        return HarvestEstimate(
+            target,
+            timestamp,
+            harvestable,
+            value,
+            gas,
+            gas_cost,
+            reward_rate,
+            optimal_interval,
+            next_harvest,
+            should_harvest,
+        )
+
+    def execute(self, estimates: Iterable[HarvestEstimate]) -> List[HarvestResult]:
+        results = []
+        for estimate in estimates:
+            if not estimate.should_harvest:
+                continue
+            target = estimate.target
+            try:
+                tx = target.vault.harvest(
+                    {"from": self.keeper, "required_confs": self.config.required_confs}
+                )
+                self._observations.pop(str(target.strategy), None)
+                results.append(HarvestResult(target, tx, None))
+            except Exception as exc:  # pylint: disable=broad-except
+                results.append(HarvestResult(target, None, exc))
+        return results
+
+    def run(self, max_polls: Optional[int] = None):
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            estimates = self.poll()
+            results = self.execute(estimates) if self.config.execute else []
+            yield estimates, results
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.config.poll_interval)
+
+    def _update_reward_rate(self, strategy: str, timestamp: int, value: int) -> Optional[float]:
+        previous = self._observations.get(strategy)
+        if previous is None or value < previous[1]:
+            # first observation or rewards were harvested since the last one
+            self._observations[strategy] = (timestamp, value)
+            return None
+        if timestamp <= previous[0]:
+            return None
+        self._observations[strategy] = (timestamp, value)
+        return (value - previous[1]) / (timestamp - previous[0])
@@ -0,0 +1,14 @@
+from support.keeper.engine import BlockReport, EngineConfig, TopUpKeeper
+from support.keeper.executor import ExecutionResult, ExecutorConfig, TopupExecutor
+from support.keeper.indexer import (
+    IndexedPosition,
+    IndexedScanner,
+    PositionIndexer,
+    PositionStore,
+)
+from support.keeper.scanner import (
+    ExecutableTopup,
+    ScannerConfig,
+    TopupKey,
+    TopupScanner,
+)
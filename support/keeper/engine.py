@@ -0,0 +1,80 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Set
+
+from support.keeper.executor import ExecutionResult, TopupExecutor
+from support.keeper.scanner import ExecutableTopup, TopupScanner, run_in_thread
+
+
+class BlockReport(NamedTuple):
+    block_number: int
+    scan_duration: float
+    topups: List[ExecutableTopup]
+    results: List[ExecutionResult]
+
+
+@dataclass
+class EngineConfig:
+    poll_interval: float = 1.0
+    execute: bool = True
+
+
+class TopUpKeeper:
+    """Scans for executable top-ups once per block and executes them.
+
+    Every scan is pinned to the block it was started for so concurrent pages
+    see a consistent state. When running continuously, executions are not
+    awaited before the next scan; their results are reported with the first
+    block seen after they complete.
+    """
+
+    def __init__(
+        self,
+        scanner: TopupScanner,
+        executor: TopupExecutor,
+        web3,
+        config: Optional[EngineConfig] = None,
+    ):
+        self.scanner = scanner
+        self.executor = executor
+        self.web3 = web3
+        self.config = config or EngineConfig()
+        self.last_block: Optional[int] = None
+        self._executions: Set[asyncio.Task] = set()
+
+    async def run_once(
+        self, block_number: Optional[int] = None, wait: bool = True
+    ) -> BlockReport:
+        if block_number is None:
+            block_number = await self._block_number()
+        started_at = time.monotonic()
+        topups = await self.scanner.scan(block_identifier=block_number)
+        scan_duration = time.monotonic() - started_at
+        self.last_block = block_number
+
+        if self.config.execute and topups:
+            self._executions.add(asyncio.create_task(self.executor.execute_all(topups)))
+        if wait and self._executions:
+            await asyncio.wait(self._executions)
+        return BlockReport(block_number, scan_duration, topups, self._completed())
+
+    async def run(self, max_blocks: Optional[int] = None):
+        processed = 0
+        while max_blocks is None or processed < max_blocks:
+            block_number = await self._block_number()
+            if block_number == self.last_block:
+                await asyncio.sleep(self.config.poll_interval)
+                continue
+            yield await self.run_once(block_number, wait=False)
+            processed += 1
+        if self._executions:
+            await asyncio.wait(self._executions)
+
+    def _completed(self) -> List[ExecutionResult]:
+        done = {task for task in self._executions if task.done()}
+        self._executions -= done
+        return [result for task in done for result in task.result()]
+
+    async def _block_number(self) -> int:
+        return await run_in_thread(lambda: self.web3.eth.block_number)
@@ -0,0 +1,81 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Iterable, List, NamedTuple, Optional, Set
+
+from support.keeper.scanner import ExecutableTopup, TopupKey, run_in_thread
+
+
+@dataclass
+class ExecutorConfig:
+    max_in_flight: int = 4
+    max_wei_for_gas: int = 0
+    required_confs: int = 1
+
+
+class ExecutionResult(NamedTuple):
+    key: TopupKey
+    tx: Optional[object]
+    error: Optional[Exception]
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.tx is not None and self.tx.status == 1
+
+
+class TopupExecutor:
+    """Submits `TopUpAction.execute` for executable top-ups with at most
+    `max_in_flight` unconfirmed transactions at any time.
+
+    Positions that already have a pending transaction are skipped, so the
+    same top-up found again in the next block is not sent twice.
+    """
+
+    def __init__(self, top_up_action, keeper, beneficiary=None, config=None):
+        self.top_up_action = top_up_action
+        self.keeper = keeper
+        self.beneficiary = beneficiary or keeper
+        self.config = config or ExecutorConfig()
+        self.pending: Set[TopupKey] = set()
+
+    async def execute_all(
+        self, topups: Iterable[ExecutableTopup]
+    ) -> List[ExecutionResult]:
+        semaphore = asyncio.Semaphore(self.config.max_in_flight)
+        to_execute = [topup for topup in topups if topup.key not in self.pending]
+        self.pending.update(topup.key for topup in to_execute)
+        return list(
+            await asyncio.gather(
+                *[self._execute(topup, semaphore) for topup in to_execute]
+            )
+        )
+
+    async def _execute(
+        self, topup: ExecutableTopup, semaphore: asyncio.Semaphore
+    ) -> ExecutionResult:
+        try:
+            async with semaphore:
+                tx = await run_in_thread(self._send, topup)
+                await run_in_thread(tx.wait, self.config.required_confs)
+            return ExecutionResult(topup.key, tx, None)
+        except Exception as exc:  # pylint: disable=broad-except
+            return ExecutionResult(topup.key, None, exc)
+        finally:
+            self.pending.discard(topup.key)
+
+    def _send(self, topup: ExecutableTopup):
+        # the payer never pays more than `basefee + priorityFee` capped at `maxFee`
+        # so bidding above that makes `execute` revert
+        record = topup.record
+        return self.top_up_action.execute(
+            topup.key.payer,
+            topup.key.account,
+            self.beneficiary,
+            topup.key.protocol,
+            self.config.max_wei_for_gas,
+            {
+                "from": self.keeper,
+                "priority_fee": record[1],
+                "max_fee": record[2],
+                "required_confs": 0,
+            },
+        )
@@ -0,0 +1,413 @@
+import asyncio
+import json
+import sqlite3
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from eth_utils import event_abi_to_log_topic
+
+from support.keeper.scanner import ExecutableTopup, TopupKey, run_in_thread
+
+INDEXED_EVENTS = ("Register", "Deregister", "TopUp")
+
+_POSITION_COLUMNS = (
+    "payer",
+    "account",
+    "protocol",
+    "threshold",
+    "deposit_token",
+    "action_token",
+    "single_top_up_amount",
+    "total_top_up_amount",
+    "deposit_token_balance",
+    "max_fee",
+    "extra",
+    "registered_block",
+    "top_up_count",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    payer TEXT NOT NULL,
+    account TEXT NOT NULL,
+    protocol TEXT NOT NULL,
+    threshold TEXT NOT NULL,
+    deposit_token TEXT NOT NULL,
+    action_token TEXT NOT NULL,
+    single_top_up_amount TEXT NOT NULL,
+    total_top_up_amount TEXT NOT NULL,
+    deposit_token_balance TEXT NOT NULL,
+    max_fee TEXT NOT NULL,
+    extra TEXT NOT NULL,
+    registered_block INTEGER NOT NULL,
+    top_up_count INTEGER NOT NULL,
+    PRIMARY KEY (payer, account, protocol)
+);
+CREATE TABLE IF NOT EXISTS journal (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    block_number INTEGER NOT NULL,
+    payer TEXT NOT NULL,
+    account TEXT NOT NULL,
+    protocol TEXT NOT NULL,
+    previous TEXT
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    block_number INTEGER PRIMARY KEY,
+    block_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class IndexedPosition(NamedTuple):
+    payer: str
+    account: str
+    protocol: str
+    threshold: int
+    deposit_token: str
+    action_token: str
+    single_top_up_amount: int
+    total_top_up_amount: int
+    deposit_token_balance: int
+    max_fee: int
+    extra: str
+    registered_block: int
+    top_up_count: int = 0
+
+    @property
+    def key(self) -> TopupKey:
+        return TopupKey(self.payer, self.account, self.protocol)
+
+
+# uint128/uint256 values do not fit in SQLite integers and are stored as text
+_AMOUNT_COLUMNS = (3, 6, 7, 8, 9)
+
+
+def _to_row(position: IndexedPosition) -> tuple:
+    return tuple(
+        str(value) if i in _AMOUNT_COLUMNS else value
+        for i, value in enumerate(position)
+    )
+
+
+def _from_row(row) -> IndexedPosition:
+    return IndexedPosition(
+        *(int(value) if i in _AMOUNT_COLUMNS else value for i, value in enumerate(row))
+    )
+
+
+def _hex(value) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    return str(value).lower()
+
+
+class PositionStore:
+    """SQLite store of registered top-up positions.
+
+    Every write is journaled with the block that caused it so the store can be
+    rolled back to any checkpoint that has not been pruned yet.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(_SCHEMA)
+
+    @property
+    def cursor(self) -> Optional[int]:
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'cursor'").fetchone()
+        return None if row is None else int(row[0])
+
+    @cursor.setter
+    def cursor(self, block_number: Optional[int]):
+        if block_number is None:
+            self.db.execute("DELETE FROM meta WHERE key = 'cursor'")
+        else:
+            self.db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('cursor', ?)",
+                (str(block_number),),
+            )
+
+    def get(self, key: TopupKey) -> Optional[IndexedPosition]:
+        row = self.db.execute(
+            "SELECT * FROM positions WHERE payer = ? AND account = ? AND protocol = ?",
+            tuple(key),
+        ).fetchone()
+        return None if row is None else _from_row(row)
+
+    def all(self) -> List[IndexedPosition]:
+        return [_from_row(row) for row in self.db.execute("SELECT * FROM positions")]
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+    def put(self, position: IndexedPosition, block_number: int):
+        self._journal(position.key, block_number)
+        self._write(position)
+
+    def delete(self, key: TopupKey, block_number: int):
+        self._journal(key, block_number)
+        self._remove(key)
+
+    def add_checkpoint(self, block_number: int, block_hash: str):
+        self.db.execute(
+            "INSERT OR REPLACE INTO checkpoints (block_number, block_hash) VALUES (?, ?)",
+            (block_number, block_hash),
+        )
+
+    def checkpoints(self) -> List[Tuple[int, str]]:
+        return list(
+            self.db.execute(
+                "SELECT block_number, block_hash FROM checkpoints ORDER BY block_number DESC"
+            )
+        )
+
+    def rollback(self, block_number: int):
+        """Undoes every write made after `block_number`."""
+        entries = self.db.execute(
+            "SELECT payer, account, protocol, previous FROM journal "
+            "WHERE block_number > ? ORDER BY id DESC",
+            (block_number,),
+        ).fetchall()
+        for payer, account, protocol, previous in entries:
+            if previous is None:
+                self._remove(TopupKey(payer, account, protocol))
+            else:
+                self._write(_from_row(json.loads(previous)))
+        self.db.execute("DELETE FROM journal WHERE block_number > ?", (block_number,))
+        self.db.execute(
+            "DELETE FROM checkpoints WHERE block_number > ?", (block_number,)
+        )
+        self.cursor = block_number
+
+    def reset(self):
+        for table in ("positions", "journal", "checkpoints", "meta"):
+            self.db.execute(f"DELETE FROM {table}")
+
+    def prune(self, block_number: int):
+        """Drops journal entries and checkpoints that can no longer be rolled back to.
+        The newest checkpoint at or below `block_number` is kept as rollback target."""
+        row = self.db.execute(
+            "SELECT MAX(block_number) FROM checkpoints WHERE block_number <= ?",
+            (block_number,),
+        ).fetchone()
+        if row[0] is None:
+            return
+        self.db.execute("DELETE FROM checkpoints WHERE block_number < ?", (row[0],))
+        self.db.execute("DELETE FROM journal WHERE block_number <= ?", (row[0],))
+
+    def commit(self):
+        self.db.commit()
+
+    def _journal(self, key: TopupKey, block_number: int):
+        previous = self.get(key)
+        self.db.execute(
+            "INSERT INTO journal (block_number, payer, account, protocol, previous) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                block_number,
+                *key,
+                None if previous is None else json.dumps(_to_row(previous)),
+            ),
+        )
+
+    def _write(self, position: IndexedPosition):
+        placeholders = ", ".join("?" for _ in _POSITION_COLUMNS)
+        self.db.execute(
+            f"INSERT OR REPLACE INTO positions ({', '.join(_POSITION_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            _to_row(position),
+        )
+
+    def _remove(self, key: TopupKey):
+        self.db.execute(
+            "DELETE FROM positions WHERE payer = ? AND account = ? AND protocol = ?",
+            tuple(key),
+        )
+
+
+class PositionIndexer:
+    """Replays `TopUpAction` Register/Deregister/TopUp events into a `PositionStore`.
+
+    The block cursor is persisted with the store, so a restarted indexer only
+    fetches logs it has not seen. Before each sync, the hash of the latest
+    checkpoint is compared with the chain and the store is rolled back to the
+    newest checkpoint that is still canonical.
+    """
+
+    def __init__(
+        self,
+        web3,
+        top_up_action,
+        store: PositionStore,
+        start_block: int = 0,
+        batch_size: int = 2_000,
+        max_reorg_depth: int = 64,
+    ):
+        self.web3 = web3
+        self.address = top_up_action.address
+        self.store = store
+        self.start_block = start_block
+        self.batch_size = batch_size
+        self.max_reorg_depth = max_reorg_depth
+        contract = web3.eth.contract(address=self.address, abi=top_up_action.abi)
+        self._events: Dict[str, object] = {}
+        for name in INDEXED_EVENTS:
+            event = contract.events[name]()
+            self._events[_hex(event_abi_to_log_topic(event.abi))] = event
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """Indexes all events up to `to_block` (latest by default) and
+        returns the number of logs applied."""
+        if to_block is None:
+            to_block = self.web3.eth.block_number
+        self.handle_reorg()
+
+        cursor = self.store.cursor
+        from_block = self.start_block if cursor is None else cursor + 1
+        applied = 0
+        while from_block <= to_block:
+            batch_end = min(from_block + self.batch_size - 1, to_block)
+            logs = self.web3.eth.get_logs(
+                {
+                    "address": self.address,
+                    "fromBlock": from_block,
+                    "toBlock": batch_end,
+                    "topics": [list(self._events)],
+                }
+            )
+            self.apply_logs(logs)
+            applied += len(logs)
+            self.store.add_checkpoint(batch_end, self._block_hash(batch_end))
+            self.store.cursor = batch_end
+            self.store.prune(to_block - self.max_reorg_depth)
+            self.store.commit()
+            from_block = batch_end + 1
+        return applied
+
+    def handle_reorg(self) -> Optional[int]:
+        """Rolls the store back if its latest checkpoint is no longer canonical.
+        Returns the block the store was rolled back to, if any."""
+        checkpoints = self.store.checkpoints()
+        if not checkpoints or checkpoints[0][1] == self._block_hash(checkpoints[0][0]):
+            return None
+
+        for block_number, block_hash in checkpoints[1:]:
+            if block_hash == self._block_hash(block_number):
+                self.store.rollback(block_number)
+                self.store.commit()
+                return block_number
+
+        # reorg deeper than any checkpoint we kept, start over
+        self.store.reset()
+        self.store.commit()
+        return self.start_block - 1
+
+    def apply_logs(self, logs: Iterable[dict]):
+        for log in logs:
+            event = self._events[_hex(log["topics"][0])]
+            decoded = event.processLog(log)  # type: ignore
+            getattr(self, f"_apply_{decoded.event.lower()}")(
+                decoded.args, decoded.blockNumber
+            )
+
+    def positions(self) -> List[IndexedPosition]:
+        return self.store.all()
+
+    def _apply_register(self, args, block_number: int):
+        position = IndexedPosition(
+            payer=args.payer,
+            account=_hex(args.account),
+            protocol=_hex(args.protocol),
+            threshold=args.threshold,
+            deposit_token=args.depositToken,
+            action_token=args.actionToken,
+            single_top_up_amount=args.singleTopUpAmount,
+            total_top_up_amount=args.totalTopUpAmount,
+            deposit_token_balance=args.depositAmount,
+            max_fee=args.maxGasPrice,
+            extra=_hex(args.extra),
+            registered_block=block_number,
+        )
+        self.store.put(position, block_number)
+
+    def _apply_deregister(self, args, block_number: int):
+        key = TopupKey(args.payer, _hex(args.account), _hex(args.protocol))
+        self.store.delete(key, block_number)
+
+    def _apply_topup(self, args, block_number: int):
+        key = TopupKey(args.payer, _hex(args.account), _hex(args.protocol))
+        position = self.store.get(key)
+        if position is None:
+            return
+        # the contract also deducts the fees, which are not part of the event, from the
+        # total top up amount, so the indexed one can only be higher than the on-chain one
+        self.store.put(
+            position._replace(
+                total_top_up_amount=max(position.total_top_up_amount - args.topupAmount, 0),
+                deposit_token_balance=max(
+                    position.deposit_token_balance - args.consumedDepositAmount, 0
+                ),
+                top_up_count=position.top_up_count + 1,
+            ),
+            block_number,
+        )
+
+    def _block_hash(self, block_number: int) -> str:
+        return _hex(self.web3.eth.get_block(block_number)["hash"])
+
+
+class IndexedScanner:
+    """Drop-in replacement for `TopupScanner` that enumerates positions from
+    a `PositionIndexer` instead of walking `usersWithPositions`.
+
+    Each scan only calls the chain for `batchCanExecute` over chunks of the
+    indexed keys and `getPosition` for the positions that can be executed.
+    """
+
+    def __init__(
+        self,
+        indexer: PositionIndexer,
+        keeper_helper,
+        top_up_action,
+        chunk_size: int = 100,
+        concurrency: int = 8,
+    ):
+        self.indexer = indexer
+        self.keeper_helper = keeper_helper
+        self.top_up_action = top_up_action
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+
+    async def scan(
+        self, block_identifier: Optional[int] = None
+    ) -> List[ExecutableTopup]:
+        await run_in_thread(self.indexer.sync, block_identifier)
+        keys = [position.key for position in self.indexer.positions()]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check(chunk):
+            async with semaphore:
+                results = await run_in_thread(
+                    self.keeper_helper.batchCanExecute,
+                    chunk,
+                    block_identifier=block_identifier,
+                )
+            return [key for key, executable in zip(chunk, results) if executable]
+
+        chunks = [
+            keys[i : i + self.chunk_size] for i in range(0, len(keys), self.chunk_size)
+        ]
+        executable = [
+            key for keys_ in await asyncio.gather(*map(check, chunks)) for key in keys_
+        ]
+
+        async def load(key):
+            record = await run_in_thread(
+                self.top_up_action.getPosition, *key, block_identifier=block_identifier
+            )
+            return ExecutableTopup(key, record)
+
+        return list(await asyncio.gather(*map(load, executable)))
@@ -0,0 +1,193 @@
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+GAS_ERROR_MARKERS = ("gas required exceeds", "out of gas", "gas limit", "gas cap")
+
+
+class TopupKey(NamedTuple):
+    payer: str
+    account: str
+    protocol: str
+
+
+class ExecutableTopup(NamedTuple):
+    key: TopupKey
+    record: Any
+
+
+@dataclass
+class ScannerConfig:
+    page_size: int = 50
+    min_page_size: int = 1
+    max_page_size: int = 500
+    window_size: int = 100
+    concurrency: int = 8
+
+
+def is_gas_error(exc: Exception) -> bool:
+    message = str(exc).lower()
+    return any(marker in message for marker in GAS_ERROR_MARKERS)
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """Runs a blocking call in the default executor (`asyncio.to_thread` needs Python 3.9)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def to_topup(raw) -> ExecutableTopup:
+    payer, account, protocol, record = raw
+    return ExecutableTopup(TopupKey(str(payer), str(account), str(protocol)), record)
+
+
+class TopupScanner:
+    """Finds executable top-ups by paging `TopUpKeeperHelper.getExecutableTopups`
+    concurrently over fixed windows of the payer list.
+
+    Calls can run past the end of their window and the helper restarts a
+    payer whose positions did not all fit in a page, so results are deduped
+    by (payer, account, protocol). `howMany` is halved whenever the node
+    rejects a call for exceeding its gas cap and grows back on success.
+    """
+
+    def __init__(
+        self, keeper_helper, top_up_action, config: Optional[ScannerConfig] = None
+    ):
+        self.keeper_helper = keeper_helper
+        self.top_up_action = top_up_action
+        self.config = config or ScannerConfig()
+        self.page_size = self.config.page_size
+        self._users_hint = 0
+
+    async def scan(
+        self, block_identifier: Optional[int] = None
+    ) -> List[ExecutableTopup]:
+        total_users = await self.count_users(block_identifier)
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        window_size = self.config.window_size
+
+        async def scan_window(start):
+            async with semaphore:
+                return await self._scan_window(
+                    start, min(start + window_size, total_users), block_identifier
+                )
+
+        windows = await asyncio.gather(
+            *[scan_window(start) for start in range(0, total_users, window_size)]
+        )
+
+        topups: Dict[TopupKey, ExecutableTopup] = {}
+        for window in windows:
+            for topup in window:
+                topups.setdefault(topup.key, topup)
+        return list(topups.values())
+
+    async def count_users(self, block_identifier: Optional[int] = None) -> int:
+        """Returns the number of payers with positions.
+
+        `TopUpAction` does not expose the length of its payer set, so this
+        probes `usersWithPositions(cursor, 1)` starting from the previous
+        count, which makes the common case (no change) two calls.
+        """
+
+        async def exists(index):
+            users, _ = await self._call(
+                self.top_up_action.usersWithPositions,
+                index,
+                1,
+                block_identifier=block_identifier,
+            )
+            return len(users) > 0
+
+        hint = max(self._users_hint, 1)
+        if await exists(hint - 1):
+            low, step = hint, 1
+            while await exists(low + step - 1):
+                low, step = low + step, step * 2
+            high = low + step - 1
+        else:
+            low, high = 0, hint - 1
+
+        # invariant: index `low - 1` exists (or low == 0), index `high` does not
+        while low < high:
+            middle = (low + high) // 2
+            if await exists(middle):
+                low = middle + 1
+            else:
+                high = middle
+
+        self._users_hint = low
+        return low
+
+    async def _scan_window(
+        self, start: int, end: int, block_identifier: Optional[int]
+    ) -> List[ExecutableTopup]:
+        topups: List[ExecutableTopup] = []
+        cursor = start
+        forced_page_size: Optional[int] = None
+        while cursor < end:
+            try:
+                raw_topups, next_cursor, page_size = await self._get_executable_topups(
+                    cursor, block_identifier, forced_page_size
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                if forced_page_size is None or not is_gas_error(exc):
+                    raise
+                # the payer's positions do not fit in a single call, skip them
+                cursor, forced_page_size = cursor + 1, None
+                continue
+            forced_page_size = None
+            topups.extend(to_topup(raw) for raw in raw_topups)
+            if next_cursor == 0:
+                break
+            if next_cursor <= cursor:
+                # a single payer has more executable positions than fit in one page
+                if page_size >= self.config.max_page_size:
+                    cursor += 1
+                else:
+                    forced_page_size = min(page_size * 2, self.config.max_page_size)
+                continue
+            cursor = next_cursor
+        return topups
+
+    async def _get_executable_topups(
+        self,
+        cursor: int,
+        block_identifier: Optional[int],
+        page_size: Optional[int] = None,
+    ) -> Tuple[list, int, int]:
+        if page_size is not None:
+            topups, next_cursor = await self._call(
+                self.keeper_helper.getExecutableTopups,
+                cursor,
+                page_size,
+                block_identifier=block_identifier,
+            )
+            return topups, next_cursor, page_size
+
+        while True:
+            page_size = self.page_size
+            try:
+                topups, next_cursor = await self._call(
+                    self.keeper_helper.getExecutableTopups,
+                    cursor,
+                    page_size,
+                    block_identifier=block_identifier,
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                if not is_gas_error(exc) or page_size <= self.config.min_page_size:
+                    raise
+                self.page_size = min(
+                    self.page_size, max(page_size // 2, self.config.min_page_size)
+                )
+                continue
+            if page_size == self.page_size and page_size < self.config.max_page_size:
+                self.page_size = min(
+                    page_size + max(page_size // 4, 1), self.config.max_page_size
+                )
+            return topups, next_cursor, page_size
+
+    async def _call(self, method, *args, block_identifier: Optional[int] = None):
+        return await run_in_thread(method, *args, block_identifier=block_identifier)
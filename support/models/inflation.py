@@ -0,0 +1,186 @@
+"""Projection of the MERO inflation schedule of `Minter` and its split by `InflationManager`.
+
+`rate_schedule` mirrors `Minter._executeInflationRateUpdate` with the same integer
+arithmetic as `ScaledMath`: the LP, keeper and AMM rates (per second) are
+constant over each decay period of a year and decay when it ends. Keeper and AMM
+rates use the initial period amounts during the first year only.
+
+`project` integrates this schedule over any horizon at once, per day or per
+block, and splits each kind of inflation between its gauges proportionally to
+their weights, as `getLpRateForStakerVault`, `getKeeperRateForPool` and
+`getAmmRateForToken` do. Weights are loaded from `config/inflation` and can be
+changed with `InflationWeights.update` to compare governance proposals without
+a chain. The keeper split assumes the weight-based distribution is active.
+
+Unlike the rate schedule, projections are computed with floats and expressed
+in MERO.
+"""
+
+import json
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from support.models.withdrawal_fees import SCALE, scaled_mul
+
+INFLATION_CONFIG = (
+    Path(__file__).parent.parent.parent / "config" / "inflation" / "initial_inflation.json"
+)
+INFLATION_DECAY_PERIOD = 365 * 86400
+DAY = 86400
+BLOCK_TIME = 12
+
+KINDS = ("lp", "keeper", "amm")
+CONFIG_KEYS = {"lp": "lpInflation", "keeper": "keeperInflation", "amm": "ammInflation"}
+
+
+class Rates(NamedTuple):
+    lp: int
+    keeper: int
+    amm: int
+
+
+@dataclass(frozen=True)
+class MinterParams:
+    """Constructor parameters of `Minter`, defaulting to the ones of `deploy_minter`."""
+
+    annual_inflation_rate_lp: int = 60_129_542 * SCALE * 7 // 10
+    annual_inflation_rate_keeper: int = 60_129_542 * SCALE * 2 // 10
+    annual_inflation_rate_amm: int = 60_129_542 * SCALE // 10
+    annual_inflation_decay_lp: int = SCALE * 6 // 10
+    annual_inflation_decay_keeper: int = SCALE * 4 // 10
+    annual_inflation_decay_amm: int = SCALE * 4 // 10
+    initial_period_keeper_inflation: int = 500_000 * SCALE
+    initial_period_amm_inflation: int = 500_000 * SCALE
+
+    @classmethod
+    def from_minter(cls, minter) -> "MinterParams":
+        """Reads the parameters of a deployed `Minter` (a brownie contract)."""
+        return cls(
+            annual_inflation_rate_lp=minter.initialAnnualInflationRateLp(),
+            annual_inflation_rate_keeper=minter.initialAnnualInflationRateKeeper(),
+            annual_inflation_rate_amm=minter.initialAnnualInflationRateAmm(),
+            annual_inflation_decay_lp=minter.annualInflationDecayLp(),
+            annual_inflation_decay_keeper=minter.annualInflationDecayKeeper(),
+            annual_inflation_decay_amm=minter.annualInflationDecayAmm(),
+            initial_period_keeper_inflation=minter.initialPeriodKeeperInflation(),
+            initial_period_amm_inflation=minter.initialPeriodAmmInflation(),
+        )
+
+
+def rate_schedule(params: MinterParams, periods: int) -> List[Rates]:
+    """Returns the rates of the first `periods` decay periods, starting with the initial one."""
+    rates = Rates(
+        params.annual_inflation_rate_lp // INFLATION_DECAY_PERIOD,
+        params.initial_period_keeper_inflation // INFLATION_DECAY_PERIOD,
+        params.initial_period_amm_inflation // INFLATION_DECAY_PERIOD,
+    )
+    schedule = [rates]
+    for period in range(1, periods):
+        lp = scaled_mul(rates.lp, params.annual_inflation_decay_lp)
+        if period == 1:
+            keeper = params.annual_inflation_rate_keeper // INFLATION_DECAY_PERIOD
+            amm = params.annual_inflation_rate_amm // INFLATION_DECAY_PERIOD
+        else:
+            keeper = scaled_mul(rates.keeper, params.annual_inflation_decay_keeper)
+            amm = scaled_mul(rates.amm, params.annual_inflation_decay_amm)
+        rates = Rates(lp, keeper, amm)
+        schedule.append(rates)
+    return schedule
+
+
+def find_period(params: MinterParams, rates: Rates, max_periods: int = 100) -> Optional[int]:
+    """Returns the decay period with the given on-chain rates, or `None` if there is none."""
+    for period, expected in enumerate(rate_schedule(params, max_periods)):
+        if expected == rates:
+            return period
+    return None
+
+
+def chain_rates(minter) -> Rates:
+    return Rates(
+        minter.getLpInflationRate(),
+        minter.getKeeperInflationRate(),
+        minter.getAmmInflationRate(),
+    )
+
+
+def cumulative_emissions(params: MinterParams, elapsed) -> np.ndarray:
+    """Returns the MERO emitted of each kind after `elapsed` seconds of inflation.
+
+    `elapsed` is an array of durations since the start of the inflation; the
+    result has one row per duration and one column per kind, in `KINDS` order.
+    """
+    elapsed = np.clip(np.asarray(elapsed, dtype=np.int64), 0, None)
+    periods = int(elapsed.max(initial=0)) // INFLATION_DECAY_PERIOD + 1
+    rates = np.array(rate_schedule(params, periods), dtype=np.float64) / SCALE
+    at_period_start = np.zeros_like(rates)
+    at_period_start[1:] = np.cumsum(rates[:-1] * INFLATION_DECAY_PERIOD, axis=0)
+    period = elapsed // INFLATION_DECAY_PERIOD
+    in_period = (elapsed - period * INFLATION_DECAY_PERIOD).astype(np.float64)
+    return at_period_start[period] + rates[period] * in_period[:, None]
+
+
+@dataclass(frozen=True)
+class InflationWeights:
+    """Inflation weights of the gauges of each kind, by pool LP token or AMM token symbol."""
+
+    lp: Dict[str, float] = field(default_factory=dict)
+    keeper: Dict[str, float] = field(default_factory=dict)
+    amm: Dict[str, float] = field(default_factory=dict)
+
+    def update(self, kind: str, **weights: float) -> "InflationWeights":
+        """Returns the weights with the given gauges of `kind` set; 0 removes a gauge."""
+        updated = {**getattr(self, kind), **weights}
+        return replace(self, **{kind: {k: w for k, w in updated.items() if w > 0}})
+
+    def shares(self, kind: str) -> Dict[str, float]:
+        weights = getattr(self, kind)
+        total = sum(weights.values())
+        if total == 0:
+            return {}
+        return {name: weight / total for name, weight in weights.items()}
+
+
+def load_weights(path=INFLATION_CONFIG) -> InflationWeights:
+    with open(path) as f:
+        config = json.load(f)
+    return InflationWeights(**{kind: dict(config.get(CONFIG_KEYS[kind], {})) for kind in KINDS})
+
+
+class Projection(NamedTuple):
+    """MERO emitted during each step, starting at `timestamps`, by kind and by gauge."""
+
+    timestamps: np.ndarray
+    totals: Dict[str, np.ndarray]
+    gauges: Dict[str, Dict[str, np.ndarray]]
+
+    def total(self, kind: str, name: Optional[str] = None) -> float:
+        emissions = self.totals[kind] if name is None else self.gauges[kind][name]
+        return float(emissions.sum())
+
+
+def project(
+    params: MinterParams,
+    weights: InflationWeights,
+    duration: int,
+    step: int = DAY,
+    start: int = 0,
+    inflation_start: int = 0,
+) -> Projection:
+    """Projects the emissions from `start` for `duration` seconds by steps of `step` seconds.
+
+    Times are timestamps, with the inflation started at `inflation_start`; use
+    `step=BLOCK_TIME` for per block emissions.
+    """
+    boundaries = np.arange(start, start + duration + step, step, dtype=np.int64)
+    boundaries[-1] = min(boundaries[-1], start + duration)
+    emissions = np.diff(cumulative_emissions(params, boundaries - inflation_start), axis=0)
+    totals = {kind: emissions[:, i] for i, kind in enumerate(KINDS)}
+    gauges = {
+        kind: {name: totals[kind] * share for name, share in weights.shares(kind).items()}
+        for kind in KINDS
+    }
+    return Projection(boundaries[:-1], totals, gauges)
@@ -0,0 +1,488 @@
+"""Reference model of the capital allocation of a `LiquidityPool` and its `Vault`.
+
+`PoolModel` mirrors `depositFor`, `redeem` and `_rebalanceVault` of the pool and
+`VaultModel` mirrors `deposit`, `withdraw`, `_harvest`, `_handleExcessDebt`,
+`_emergencyStop`, `_rebalance` and `_computeNewAllocated` of the vault, using
+the same integer arithmetic as `ScaledMath`.
+
+Replaying a trace of deposits and redemptions counts the calls made to the
+strategy, which are the expensive part of a rebalance, and the redemptions
+that would revert because the pool and vault could not free enough funds.
+This allows to tune `targetAllocation`, `bound`, `debtLimit` and the pool
+reserve parameters without a chain.
+
+Withdrawal fees are not modelled: redemptions are expressed in underlying,
+or in LP tokens redeemed without fees.
+"""
+
+import copy
+import csv
+import itertools
+import json
+from dataclasses import dataclass, field, replace
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from support.models.withdrawal_fees import SCALE, scaled_div, scaled_mul
+
+POOLS_CONFIG = Path(__file__).parent.parent.parent / "config" / "pools"
+MAX_DEVIATION_BOUND = SCALE // 2
+DEFAULT_RESERVE_WITHDRAWAL_DELAY = 3 * 86400
+
+ACTIONS = ("deposit", "redeem", "redeem_lp", "profit", "loss", "harvest", "lock", "unlock")
+
+
+def _scale(value) -> int:
+    return int(Decimal(value) * SCALE)
+
+
+@dataclass
+class VaultParams:
+    debt_limit: int = 0
+    target_allocation: int = 0
+    bound: int = 0
+    performance_fee: int = 0
+    strategist_fee: int = 0
+    reserve_fee: int = 0
+    reserve_withdrawal_delay: int = DEFAULT_RESERVE_WITHDRAWAL_DELAY
+
+    def __post_init__(self):
+        if self.debt_limit > SCALE or self.target_allocation > SCALE:
+            raise ValueError("debt limit and target allocation must be at most 1")
+        if self.bound > MAX_DEVIATION_BOUND:
+            raise ValueError("bound must be at most 0.5")
+        if self.reserve_fee + self.strategist_fee > SCALE:
+            raise ValueError("sum of strategist fee and reserve fee should be below 1")
+
+
+@dataclass
+class PoolParams:
+    required_reserves: int = 0
+    reserve_deviation: int = 0
+
+
+class TraceEntry(NamedTuple):
+    action: str
+    amount: int
+    timestamp: int = 0
+
+
+class Counters(NamedTuple):
+    strategy_deposits: int = 0
+    strategy_withdrawals: int = 0
+    strategy_withdraw_alls: int = 0
+    vault_deposits: int = 0
+    vault_withdrawals: int = 0
+    harvests: int = 0
+    emergency_stops: int = 0
+
+    @property
+    def strategy_interactions(self) -> int:
+        return self.strategy_deposits + self.strategy_withdrawals + self.strategy_withdraw_alls
+
+
+class Shortfall(NamedTuple):
+    index: int
+    timestamp: int
+    requested: int
+    available: int
+
+
+class SimulationReport(NamedTuple):
+    counters: Counters
+    shortfalls: List[Shortfall]
+    pool_balance: int
+    vault_idle: int
+    strategy_balance: int
+    total_debt: int
+    strategy_active: bool
+
+    @property
+    def strategy_interactions(self) -> int:
+        return self.counters.strategy_interactions
+
+    @property
+    def shortfall_amount(self) -> int:
+        return sum(s.requested - s.available for s in self.shortfalls)
+
+
+class RedeemFailed(Exception):
+    def __init__(self, requested: int, available: int):
+        super().__init__(f"cannot redeem {requested}, only {available} available")
+        self.requested = requested
+        self.available = available
+
+
+def compute_new_allocated(allocated: int, withdrawn: int) -> int:
+    return allocated - withdrawn if allocated > withdrawn else 0
+
+
+@dataclass
+class VaultModel:
+    params: VaultParams
+    idle: int = 0
+    strategy_balance: int = 0
+    current_allocated: int = 0
+    total_debt: int = 0
+    strategy_active: bool = True
+    reserve_balance: int = 0
+    last_reserve_withdrawal: int = 0
+    now: int = 0
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def total_underlying(self) -> int:
+        return self.idle + self.current_allocated
+
+    def deposit(self, amount: int):
+        """Receives `amount` from the pool; mirrors `Vault.deposit`."""
+        self._count("vault_deposits")
+        self.idle += amount
+        self._deposit()
+
+    def withdraw(self, amount: int) -> bool:
+        """Sends `amount` to the pool; mirrors `Vault.withdraw`."""
+        self._count("vault_withdrawals")
+        if self.idle < amount:
+            allocated = self.strategy_balance
+            required_withdrawal = amount - self.idle
+            if required_withdrawal > allocated:
+                return False
+            new_target = scaled_mul(allocated - required_withdrawal, self.params.target_allocation)
+            excess_amount = allocated - new_target
+            self._strategy_withdraw(excess_amount)
+            self.current_allocated = compute_new_allocated(self.current_allocated, excess_amount)
+        else:
+            total_underlying = self.idle + self.strategy_balance
+            self._rebalance(total_underlying - amount, self.strategy_balance)
+        if self.idle < amount:
+            raise RedeemFailed(amount, self.idle)
+        self.idle -= amount
+        return True
+
+    def harvest(self) -> bool:
+        """Accounts the profits and losses of the strategy; mirrors `Vault._harvest`."""
+        self._count("harvests")
+        allocated_underlying = self.strategy_balance
+        amount_allocated = self.current_allocated
+        current_debt = self.total_debt
+        strategist_share = 0
+        if allocated_underlying > amount_allocated:
+            profit = allocated_underlying - amount_allocated
+            if profit > current_debt:
+                if current_debt > 0:
+                    profit -= current_debt
+                    current_debt = 0
+                strategist_share = self._share_profit(profit)
+            else:
+                current_debt -= profit
+        elif allocated_underlying < amount_allocated:
+            current_debt += amount_allocated - allocated_underlying
+            if current_debt > scaled_mul(amount_allocated, self.params.debt_limit):
+                current_debt = self._handle_excess_debt(current_debt)
+        else:
+            return True
+        self.total_debt = current_debt
+        self.current_allocated = self.strategy_balance
+        # the strategist is paid from the idle funds of the vault
+        self.idle -= strategist_share
+        return True
+
+    def _deposit(self):
+        if not self.strategy_active:
+            return
+        total_underlying = self.idle + self.strategy_balance
+        if total_underlying == 0:
+            return
+        self._rebalance(total_underlying, self.strategy_balance)
+
+    def _rebalance(self, total_underlying: int, allocated_underlying: int) -> bool:
+        if not self.strategy_active:
+            return False
+        target_allocation = self.params.target_allocation
+        bound = self.params.bound
+        target = scaled_mul(total_underlying, target_allocation)
+        upper_bound = 0 if target_allocation == 0 else min(target_allocation + bound, SCALE)
+        lower_bound = 0 if bound > target_allocation else target_allocation - bound
+        if allocated_underlying > scaled_mul(total_underlying, upper_bound):
+            withdraw_amount = allocated_underlying - target
+            self._strategy_withdraw(withdraw_amount)
+            self.current_allocated = compute_new_allocated(
+                self.current_allocated, withdraw_amount
+            )
+        elif allocated_underlying < scaled_mul(total_underlying, lower_bound):
+            deposit_amount = target - allocated_underlying
+            self._count("strategy_deposits")
+            self.idle -= deposit_amount
+            self.strategy_balance += deposit_amount
+            self.current_allocated += deposit_amount
+        return True
+
+    def _handle_excess_debt(self, current_debt: int) -> int:
+        if current_debt > self.reserve_balance:
+            self._emergency_stop()
+        elif self._can_withdraw_reserve():
+            self._withdraw_reserve(current_debt)
+            current_debt = 0
+            self._deposit()
+        return current_debt
+
+    def _emergency_stop(self):
+        self._count("emergency_stops")
+        self._count("strategy_withdraw_alls")
+        withdrawn = self.strategy_balance
+        self.idle += withdrawn
+        self.strategy_balance = 0
+        actual_debt = compute_new_allocated(self.current_allocated, withdrawn)
+        if self._can_withdraw_reserve() and self.reserve_balance > 0:
+            self._withdraw_reserve(min(actual_debt, self.reserve_balance))
+        self.strategy_active = False
+
+    def _share_profit(self, profit: int) -> int:
+        total_fee_amount = scaled_mul(profit, self.params.performance_fee)
+        if self.idle < total_fee_amount:
+            self._strategy_withdraw(total_fee_amount)
+        strategist_share = scaled_mul(total_fee_amount, self.params.strategist_fee)
+        reserve_share = scaled_mul(total_fee_amount, self.params.reserve_fee)
+        self.idle -= total_fee_amount - strategist_share
+        self.reserve_balance += reserve_share
+        return strategist_share
+
+    def _strategy_withdraw(self, amount: int):
+        self._count("strategy_withdrawals")
+        amount = min(amount, self.strategy_balance)
+        self.strategy_balance -= amount
+        self.idle += amount
+
+    def _can_withdraw_reserve(self) -> bool:
+        return self.now >= self.last_reserve_withdrawal + self.params.reserve_withdrawal_delay
+
+    def _withdraw_reserve(self, amount: int):
+        self.reserve_balance -= amount
+        self.last_reserve_withdrawal = self.now
+        self.idle += amount
+
+    def _count(self, name: str):
+        self.counters[name] = self.counters.get(name, 0) + 1
+
+
+@dataclass
+class PoolModel:
+    params: PoolParams
+    vault: VaultModel
+    balance: int = 0
+    lp_supply: int = 0
+    staked_by_actions: int = 0
+
+    def total_underlying(self) -> int:
+        return self.balance + self.vault.total_underlying()
+
+    def exchange_rate(self) -> int:
+        total_underlying = self.total_underlying()
+        if self.lp_supply == 0 or total_underlying == 0:
+            return SCALE
+        return scaled_div(total_underlying, self.lp_supply)
+
+    def deposit(self, amount: int) -> int:
+        """Mirrors `LiquidityPool.depositFor` and returns the LP tokens minted."""
+        if amount == 0:
+            return 0
+        minted = scaled_div(amount, self.exchange_rate())
+        if minted == 0:
+            raise ValueError("deposit too small to mint LP tokens")
+        self.balance += amount
+        self.lp_supply += minted
+        self.rebalance_vault()
+        return minted
+
+    def redeem_lp(self, lp_amount: int) -> int:
+        """Mirrors `LiquidityPool.redeem` without fees and returns the underlying redeemed."""
+        if not 0 < lp_amount <= self.lp_supply:
+            raise ValueError("invalid amount of LP tokens to redeem")
+        underlying = scaled_mul(lp_amount, self.exchange_rate())
+        self._redeem(underlying, lp_amount)
+        return underlying
+
+    def redeem(self, underlying: int) -> int:
+        """Redeems the LP tokens worth `underlying` and returns the LP tokens burnt."""
+        lp_amount = min(scaled_div(underlying, self.exchange_rate()), self.lp_supply)
+        self._redeem(underlying, lp_amount)
+        return lp_amount
+
+    def rebalance_vault(self, underlying_to_withdraw: int = 0):
+        """Mirrors `LiquidityPool._rebalanceVault`."""
+        total_underlying_staked = scaled_mul(self.staked_by_actions, self.exchange_rate())
+        underlying_balance = self.balance
+        maximum_deviation = scaled_mul(total_underlying_staked, self.params.reserve_deviation)
+        next_target_balance = scaled_mul(total_underlying_staked, self.params.required_reserves)
+        if (
+            underlying_to_withdraw > underlying_balance
+            or (underlying_balance - underlying_to_withdraw) + maximum_deviation
+            < next_target_balance
+        ):
+            required_deposits = next_target_balance + underlying_to_withdraw - underlying_balance
+            if self.vault.withdraw(required_deposits):
+                self.balance += required_deposits
+        else:
+            next_balance = underlying_balance - underlying_to_withdraw
+            if next_balance > next_target_balance + maximum_deviation:
+                excess_deposits = next_balance - next_target_balance
+                self.balance -= excess_deposits
+                self.vault.deposit(excess_deposits)
+
+    def _redeem(self, underlying: int, lp_amount: int):
+        self.rebalance_vault(underlying)
+        if self.balance < underlying:
+            raise RedeemFailed(underlying, self.balance)
+        self.balance -= underlying
+        self.lp_supply -= lp_amount
+
+
+class Simulator:
+    """Replays a trace of pool operations on a `PoolModel`.
+
+    A redemption that would revert on chain leaves the state unchanged and is
+    reported as a shortfall, together with the underlying that was available.
+    """
+
+    def __init__(
+        self,
+        vault_params: VaultParams,
+        pool_params: Optional[PoolParams] = None,
+        strategy_active: bool = True,
+    ):
+        vault = VaultModel(vault_params, strategy_active=strategy_active)
+        self.pool = PoolModel(pool_params or PoolParams(), vault)
+        self.shortfalls: List[Shortfall] = []
+
+    @property
+    def vault(self) -> VaultModel:
+        return self.pool.vault
+
+    def apply(self, entry: TraceEntry, index: int = 0):
+        self.vault.now = max(self.vault.now, entry.timestamp)
+        if entry.action in ("redeem", "redeem_lp"):
+            snapshot = copy.deepcopy(self.pool)
+            try:
+                getattr(self.pool, entry.action)(entry.amount)
+            except RedeemFailed as exc:
+                self.pool = snapshot
+                self.shortfalls.append(
+                    Shortfall(index, entry.timestamp, exc.requested, exc.available)
+                )
+        elif entry.action == "deposit":
+            self.pool.deposit(entry.amount)
+        elif entry.action == "profit":
+            self.vault.strategy_balance += entry.amount
+        elif entry.action == "loss":
+            self.vault.strategy_balance -= min(entry.amount, self.vault.strategy_balance)
+        elif entry.action == "harvest":
+            self.vault.harvest()
+        elif entry.action == "lock":
+            self.pool.staked_by_actions += entry.amount
+        elif entry.action == "unlock":
+            self.pool.staked_by_actions -= min(entry.amount, self.pool.staked_by_actions)
+        else:
+            raise ValueError(f"unknown action {entry.action}")
+
+    def run(self, trace: Iterable[TraceEntry]) -> SimulationReport:
+        for i, entry in enumerate(trace):
+            self.apply(entry, i)
+        return self.report()
+
+    def report(self) -> SimulationReport:
+        return SimulationReport(
+            Counters(**self.vault.counters),
+            list(self.shortfalls),
+            self.pool.balance,
+            self.vault.idle,
+            self.vault.strategy_balance,
+            self.vault.total_debt,
+            self.vault.strategy_active,
+        )
+
+
+def simulate(
+    trace: Sequence[TraceEntry],
+    vault_params: VaultParams,
+    pool_params: Optional[PoolParams] = None,
+) -> SimulationReport:
+    return Simulator(vault_params, pool_params).run(trace)
+
+
+def sweep(
+    trace: Sequence[TraceEntry],
+    vault_params: VaultParams,
+    pool_params: Optional[PoolParams] = None,
+    **grid: Sequence[int],
+) -> List[tuple]:
+    """Simulates `trace` for every combination of the parameters in `grid`.
+
+    Keys of `grid` are fields of `VaultParams` or `PoolParams`. Returns a list of
+    `(overrides, report)` sorted by number of shortfalls and strategy interactions.
+    """
+    pool_params = pool_params or PoolParams()
+    pool_fields = set(PoolParams.__dataclass_fields__)
+    names = list(grid)
+    results = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        overrides = dict(zip(names, values))
+        vault_overrides = {k: v for k, v in overrides.items() if k not in pool_fields}
+        pool_overrides = {k: v for k, v in overrides.items() if k in pool_fields}
+        report = simulate(
+            trace, replace(vault_params, **vault_overrides), replace(pool_params, **pool_overrides)
+        )
+        results.append((overrides, report))
+    results.sort(key=lambda r: (len(r[1].shortfalls), r[1].strategy_interactions))
+    return results
+
+
+def load_vault_params(
+    pool_name: str, chain_id: Optional[int] = None, path: Path = POOLS_CONFIG, **overrides
+) -> VaultParams:
+    """Reads the vault parameters of `config/pools/{pool_name}/pooldata.json`."""
+    data_path = path / pool_name / "pooldata.json"
+    with data_path.open() as fp:
+        raw_pool_config = json.load(fp)
+    vault_config = dict(raw_pool_config["default"]["vault"])
+    if chain_id is not None:
+        vault_config.update(raw_pool_config.get(str(chain_id), {}).get("vault", {}))
+    return VaultParams(
+        debt_limit=_scale(vault_config["debtLimit"]),
+        target_allocation=_scale(vault_config["targetAllocation"]),
+        bound=_scale(vault_config["bound"]),
+        **overrides,
+    )
+
+
+def load_trace_csv(path, decimals: int = 0) -> List[TraceEntry]:
+    """Reads a trace with `action`, `amount` and optional `timestamp` columns.
+
+    Amounts are multiplied by `10**decimals`, so they can be written in tokens.
+    """
+    trace = []
+    with open(path, newline="") as fp:
+        for row in csv.DictReader(fp):
+            action = row["action"].strip().lower()
+            if action not in ACTIONS:
+                raise ValueError(f"unknown action {action}")
+            amount = int(Decimal(row["amount"]) * 10**decimals)
+            trace.append(TraceEntry(action, amount, int(row.get("timestamp") or 0)))
+    return trace
+
+
+def trace_from_events(events: Iterable[dict]) -> List[TraceEntry]:
+    """Builds a trace from decoded `Deposit`, `DepositFor` and `Redeem` pool events.
+
+    Each event is a mapping with `event`, `args`, `blockNumber` and `logIndex`
+    keys and an optional `timestamp`; events are sorted by block and log index.
+    """
+    trace = []
+    ordered = sorted(events, key=lambda e: (e["blockNumber"], e["logIndex"]))
+    for event in ordered:
+        timestamp = event.get("timestamp", 0)
+        if event["event"] in ("Deposit", "DepositFor"):
+            trace.append(TraceEntry("deposit", event["args"]["depositAmount"], timestamp))
+        elif event["event"] == "Redeem":
+            trace.append(TraceEntry("redeem", event["args"]["redeemAmount"], timestamp))
+    return trace
@@ -0,0 +1,204 @@
+"""Reference model of the `LiquidityPool` withdrawal fees.
+
+The functions mirror `getNewCurrentFees`, `getWithdrawalFee` and
+`_updateUserFeesOnDeposit` using the same integer arithmetic as `ScaledMath`,
+so their results are exactly equal to the ones of the contract.
+
+The `*_batch` functions evaluate many scenarios at once on NumPy object arrays
+(Python integers, so there is no overflow).
+"""
+
+from typing import Dict, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+SCALE = 10**18
+MAX_UINT64 = 2**64 - 1
+DEFAULT_DECREASE_PERIOD = 7 * 86400
+
+
+def scaled_mul(a, b):
+    return a * b // SCALE
+
+
+def scaled_div(a, b):
+    return a * SCALE // b
+
+
+def to_uint64(value: int) -> int:
+    if not 0 <= value <= MAX_UINT64:
+        raise ValueError("SafeCast: value doesn't fit in 64 bits")
+    return value
+
+
+class FeeParams(NamedTuple):
+    min_fee: int = 0
+    max_fee: int = 0
+    decrease_period: int = DEFAULT_DECREASE_PERIOD
+
+
+class FeeMeta(NamedTuple):
+    time_to_wait: int = 0
+    fee_ratio: int = 0
+    last_action_timestamp: int = 0
+
+
+def get_new_current_fees(params: FeeParams, meta: FeeMeta, now: int) -> int:
+    time_elapsed = now - meta.last_action_timestamp
+    if time_elapsed < 0:
+        raise ValueError("arithmetic underflow")
+    if time_elapsed >= meta.time_to_wait or params.min_fee > meta.fee_ratio:
+        return params.min_fee
+    elapsed_share = scaled_div(time_elapsed, meta.time_to_wait)
+    return meta.fee_ratio - scaled_mul(meta.fee_ratio - params.min_fee, elapsed_share)
+
+
+def get_withdrawal_fee(
+    params: FeeParams, meta: FeeMeta, balance: int, amount: int, now: int
+) -> int:
+    """`balance` is the LP token balance of the account (excluding staked tokens)."""
+    if balance == 0:
+        return 0
+    return scaled_mul(amount, get_new_current_fees(params, meta, now))
+
+
+def update_fees_on_deposit(
+    params: FeeParams,
+    meta: FeeMeta,
+    balance: int,
+    amount_added: int,
+    now: int,
+    from_meta: Optional[FeeMeta] = None,
+) -> FeeMeta:
+    """Returns the fee meta of an account receiving `amount_added` LP tokens.
+
+    `balance` is the LP token balance of the account, including its staked and
+    action locked balance, before the transfer. `from_meta` is the fee meta of
+    the sender, or `None` when the tokens are minted.
+    """
+    new_current_fee_ratio = get_new_current_fees(params, meta, now)
+    share_added = scaled_div(amount_added, amount_added + balance)
+    share_existing = SCALE - share_added
+    if from_meta is None:
+        fee_on_deposit = params.max_fee
+        last_action_timestamp = now
+    else:
+        fee_on_deposit = get_new_current_fees(params, from_meta, now)
+        min_time = now - meta.time_to_wait
+        if min_time < 0:
+            raise ValueError("arithmetic underflow")
+        last_action_timestamp = max(meta.last_action_timestamp, min_time)
+        last_action_timestamp = (
+            share_existing * last_action_timestamp + share_added * now
+        ) // (share_existing + share_added)
+
+    new_fee_ratio = scaled_mul(share_existing, new_current_fee_ratio) + scaled_mul(
+        share_added, fee_on_deposit
+    )
+    return FeeMeta(
+        to_uint64(params.decrease_period),
+        to_uint64(new_fee_ratio),
+        to_uint64(last_action_timestamp),
+    )
+
+
+class WithdrawalFeeModel:
+    """Tracks the LP token balances and fee metas of accounts of a single pool.
+
+    Transfers from or to staker vaults, actions and whitelisted fee handlers do
+    not update fees in the contract and should not be applied to the model.
+    """
+
+    def __init__(self, params: FeeParams):
+        self.params = params
+        self.balances: Dict[str, int] = {}
+        self.metas: Dict[str, FeeMeta] = {}
+
+    def meta(self, account: str) -> FeeMeta:
+        return self.metas.get(account, FeeMeta())
+
+    def mint(self, account: str, amount: int, now: int):
+        self._receive(account, amount, now, None)
+
+    def burn(self, account: str, amount: int):
+        self.balances[account] = self.balances.get(account, 0) - amount
+
+    def transfer(self, sender: str, recipient: str, amount: int, now: int):
+        self._receive(recipient, amount, now, self.meta(sender))
+        self.burn(sender, amount)
+
+    def withdrawal_fee(self, account: str, amount: int, now: int) -> int:
+        return get_withdrawal_fee(
+            self.params, self.meta(account), self.balances.get(account, 0), amount, now
+        )
+
+    def _receive(self, account: str, amount: int, now: int, from_meta: Optional[FeeMeta]):
+        balance = self.balances.get(account, 0)
+        self.metas[account] = update_fees_on_deposit(
+            self.params, self.meta(account), balance, amount, now, from_meta
+        )
+        self.balances[account] = balance + amount
+
+
+def as_int_array(values):
+    """Converts `values` to a NumPy array of Python integers."""
+    array = np.empty(np.shape(values), dtype=object)
+    array[...] = values
+    return array
+
+
+def get_new_current_fees_batch(min_fee, time_to_wait, last_action_timestamp, fee_ratio, now):
+    """Vectorized `get_new_current_fees`; all arguments are broadcast against each other."""
+    values = (min_fee, time_to_wait, last_action_timestamp, fee_ratio, now)
+    min_fee, time_to_wait, last_action_timestamp, fee_ratio, now = np.broadcast_arrays(
+        *[as_int_array(value) for value in values]
+    )
+    time_elapsed = now - last_action_timestamp
+    if (time_elapsed < 0).any():
+        raise ValueError("arithmetic underflow")
+    at_min_fee = (time_elapsed >= time_to_wait) | (min_fee > fee_ratio)
+    safe_time_to_wait = np.where(time_to_wait == 0, 1, time_to_wait)
+    elapsed_share = time_elapsed * SCALE // safe_time_to_wait
+    decreased = fee_ratio - (fee_ratio - min_fee) * elapsed_share // SCALE
+    return np.where(at_min_fee, min_fee, decreased)
+
+
+def simulate_deposits_batch(
+    min_fee, max_fee, decrease_period, amounts: Sequence, times: Sequence
+):
+    """Evaluates sequences of deposits (mints) of a single account with no other transfers.
+
+    `min_fee`, `max_fee` and `decrease_period` have one value per scenario (or a single
+    value for all of them). `amounts` and `times` have shape `(scenarios, deposits)`
+    and hold the LP tokens minted by each deposit and the timestamp at which it happened.
+    Returns the `time_to_wait`, `fee_ratio` and `last_action_timestamp` arrays after
+    the last deposit, and the balance of the account.
+    """
+    amounts, times = as_int_array(amounts), as_int_array(times)
+    if amounts.ndim != 2 or amounts.shape != times.shape:
+        raise ValueError("amounts and times must have the same (scenarios, deposits) shape")
+    scenarios = amounts.shape[0]
+    min_fee, max_fee, decrease_period = [
+        np.broadcast_to(as_int_array(v), (scenarios,))
+        for v in (min_fee, max_fee, decrease_period)
+    ]
+    time_to_wait = as_int_array([0] * scenarios)
+    fee_ratio = as_int_array([0] * scenarios)
+    last_action_timestamp = as_int_array([0] * scenarios)
+    balance = as_int_array([0] * scenarios)
+
+    for step in range(amounts.shape[1]):
+        amount, now = amounts[:, step], times[:, step]
+        current_fee_ratio = get_new_current_fees_batch(
+            min_fee, time_to_wait, last_action_timestamp, fee_ratio, now
+        )
+        share_added = amount * SCALE // (amount + balance)
+        share_existing = SCALE - share_added
+        fee_ratio = share_existing * current_fee_ratio // SCALE + share_added * max_fee // SCALE
+        time_to_wait = decrease_period.copy()
+        last_action_timestamp = now.copy()
+        balance = balance + amount
+
+    if (fee_ratio > MAX_UINT64).any() or (time_to_wait > MAX_UINT64).any():
+        raise ValueError("SafeCast: value doesn't fit in 64 bits")
+    return time_to_wait, fee_ratio, last_action_timestamp, balance
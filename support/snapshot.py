@@ -0,0 +1,337 @@
+"""Reads the state of every pool, vault, strategy, staker vault and gauge of the
+protocol with a few aggregated calls and compares snapshots taken at different blocks.
+
+The calls are batched with Multicall2 (`tryBlockAndAggregate`). As the addresses
+of vaults and strategies are only known once the previous calls returned, a
+snapshot takes four calls, all pinned to the same block, independently of the
+number of pools.
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from brownie import ZERO_ADDRESS, Contract, interface  # type: ignore
+from brownie._config import CONFIG
+from hexbytes import HexBytes
+
+from support.constants import AddressProviderKeys
+
+MULTICALL2_ABI = [
+    {
+        "inputs": [
+            {"internalType": "bool", "name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall2.Call[]",
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "tryBlockAndAggregate",
+        "outputs": [
+            {"internalType": "uint256", "name": "blockNumber", "type": "uint256"},
+            {"internalType": "bytes32", "name": "blockHash", "type": "bytes32"},
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall2.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            },
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    }
+]
+
+
+class Call(NamedTuple):
+    target: str
+    data: str
+    decode: Callable[[str], Any]
+
+
+def call(method, *args) -> Call:
+    return Call(str(method._address), method.encode_input(*args), method.decode_output)
+
+
+class Multicall:
+    """Aggregates view calls with a deployed Multicall2 contract.
+
+    Calls that revert return `None` instead of failing the whole batch.
+    """
+
+    def __init__(self, address: Optional[str] = None):
+        address = address or CONFIG.active_network.get("multicall2")
+        if address is None:
+            raise ValueError("no multicall2 address configured for the active network")
+        self.contract = Contract.from_abi("Multicall2", address, MULTICALL2_ABI)
+
+    def aggregate(
+        self, calls: Sequence[Call], block_identifier: Optional[int] = None
+    ) -> Tuple[int, List[Any]]:
+        block_number, _, results = self.contract.tryBlockAndAggregate.call(
+            False,
+            [(c.target, c.data) for c in calls],
+            block_identifier=block_identifier,
+        )
+        return block_number, [
+            c.decode(HexBytes(data).hex()) if success else None
+            for c, (success, data) in zip(calls, results)
+        ]
+
+
+class StrategySnapshot(NamedTuple):
+    address: str
+    name: Optional[str]
+    balance: Optional[int]
+    harvestable: Optional[int]
+
+
+class VaultSnapshot(NamedTuple):
+    address: str
+    total_underlying: Optional[int]
+    strategy: Optional[StrategySnapshot]
+
+
+class StakerVaultSnapshot(NamedTuple):
+    address: str
+    total_staked: Optional[int]
+    staked_by_actions: Optional[int]
+    lp_gauge: Optional[str]
+
+
+class PoolSnapshot(NamedTuple):
+    address: str
+    name: Optional[str]
+    underlying: Optional[str]
+    lp_token: Optional[str]
+    lp_total_supply: Optional[int]
+    exchange_rate: Optional[int]
+    total_underlying: Optional[int]
+    is_shutdown: Optional[bool]
+    keeper_gauge: Optional[str]
+    vault: Optional[VaultSnapshot]
+    staker_vault: Optional[StakerVaultSnapshot]
+
+
+class ProtocolSnapshot(NamedTuple):
+    block_number: int
+    pools: Tuple[PoolSnapshot, ...]
+
+    def pool(self, address: str) -> Optional[PoolSnapshot]:
+        return next((pool for pool in self.pools if pool.address == address), None)
+
+
+class PoolChange(NamedTuple):
+    address: str
+    old: Optional[PoolSnapshot]
+    new: Optional[PoolSnapshot]
+    fields: Tuple[str, ...]
+
+
+def _is_set(address: Optional[str]) -> bool:
+    return address is not None and address != ZERO_ADDRESS
+
+
+def _address(value) -> Optional[str]:
+    return str(value) if _is_set(value) else None
+
+
+class SnapshotReader:
+    """Takes `ProtocolSnapshot`s of all the pools registered in the address provider."""
+
+    def __init__(self, address_provider, multicall: Optional[Multicall] = None):
+        self.address_provider = address_provider
+        self.multicall = multicall or Multicall()
+
+    def snapshot(self, block_identifier: Optional[int] = None) -> ProtocolSnapshot:
+        get_address = self.address_provider.getAddress["bytes32,bool"]
+        block_number, (pools, inflation_manager) = self.multicall.aggregate(
+            [
+                call(self.address_provider.allPools),
+                call(get_address, AddressProviderKeys.INFLATION_MANAGER_KEY.value, False),
+            ],
+            block_identifier,
+        )
+        pools = [str(pool) for pool in pools]
+        pool_data = self._read_pools(pools, _address(inflation_manager), block_number)
+        vault_data = self._read_vaults(pool_data, block_number)
+        strategy_data = self._read_strategies(vault_data, block_number)
+
+        return ProtocolSnapshot(
+            block_number,
+            tuple(
+                self._pool_snapshot(pool, pool_data[pool], vault_data, strategy_data)
+                for pool in pools
+            ),
+        )
+
+    def _read_pools(
+        self, pools: List[str], inflation_manager: Optional[str], block_number: int
+    ) -> Dict[str, Dict[str, Any]]:
+        fields = [
+            "name",
+            "getUnderlying",
+            "getLpToken",
+            "exchangeRate",
+            "totalUnderlying",
+            "isShutdown",
+            "vault",
+            "staker",
+        ]
+        calls = []
+        for pool in pools:
+            contract = interface.ILiquidityPool(pool)
+            calls.extend(call(getattr(contract, field)) for field in fields)
+        if inflation_manager is not None:
+            manager = interface.IInflationManager(inflation_manager)
+            calls.extend(call(manager.getKeeperGaugeForPool, pool) for pool in pools)
+        _, results = self.multicall.aggregate(calls, block_number)
+
+        data = {}
+        for i, pool in enumerate(pools):
+            data[pool] = dict(zip(fields, results[i * len(fields) : (i + 1) * len(fields)]))
+            gauge_index = len(pools) * len(fields) + i
+            data[pool]["keeperGauge"] = (
+                results[gauge_index] if inflation_manager is not None else None
+            )
+        return data
+
+    def _read_vaults(
+        self, pool_data: Dict[str, Dict[str, Any]], block_number: int
+    ) -> Dict[str, Dict[str, Any]]:
+        calls, keys = [], []
+        for pool, data in pool_data.items():
+            if _is_set(data["getLpToken"]):
+                calls.append(call(interface.IERC20Full(data["getLpToken"]).totalSupply))
+                keys.append((pool, "lpTotalSupply"))
+            if _is_set(data["vault"]):
+                vault = interface.IVault(data["vault"])
+                calls.extend([call(vault.getTotalUnderlying), call(vault.strategy)])
+                keys.extend([(pool, "vaultTotalUnderlying"), (pool, "strategy")])
+            if _is_set(data["staker"]):
+                staker = interface.IStakerVault(data["staker"])
+                calls.extend(
+                    [
+                        call(staker.getPoolTotalStaked),
+                        call(staker.getStakedByActions),
+                        call(staker.lpGauge),
+                    ]
+                )
+                keys.extend(
+                    [(pool, "totalStaked"), (pool, "stakedByActions"), (pool, "lpGauge")]
+                )
+        return self._group(keys, calls, block_number)
+
+    def _read_strategies(
+        self, vault_data: Dict[str, Dict[str, Any]], block_number: int
+    ) -> Dict[str, Dict[str, Any]]:
+        calls, keys = [], []
+        for pool, data in vault_data.items():
+            if not _is_set(data.get("strategy")):
+                continue
+            strategy = interface.IStrategy(data["strategy"])
+            calls.extend(
+                [call(strategy.name), call(strategy.balance), call(strategy.harvestable)]
+            )
+            keys.extend([(pool, "name"), (pool, "balance"), (pool, "harvestable")])
+        return self._group(keys, calls, block_number)
+
+    def _group(
+        self, keys: List[Tuple[str, str]], calls: List[Call], block_number: int
+    ) -> Dict[str, Dict[str, Any]]:
+        grouped: Dict[str, Dict[str, Any]] = {}
+        if not calls:
+            return grouped
+        _, results = self.multicall.aggregate(calls, block_number)
+        for (pool, field), result in zip(keys, results):
+            grouped.setdefault(pool, {})[field] = result
+        return grouped
+
+    def _pool_snapshot(self, pool, data, vault_data, strategy_data) -> PoolSnapshot:
+        vault_values = vault_data.get(pool, {})
+        vault = None
+        if _is_set(data["vault"]):
+            strategy = None
+            if _is_set(vault_values.get("strategy")):
+                strategy_values = strategy_data.get(pool, {})
+                strategy = StrategySnapshot(
+                    str(vault_values["strategy"]),
+                    strategy_values.get("name"),
+                    strategy_values.get("balance"),
+                    strategy_values.get("harvestable"),
+                )
+            vault = VaultSnapshot(
+                str(data["vault"]), vault_values.get("vaultTotalUnderlying"), strategy
+            )
+
+        staker_vault = None
+        if _is_set(data["staker"]):
+            staker_vault = StakerVaultSnapshot(
+                str(data["staker"]),
+                vault_values.get("totalStaked"),
+                vault_values.get("stakedByActions"),
+                _address(vault_values.get("lpGauge")),
+            )
+
+        return PoolSnapshot(
+            address=pool,
+            name=data["name"],
+            underlying=None if data["getUnderlying"] is None else str(data["getUnderlying"]),
+            lp_token=_address(data["getLpToken"]),
+            lp_total_supply=vault_values.get("lpTotalSupply"),
+            exchange_rate=data["exchangeRate"],
+            total_underlying=data["totalUnderlying"],
+            is_shutdown=data["isShutdown"],
+            keeper_gauge=_address(data["keeperGauge"]),
+            vault=vault,
+            staker_vault=staker_vault,
+        )
+
+
+def take_snapshot(
+    address_provider, block_identifier: Optional[int] = None
+) -> ProtocolSnapshot:
+    return SnapshotReader(address_provider).snapshot(block_identifier)
+
+
+def changed_fields(old: Any, new: Any, prefix: str = "") -> Tuple[str, ...]:
+    """Returns the (dotted) names of the fields that differ between two snapshots
+    of the same type. A nested snapshot that appeared or disappeared is reported
+    as a single field.
+    """
+    if old == new:
+        return ()
+    if not (isinstance(old, tuple) and hasattr(old, "_fields")) or type(old) != type(new):
+        return (prefix,)
+    fields: Tuple[str, ...] = ()
+    for field in old._fields:
+        name = f"{prefix}.{field}" if prefix else field
+        fields += changed_fields(getattr(old, field), getattr(new, field), name)
+    return fields
+
+
+def diff_snapshots(old: ProtocolSnapshot, new: ProtocolSnapshot) -> List[PoolChange]:
+    """Returns the pools that were added, removed or changed between `old` and `new`,
+    in the order of `new` followed by the removed pools.
+    """
+    old_pools = {pool.address: pool for pool in old.pools}
+    new_pools = {pool.address: pool for pool in new.pools}
+    changes = []
+    for address, new_pool in new_pools.items():
+        old_pool = old_pools.get(address)
+        if old_pool is None:
+            changes.append(PoolChange(address, None, new_pool, ()))
+            continue
+        fields = changed_fields(old_pool, new_pool)
+        if fields:
+            changes.append(PoolChange(address, old_pool, new_pool, fields))
+    for address, old_pool in old_pools.items():
+        if address not in new_pools:
+            changes.append(PoolChange(address, old_pool, None, ()))
+    return changes
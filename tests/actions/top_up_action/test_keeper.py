@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+from support.contract_utils import update_topup_handler
+from support.convert import format_to_bytes
+from support.keeper import (
+    EngineConfig,
+    ScannerConfig,
+    TopUpKeeper,
+    TopupExecutor,
+    TopupScanner,
+)
+from support.types import TopUpRecord
+from support.utils import encode_account, scale
+
+MOCK_PROTOCOL_NAME = format_to_bytes("mock", 32)
+OTHER_PROTOCOL_NAME = format_to_bytes("other", 32)
+
+pytestmark = pytest.mark.usefixtures(
+    "registerSetUp",
+    "curveInitialLiquidity",
+    "vault",
+    "mintAlice",
+    "approveAlice",
+)
+
+
+@pytest.fixture
+def registerSetUp(topUpAction, address_provider, admin, pool, mockTopUpHandler):
+    address_provider.addPool(pool, {"from": admin})
+    update_topup_handler(topUpAction, MOCK_PROTOCOL_NAME, mockTopUpHandler, admin)
+    update_topup_handler(topUpAction, OTHER_PROTOCOL_NAME, mockTopUpHandler, admin)
+
+
+@pytest.fixture
+def scanner(topUpKeeperHelper, topUpAction):
+    return TopupScanner(
+        topUpKeeperHelper,
+        topUpAction,
+        ScannerConfig(page_size=2, window_size=2, concurrency=4),
+    )
+
+
+def _create_position(
+    on_behalf_of, threshold, coin, payer, topUpAction, pool, lpToken, protocol
+):
+    decimals = coin.decimals()
+    single_topup_amount = scale(2, decimals)
+    total_topup_amount = scale(10, decimals)
+
+    pool.deposit(total_topup_amount * 2, {"from": payer})
+    lpToken.approve(topUpAction, total_topup_amount, {"from": payer})
+    max_gas_price = scale(30, 9)
+    topup_count = (total_topup_amount + single_topup_amount - 1) // single_topup_amount
+    gas_deposit = max_gas_price * topup_count * topUpAction.estimatedGasUsage()
+    topUpAction.register(
+        encode_account(on_behalf_of),
+        protocol,
+        total_topup_amount,
+        TopUpRecord(
+            threshold=scale(threshold),
+            priorityFee=scale(1, 9),
+            maxFee=max_gas_price,
+            actionToken=coin,
+            depositToken=lpToken,
+            singleTopUpAmount=single_topup_amount,
+            totalTopUpAmount=total_topup_amount,
+        ),
+        {"from": payer, "value": gas_deposit},
+    )
+
+
+@pytest.fixture
+def positions(accounts, coin, alice, topUpAction, pool, lpToken, approveAlice):
+    payers = accounts[:6]
+    executable = set()
+    for payer in payers:
+        if payer != alice:
+            coin.transfer(payer, scale(100, coin.decimals()), {"from": alice})
+            coin.approve(pool, 2**256 - 1, {"from": payer})
+        # the mock handler reports a factor of 1.3 for every account
+        for protocol, threshold in [
+            (MOCK_PROTOCOL_NAME, "1.5"),
+            (OTHER_PROTOCOL_NAME, "1.2"),
+        ]:
+            _create_position(
+                payer, threshold, coin, payer, topUpAction, pool, lpToken, protocol
+            )
+            if threshold == "1.5":
+                executable.add((payer.address, encode_account(payer), protocol))
+    return executable
+
+
+def _keys(topups):
+    return {
+        (topup.key.payer, topup.key.account.lower(), topup.key.protocol.lower())
+        for topup in topups
+    }
+
+
+def _expected(positions):
+    return {
+        (payer, account.lower(), "0x" + protocol.hex())
+        for payer, account, protocol in positions
+    }
+
+
+def test_count_users(scanner, positions):
+    assert asyncio.run(scanner.count_users()) == 6
+    # second count starts from the cached hint
+    assert asyncio.run(scanner.count_users()) == 6
+
+
+def test_count_users_no_positions(scanner):
+    assert asyncio.run(scanner.count_users()) == 0
+    assert asyncio.run(scanner.scan()) == []
+
+
+def test_scan_finds_all_executable(scanner, positions):
+    topups = asyncio.run(scanner.scan())
+    assert len(topups) == len(positions)
+    assert _keys(topups) == _expected(positions)
+
+
+def test_scan_shrinks_page_size_on_gas_cap(topUpKeeperHelper, topUpAction, positions):
+    class GasCappedHelper:
+        def getExecutableTopups(self, cursor, how_many, block_identifier=None):
+            if how_many > 1:
+                raise ValueError("gas required exceeds allowance (30000000)")
+            return topUpKeeperHelper.getExecutableTopups(
+                cursor, how_many, block_identifier=block_identifier
+            )
+
+    scanner = TopupScanner(GasCappedHelper(), topUpAction, ScannerConfig(page_size=8))
+    topups = asyncio.run(scanner.scan())
+    assert _keys(topups) == _expected(positions)
+    assert scanner.page_size <= 2
+
+
+def test_keeper_executes_topups(
+    chain, web3, alice, coin, topUpAction, scanner, positions
+):
+    chain.sleep(1)
+    chain.mine()
+    executor = TopupExecutor(topUpAction, alice)
+    keeper = TopUpKeeper(scanner, executor, web3, EngineConfig())
+
+    report = asyncio.run(keeper.run_once())
+    assert len(report.topups) == len(positions)
+    assert all(result.success for result in report.results)
+    assert not executor.pending
+
+    for payer, account, protocol in positions:
+        record = topUpAction.getPosition(payer, account, protocol)
+        assert record[7] < scale(10, coin.decimals())
+
+    # mock handler raises the factor to 1.6 after a top-up
+    assert asyncio.run(scanner.scan()) == []
+
+
+def test_batch_can_execute_across_protocols(topUpKeeperHelper, accounts, positions):
+    keys = [
+        (payer.address, encode_account(payer), protocol)
+        for payer in accounts[:6]
+        for protocol in [OTHER_PROTOCOL_NAME, MOCK_PROTOCOL_NAME]
+    ]
+    # unregistered positions are never executable
+    keys.append((accounts[7].address, encode_account(accounts[7]), MOCK_PROTOCOL_NAME))
+    results = topUpKeeperHelper.batchCanExecute(keys)
+    assert results == [topUpKeeperHelper.canExecute(key) for key in keys]
+    assert sum(results) == len(positions)
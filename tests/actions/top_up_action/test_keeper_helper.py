@@ -1,3 +1,4 @@
+import brownie
 from eth_abi import encode_abi
 import pytest
 from brownie import interface
@@ -193,3 +194,41 @@ def test_filters_unexecutable(
     assert len(executable_positions) == 3
     nextCursor = response[1]
     assert nextCursor == 0
+
+
+@pytest.mark.mainnetFork
+def test_batch_can_execute_matches_can_execute(
+    topUpKeeperHelper, decimals, lpToken, topUpAction, alice, dai, pool, bob
+):
+    create_aave_position(alice, decimals, lpToken, topUpAction, dai, pool)
+    create_compound_position(alice, decimals, lpToken, topUpAction, dai, pool, False)
+    create_aave_position(bob, decimals, lpToken, topUpAction, dai, pool, False)
+    create_compound_position(bob, decimals, lpToken, topUpAction, dai, pool)
+    keys = [
+        (user, encode_account(user), protocol)
+        for user in [alice, bob]
+        for protocol in [AAVE_PROTOCOL, COMPOUND_PROTOCOL]
+    ]
+    results = topUpKeeperHelper.batchCanExecute(keys)
+    assert results == [topUpKeeperHelper.canExecute(key) for key in keys]
+    assert results == [True, False, False, True]
+
+
+@pytest.mark.mainnetFork
+@pytest.mark.parametrize("protocol", [AAVE_PROTOCOL, COMPOUND_PROTOCOL])
+def test_get_user_factors_matches_get_user_factor(
+    topUpAction, decimals, lpToken, dai, pool, alice, bob, charlie, protocol
+):
+    create_position = (
+        create_aave_position if protocol == AAVE_PROTOCOL else create_compound_position
+    )
+    create_position(alice, decimals, lpToken, topUpAction, dai, pool)
+    create_position(bob, decimals, lpToken, topUpAction, dai, pool)
+    handler = interface.ITopUpHandler(topUpAction.getHandler(protocol))
+    # charlie has no debt on either protocol
+    accounts = [encode_account(user) for user in [alice, bob, charlie]]
+    factors = handler.getUserFactors(accounts, [b""] * len(accounts))
+    assert factors == [handler.getUserFactor(account, b"") for account in accounts]
+
+    with brownie.reverts("invalid argument"):
+        handler.getUserFactors(accounts, [b""])
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+from support.contract_utils import update_topup_handler
+from support.convert import format_to_bytes
+from support.keeper import IndexedScanner, PositionIndexer, PositionStore, TopupKey
+from support.types import TopUpRecord
+from support.utils import encode_account, scale
+
+MOCK_PROTOCOL_NAME = format_to_bytes("mock", 32)
+MOCK_PROTOCOL_HEX = "0x" + MOCK_PROTOCOL_NAME.hex()
+
+pytestmark = pytest.mark.usefixtures(
+    "registerSetUp",
+    "curveInitialLiquidity",
+    "vault",
+    "mintAlice",
+    "approveAlice",
+)
+
+
+@pytest.fixture
+def registerSetUp(topUpAction, address_provider, admin, pool, mockTopUpHandler):
+    address_provider.addPool(pool, {"from": admin})
+    update_topup_handler(topUpAction, MOCK_PROTOCOL_NAME, mockTopUpHandler, admin)
+
+
+@pytest.fixture
+def indexer(web3, topUpAction):
+    return PositionIndexer(
+        web3,
+        topUpAction,
+        PositionStore(),
+        start_block=web3.eth.block_number,
+        batch_size=5,
+    )
+
+
+def _register(account, threshold, coin, topUpAction, pool, lpToken, alice):
+    decimals = coin.decimals()
+    single_topup_amount = scale(2, decimals)
+    total_topup_amount = scale(10, decimals)
+    pool.deposit(total_topup_amount * 2, {"from": alice})
+    lpToken.approve(topUpAction, total_topup_amount, {"from": alice})
+    max_gas_price = scale(30, 9)
+    gas_deposit = max_gas_price * 5 * topUpAction.estimatedGasUsage()
+    return topUpAction.register(
+        account,
+        MOCK_PROTOCOL_NAME,
+        total_topup_amount,
+        TopUpRecord(
+            threshold=scale(threshold),
+            priorityFee=scale(1, 9),
+            maxFee=max_gas_price,
+            actionToken=coin,
+            depositToken=lpToken,
+            singleTopUpAmount=single_topup_amount,
+            totalTopUpAmount=total_topup_amount,
+        ),
+        {"from": alice, "value": gas_deposit},
+    )
+
+
+def _key(alice, account):
+    return TopupKey(alice.address, account.lower(), MOCK_PROTOCOL_HEX)
+
+
+def test_indexes_registered_positions(
+    indexer, alice, bob, coin, topUpAction, pool, lpToken
+):
+    _register(encode_account(alice), "1.5", coin, topUpAction, pool, lpToken, alice)
+    _register(encode_account(bob), "1.2", coin, topUpAction, pool, lpToken, alice)
+
+    assert indexer.sync() == 2
+    assert len(indexer.store) == 2
+    position = indexer.store.get(_key(alice, encode_account(alice)))
+    assert position.threshold == scale("1.5")
+    assert position.deposit_token == lpToken
+    assert (
+        position.deposit_token_balance
+        == topUpAction.getPosition(alice, encode_account(alice), MOCK_PROTOCOL_NAME)[8]
+    )
+
+    # nothing left to replay
+    assert indexer.sync() == 0
+
+
+def test_removes_reset_positions(indexer, alice, coin, topUpAction, pool, lpToken):
+    _register(encode_account(alice), "1.5", coin, topUpAction, pool, lpToken, alice)
+    indexer.sync()
+    topUpAction.resetPosition(
+        encode_account(alice), MOCK_PROTOCOL_NAME, False, {"from": alice}
+    )
+    indexer.sync()
+    assert len(indexer.store) == 0
+
+
+def test_resumes_from_stored_cursor(web3, alice, bob, coin, topUpAction, pool, lpToken):
+    store = PositionStore()
+    start_block = web3.eth.block_number
+    _register(encode_account(alice), "1.5", coin, topUpAction, pool, lpToken, alice)
+    assert PositionIndexer(web3, topUpAction, store, start_block).sync() == 1
+    _register(encode_account(bob), "1.5", coin, topUpAction, pool, lpToken, alice)
+    assert PositionIndexer(web3, topUpAction, store, start_block).sync() == 1
+    assert len(store) == 2
+
+
+def test_applies_topups(chain, indexer, alice, bob, coin, topUpAction, pool, lpToken):
+    _register(encode_account(alice), "1.5", coin, topUpAction, pool, lpToken, alice)
+    indexer.sync()
+    registered = indexer.store.get(_key(alice, encode_account(alice)))
+    chain.sleep(1)
+    tx = topUpAction.execute(
+        alice,
+        encode_account(alice),
+        bob,
+        MOCK_PROTOCOL_NAME,
+        {"from": alice, "priority_fee": scale(1, 9)},
+    )
+    indexer.sync()
+    position = indexer.store.get(_key(alice, encode_account(alice)))
+    assert position.top_up_count == 1
+    assert position.total_top_up_amount == (
+        registered.total_top_up_amount - tx.events["TopUp"]["topupAmount"]
+    )
+    assert (
+        position.deposit_token_balance
+        == topUpAction.getPosition(alice, encode_account(alice), MOCK_PROTOCOL_NAME)[8]
+    )
+
+
+def test_rolls_back_reorged_blocks(
+    chain, indexer, alice, bob, coin, topUpAction, pool, lpToken
+):
+    _register(encode_account(alice), "1.5", coin, topUpAction, pool, lpToken, alice)
+    indexer.sync()
+    checkpoint = chain.height
+
+    _register(encode_account(bob), "1.5", coin, topUpAction, pool, lpToken, alice)
+    indexer.sync()
+    assert len(indexer.store) == 2
+
+    # replace the blocks holding bob's deposit, approval and registration with empty ones
+    chain.undo(3)
+    chain.mine(10)
+    assert indexer.handle_reorg() <= checkpoint
+    indexer.sync()
+    assert len(indexer.store) == 1
+    assert indexer.store.get(_key(alice, encode_account(bob))) is None
+
+
+def test_indexed_scan(
+    indexer, alice, bob, coin, topUpAction, pool, lpToken, topUpKeeperHelper
+):
+    # the mock handler reports a factor of 1.3 for every account
+    _register(encode_account(alice), "1.5", coin, topUpAction, pool, lpToken, alice)
+    _register(encode_account(bob), "1.2", coin, topUpAction, pool, lpToken, alice)
+
+    scanner = IndexedScanner(indexer, topUpKeeperHelper, topUpAction, chunk_size=1)
+    topups = asyncio.run(scanner.scan())
+    assert [topup.key for topup in topups] == [_key(alice, encode_account(alice))]
+    assert topups[0].record[0] == scale("1.5")
@@ -236,3 +236,66 @@ def test_unstake_on_reset_true(alice, bob, lpToken, topUpAction, coin):
         encode_account(bob), PROTOCOL_1_ADDRESS, True, {"from": alice}
     )
     assert lpToken.balanceOf(alice) == 3e18
+
+
+def _register_many(payer, accounts, topUpAction, lpToken, coin, max_fee=scale(2, 9)):
+    amount = scale(2) * len(accounts)
+    lpToken.mint_for_testing(payer, amount, {"from": payer})
+    lpToken.approve(topUpAction, amount, {"from": payer})
+    for account in accounts:
+        topUpAction.register(
+            encode_account(account),
+            PROTOCOL_1_ADDRESS,
+            scale(2),
+            TopUpRecord(
+                threshold=scale(5),
+                priorityFee=scale(1, 9),
+                maxFee=max_fee,
+                actionToken=coin,
+                depositToken=lpToken,
+                singleTopUpAmount=scale(1),
+                totalTopUpAmount=scale(2),
+            ),
+            {"from": payer, "value": 2 * max_fee * topUpAction.estimatedGasUsage()},
+        )
+
+
+def test_reset_keeps_other_positions(accounts, alice, lpToken, topUpAction, coin):
+    owners = accounts[1:6]
+    _register_many(alice, owners, topUpAction, lpToken, coin)
+    eth_per_position = 2 * scale(2, 9) * topUpAction.estimatedGasUsage()
+    assert topUpAction.getEthRequiredForGas(alice) == 5 * eth_per_position
+
+    # remove one position from the middle and the first one
+    for owner in [owners[2], owners[0]]:
+        topUpAction.resetPosition(
+            encode_account(owner), PROTOCOL_1_ADDRESS, False, {"from": alice}
+        )
+
+    remaining = {account for account, _ in topUpAction.getUserPositions(alice)}
+    assert remaining == {encode_account(owner) for owner in owners[1:2] + owners[3:]}
+    assert topUpAction.getEthRequiredForGas(alice) == 3 * eth_per_position
+
+    # positions moved by the removals can still be removed
+    for owner in owners[1:2] + owners[3:]:
+        topUpAction.resetPosition(
+            encode_account(owner), PROTOCOL_1_ADDRESS, False, {"from": alice}
+        )
+    assert len(topUpAction.getUserPositions(alice)) == 0
+    assert topUpAction.getEthRequiredForGas(alice) == 0
+    assert topUpAction.usersWithPositions(0, 10)[0] == []
+
+    # and registered again
+    _register_many(alice, owners[:1], topUpAction, lpToken, coin)
+    assert topUpAction.getUserPositions(alice) == [
+        (encode_account(owners[0]), PROTOCOL_1_ADDRESS)
+    ]
+    assert topUpAction.getEthRequiredForGas(alice) == eth_per_position
+
+
+def test_eth_required_for_gas_follows_gas_usage(
+    accounts, alice, admin, lpToken, topUpAction, coin
+):
+    _register_many(alice, accounts[1:3], topUpAction, lpToken, coin)
+    topUpAction.updateEstimatedGasUsage(100_000, {"from": admin})
+    assert topUpAction.getEthRequiredForGas(alice) == 2 * 2 * scale(2, 9) * 100_000
@@ -251,3 +251,95 @@ def test_topup_same_block(
         for t in threading.enumerate():
             if t != threading.current_thread():
                 t.join()
+
+
+def test_topup_batch(chain, alice, bob, charlie, topUpAction, coin, lpToken, pool):
+    record, _ = _create_position(alice, "1.5", coin, alice, topUpAction, pool, lpToken)
+    _create_position(bob, "1.5", coin, alice, topUpAction, pool, lpToken)
+    _create_position(charlie, "1.2", coin, alice, topUpAction, pool, lpToken, chain)
+
+    keys = [
+        (alice, encode_account(alice), MOCK_PROTOCOL_NAME),
+        (alice, encode_account(bob), MOCK_PROTOCOL_NAME),
+        # below threshold
+        (alice, encode_account(charlie), MOCK_PROTOCOL_NAME),
+        # already topped up by the first entry
+        (alice, encode_account(alice), MOCK_PROTOCOL_NAME),
+    ]
+    tx = topUpAction.executeBatch(
+        keys, bob, 0, {"from": alice, "priority_fee": record.priorityFee}
+    )
+    assert tx.return_value == [True, True, False, False]
+
+    assert len(tx.events["TopUp"]) == 2
+    assert [event["account"] for event in tx.events["TopUp"]] == [
+        encode_account(alice),
+        encode_account(bob),
+    ]
+    assert len(tx.events["TopUpFailed"]) == 2
+    assert tx.events["TopUpFailed"][0]["account"] == encode_account(charlie)
+
+    # fees of both positions are paid at once
+    assert len(tx.events["FeesPayed"]) == 1
+    fees_event = tx.events["FeesPayed"][0]
+    assert fees_event["amount"] > 0
+    # no fees are left behind in the action
+    assert lpToken.balanceOf(topUpAction) == 0
+    assert fees_event["payer"] == topUpAction
+    assert fees_event["keeper"] == bob
+
+    # the fees of each position are attributed to its payer
+    deferred = tx.events["TopUpFeesDeferred"]
+    assert [event["account"] for event in deferred] == [
+        encode_account(alice),
+        encode_account(bob),
+    ]
+    assert all(event["payer"] == alice for event in deferred)
+    assert all(event["depositToken"] == lpToken for event in deferred)
+    assert sum(event["feeAmount"] for event in deferred) == fees_event["amount"]
+
+
+@pytest.mark.usefixtures("set_mero_locker_to_mock_token")
+def test_topup_batch_fails_with_unsufficient_staked(
+    alice, topUpAction, coin, lpToken, pool, controller, chain, admin
+):
+    controller.updateKeeperRequiredStakedMERO(scale(10), {"from": admin})
+    _create_position(alice, "1.5", coin, alice, topUpAction, pool, lpToken, chain)
+    with reverts("Not enough MERO tokens staked"):
+        topUpAction.executeBatch(
+            [(alice, encode_account(alice), MOCK_PROTOCOL_NAME)],
+            alice,
+            0,
+            {"from": alice},
+        )
+
+
+def test_execute_from_batch_only_self(alice, topUpAction, coin, lpToken, pool, chain):
+    _create_position(alice, "1.5", coin, alice, topUpAction, pool, lpToken, chain)
+    with reverts("unauthorized access"):
+        topUpAction.executeFromBatch(
+            (alice, encode_account(alice), MOCK_PROTOCOL_NAME),
+            alice,
+            alice,
+            0,
+            {"from": alice},
+        )
+
+
+def test_topup_updates_eth_required_for_gas(
+    chain, alice, bob, topUpAction, coin, lpToken, pool
+):
+    record, _ = _create_position(
+        alice, "1.5", coin, alice, topUpAction, pool, lpToken, chain
+    )
+    eth_per_topup = record.maxFee * topUpAction.estimatedGasUsage()
+    assert topUpAction.getEthRequiredForGas(alice) == 5 * eth_per_topup
+
+    topUpAction.execute(
+        alice,
+        encode_account(alice),
+        bob,
+        MOCK_PROTOCOL_NAME,
+        {"from": alice, "priority_fee": record.priorityFee},
+    )
+    assert topUpAction.getEthRequiredForGas(alice) == 4 * eth_per_topup
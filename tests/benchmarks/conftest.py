@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+from brownie.project.main import get_loaded_projects
+
+from support.gas_benchmark import (
+    GasRecorder,
+    compare_results,
+    format_comparison,
+    load_results,
+    merge_results,
+    save_results,
+)
+
+_recorder = GasRecorder()
+_worker_results = []
+
+
+@pytest.fixture(scope="session")
+def gas_recorder():
+    return _recorder
+
+
+def _project_path(path):
+    path = Path(path)
+    if path.is_absolute():
+        return path
+    return get_loaded_projects()[0]._path / path
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # results of the xdist workers are reported in the master process
+    _worker_results.append(node.workeroutput.get("gas_results", {}))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["gas_results"] = _recorder.results()
+        return
+    results = merge_results(_recorder.results(), *_worker_results)
+    if not results:
+        return
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    save_results(_project_path(config.getoption("gas_output")), results)
+
+    baseline_path = _project_path(config.getoption("gas_baseline"))
+    if config.getoption("update_gas_baseline"):
+        save_results(baseline_path, results)
+        reporter.write_line(f"gas baseline written to {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        # first run on a checkout without a baseline, nothing to compare against yet
+        save_results(baseline_path, results)
+        reporter.write_line(format_comparison(results))
+        reporter.write_line(
+            f"gas baseline {baseline_path} not found, recorded it from this run",
+            yellow=True,
+        )
+        return
+
+    baseline = load_results(baseline_path)
+    reporter.write_line(format_comparison(results, baseline))
+    regressions = compare_results(results, baseline, config.getoption("gas_tolerance"))
+    for regression in regressions:
+        reporter.write_line(
+            f"gas regression: {regression.id} {regression.baseline} -> "
+            f"{regression.current} ({regression.change:+.2%})",
+            red=True,
+        )
+    if regressions:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
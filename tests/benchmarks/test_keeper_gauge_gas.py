@@ -0,0 +1,46 @@
+import pytest
+
+from support.utils import scale
+
+UNCLAIMED_EPOCHS = [1, 10, 100, 1000]
+
+pytestmark = pytest.mark.usefixtures("setup_keeper_gauge")
+
+
+@pytest.fixture
+def setup_keeper_gauge(
+    admin, keeperGauge, topUpActionFeeHandler, inflation_manager, pool, minter, lpToken
+):
+    inflation_manager.setKeeperGauge(pool, keeperGauge, {"from": admin})
+    inflation_manager.setMinter(minter, {"from": admin})
+    topUpActionFeeHandler.setInitialKeeperGaugeForToken(lpToken, keeperGauge, {"from": admin})
+    inflation_manager.updateKeeperPoolWeight(pool, scale("0.5"), {"from": admin})
+
+
+@pytest.mark.parametrize("epochs", UNCLAIMED_EPOCHS)
+def test_claim_unclaimed_epochs(
+    gas_recorder,
+    keeperGauge,
+    topUpActionFeeHandler,
+    inflation_manager,
+    pool,
+    lpToken,
+    admin,
+    alice,
+    chain,
+    epochs,
+):
+    params = {"epochs": epochs}
+    # the keeper earns fees in the first and last epochs only
+    topUpActionFeeHandler.callReportFees(alice, scale(1), lpToken)
+    for epoch in range(epochs):
+        if epoch == epochs - 1:
+            tx = topUpActionFeeHandler.callReportFees(alice, scale(1), lpToken)
+            gas_recorder.record("KeeperGauge.reportFees", tx, **params)
+        chain.sleep(3600)
+        inflation_manager.advanceKeeperGaugeEpoch(pool, {"from": admin})
+
+    gas = keeperGauge.claimableRewards.estimate_gas(alice)
+    gas_recorder.record("KeeperGauge.claimableRewards", gas, **params)
+    tx = keeperGauge.claimRewards(alice, {"from": alice})
+    gas_recorder.record("KeeperGauge.claimRewards", tx, **params)
@@ -0,0 +1,83 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+from support.utils import scale
+
+USER_COUNTS = [1, 5, 10]
+
+pytestmark = pytest.mark.usefixtures("add_pool_to_controller")
+
+
+@pytest.fixture(scope="module")
+def add_pool_to_controller(admin, address_provider, pool):
+    address_provider.addPool(pool, {"from": admin})
+
+
+# configurations are applied in order on top of each other:
+# the vault is only deployed once the plain pool has been benchmarked
+@pytest.fixture(scope="module", params=["no_vault", "vault", "strategy"])
+def pool_config(request, admin):
+    if request.param != "no_vault":
+        vault = request.getfixturevalue("vault")
+        vault.updateTargetAllocation(scale("0.8"), {"from": admin})
+    if request.param == "strategy":
+        request.getfixturevalue("setUpStrategyForVault")
+    return request.param
+
+
+def _fund(coin, account, amount, admin, spender):
+    if coin == ZERO_ADDRESS:
+        return
+    coin.mint_for_testing(account, amount, {"from": admin})
+    coin.approve(spender, amount, {"from": account})
+
+
+def _deposit(pool, coin, account, amount):
+    value = amount if coin == ZERO_ADDRESS else 0
+    return pool.deposit(amount, {"from": account, "value": value})
+
+
+@pytest.mark.parametrize("users", USER_COUNTS)
+def test_deposit_redeem(
+    gas_recorder, pool_data, pool_config, pool, lpToken, coin, accounts, admin, users
+):
+    params = {"pool": pool_data["name"], "config": pool_config, "users": users}
+    amount = scale(1, pool_data["decimals"])
+    for account in accounts[:users]:
+        _fund(coin, account, amount, admin, pool)
+        tx = _deposit(pool, coin, account, amount)
+        gas_recorder.record("LiquidityPool.deposit", tx, **params)
+
+    for account in accounts[:users]:
+        tx = pool.redeem(lpToken.balanceOf(account) // 2, {"from": account})
+        gas_recorder.record("LiquidityPool.redeem", tx, **params)
+
+
+@pytest.mark.parametrize("users", USER_COUNTS)
+def test_stake_transfer(
+    gas_recorder, pool_data, pool, lpToken, stakerVault, coin, accounts, admin, users
+):
+    params = {"pool": pool_data["name"], "users": users}
+    amount = scale(1, pool_data["decimals"])
+    receiver = accounts[users]
+    for account in accounts[:users]:
+        _fund(coin, account, amount, admin, pool)
+        _deposit(pool, coin, account, amount)
+        staked = lpToken.balanceOf(account)
+        lpToken.approve(stakerVault, staked, {"from": account})
+        tx = stakerVault.stake(staked, {"from": account})
+        gas_recorder.record("StakerVault.stake", tx, **params)
+        tx = stakerVault.transfer(receiver, staked // 2, {"from": account})
+        gas_recorder.record("StakerVault.transfer", tx, **params)
+
+
+@pytest.mark.parametrize("users", USER_COUNTS)
+def test_lp_token_transfer(gas_recorder, pool_data, pool, lpToken, coin, accounts, admin, users):
+    params = {"pool": pool_data["name"], "users": users}
+    amount = scale(1, pool_data["decimals"])
+    receiver = accounts[users]
+    for account in accounts[:users]:
+        _fund(coin, account, amount, admin, pool)
+        _deposit(pool, coin, account, amount)
+        tx = lpToken.transfer(receiver, lpToken.balanceOf(account) // 2, {"from": account})
+        gas_recorder.record("LpToken.transfer", tx, **params)
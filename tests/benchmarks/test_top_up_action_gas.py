@@ -0,0 +1,161 @@
+import pytest
+from brownie import ZERO_ADDRESS, chain
+
+from support.contract_utils import update_topup_handler
+from support.convert import format_to_bytes
+from support.types import TopUpRecord
+from support.utils import encode_account, scale
+
+MOCK_PROTOCOL_NAME = format_to_bytes("mock", 32)
+PAYER_COUNTS = [1, 5]
+POSITION_COUNTS = [1, 5, 10]
+# the mock handler increases the factor of an address by 0.3 on every top-up
+# so this keeps every position of a payer executable
+THRESHOLD = scale(10)
+
+pytestmark = pytest.mark.usefixtures("registerSetUp")
+
+
+@pytest.fixture
+def registerSetUp(topUpAction, address_provider, admin, pool, mockTopUpHandler):
+    address_provider.addPool(pool, {"from": admin})
+    update_topup_handler(topUpAction, MOCK_PROTOCOL_NAME, mockTopUpHandler, admin)
+
+
+def _register_positions(
+    payer,
+    count,
+    coin,
+    decimals,
+    topUpAction,
+    pool,
+    lpToken,
+    admin,
+    gas_recorder,
+    params,
+):
+    single_topup_amount = scale(1, decimals)
+    total_topup_amount = scale(2, decimals)
+    deposit_amount = total_topup_amount * 2 * count
+    if coin == ZERO_ADDRESS:
+        pool.deposit(deposit_amount, {"from": payer, "value": deposit_amount})
+    else:
+        coin.mint_for_testing(payer, deposit_amount, {"from": admin})
+        coin.approve(pool, deposit_amount, {"from": payer})
+        pool.deposit(deposit_amount, {"from": payer})
+    lpToken.approve(topUpAction, lpToken.balanceOf(payer), {"from": payer})
+
+    max_fee = scale(30, 9)
+    gas_deposit = max_fee * 2 * topUpAction.estimatedGasUsage()
+    keys = []
+    for i in range(count):
+        account = encode_account(payer, f"{i:024x}")
+        tx = topUpAction.register(
+            account,
+            MOCK_PROTOCOL_NAME,
+            total_topup_amount,
+            TopUpRecord(
+                threshold=THRESHOLD,
+                priorityFee=scale(1, 9),
+                maxFee=max_fee,
+                actionToken=coin,
+                depositToken=lpToken,
+                singleTopUpAmount=single_topup_amount,
+                totalTopUpAmount=total_topup_amount,
+            ),
+            {"from": payer, "value": gas_deposit},
+        )
+        gas_recorder.record("TopUpAction.register", tx, **params)
+        keys.append((payer, account, MOCK_PROTOCOL_NAME))
+    return keys
+
+
+def _params(pool_data, payers, positions):
+    return {"pool": pool_data["name"], "payers": payers, "positions": positions}
+
+
+@pytest.mark.parametrize("positions", POSITION_COUNTS)
+@pytest.mark.parametrize("payers", PAYER_COUNTS)
+def test_register_execute(
+    gas_recorder,
+    pool_data,
+    topUpAction,
+    controller,
+    pool,
+    lpToken,
+    coin,
+    accounts,
+    admin,
+    payers,
+    positions,
+):
+    params = _params(pool_data, payers, positions)
+    keys = []
+    for payer in accounts[:payers]:
+        keys += _register_positions(
+            payer,
+            positions,
+            coin,
+            pool_data["decimals"],
+            topUpAction,
+            pool,
+            lpToken,
+            admin,
+            gas_recorder,
+            params,
+        )
+    for payer in accounts[:payers]:
+        gas = controller.getTotalEthRequiredForGas.estimate_gas(payer)
+        gas_recorder.record("Controller.getTotalEthRequiredForGas", gas, **params)
+
+    chain.sleep(1)
+    keeper = accounts[payers]
+    for payer, account, protocol in keys:
+        tx = topUpAction.execute(
+            payer,
+            account,
+            keeper,
+            protocol,
+            {"from": keeper, "priority_fee": scale(1, 9)},
+        )
+        gas_recorder.record("TopUpAction.execute", tx, **params)
+
+    for payer, account, protocol in keys:
+        tx = topUpAction.resetPosition(account, protocol, False, {"from": payer})
+        gas_recorder.record("TopUpAction.resetPosition", tx, **params)
+
+
+@pytest.mark.parametrize("positions", POSITION_COUNTS)
+def test_execute_batch(
+    gas_recorder,
+    pool_data,
+    topUpAction,
+    pool,
+    lpToken,
+    coin,
+    accounts,
+    admin,
+    positions,
+):
+    params = _params(pool_data, 1, positions)
+    payer, keeper = accounts[:2]
+    keys = _register_positions(
+        payer,
+        positions,
+        coin,
+        pool_data["decimals"],
+        topUpAction,
+        pool,
+        lpToken,
+        admin,
+        gas_recorder,
+        params,
+    )
+    chain.sleep(1)
+    tx = topUpAction.executeBatch(
+        keys, keeper, 0, {"from": keeper, "priority_fee": scale(1, 9)}
+    )
+    assert all(tx.return_value)
+    gas_recorder.record(
+        "TopUpAction.executeBatch.perPosition", tx.gas_used // positions, **params
+    )
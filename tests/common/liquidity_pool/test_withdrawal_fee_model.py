@@ -0,0 +1,169 @@
+import random
+
+import numpy as np
+import pytest
+from brownie import ZERO_ADDRESS, MockErc20
+
+from support.models.withdrawal_fees import (
+    SCALE,
+    FeeMeta,
+    FeeParams,
+    WithdrawalFeeModel,
+    get_new_current_fees,
+    get_new_current_fees_batch,
+    simulate_deposits_batch,
+)
+
+
+class PoolDriver:
+    """Applies the same operations to the pool and to the withdrawal fee model."""
+
+    def __init__(self, chain, pool, lp_token, params, accounts):
+        self.pool = pool
+        self.lp_token = lp_token
+        self.model = WithdrawalFeeModel(params)
+        self.underlying = pool.getUnderlying()
+        self.now = chain.time()
+        pool.setTime(self.now)
+        pool.setMinWithdrawalFee(params.min_fee)
+        pool.setMaxWithdrawalFee(params.max_fee)
+        pool.setWithdrawalFeeDecreasePeriod(params.decrease_period)
+        if self.underlying != ZERO_ADDRESS:
+            token = MockErc20.at(self.underlying)
+            for account in accounts:
+                token.mint(10**30, {"from": account})
+                token.approve(pool, 10**30, {"from": account})
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.pool.setTime(self.now)
+
+    def deposit(self, account, amount):
+        value = amount if self.underlying == ZERO_ADDRESS else 0
+        before = self.lp_token.balanceOf(account)
+        self.pool.deposit(amount, {"from": account, "value": value})
+        self.model.mint(account.address, self.lp_token.balanceOf(account) - before, self.now)
+
+    def transfer(self, sender, recipient, amount):
+        self.lp_token.transfer(recipient, amount, {"from": sender})
+        self.model.transfer(sender.address, recipient.address, amount, self.now)
+
+    def redeem(self, account, amount):
+        self.pool.redeem(amount, {"from": account})
+        self.model.burn(account.address, amount)
+
+    def check(self, account):
+        assert self.lp_token.balanceOf(account) == self.model.balances.get(account.address, 0)
+        assert self.pool.withdrawalFeeMetas(account) == self.model.meta(account.address)
+        balance = self.lp_token.balanceOf(account)
+        assert self.pool.getWithdrawalFee(account, balance) == self.model.withdrawal_fee(
+            account.address, balance, self.now
+        )
+
+
+def test_model_matches_documented_example():
+    model = WithdrawalFeeModel(FeeParams(0, SCALE * 5 // 100, 100))
+    model.mint("alice", 100 * SCALE, 1_000)
+    model.mint("alice", 100 * SCALE, 1_050)
+    # (100 * 0.05 / 2 + 100 * 0.05) * 3/4 = 5.625
+    assert model.withdrawal_fee("alice", 200 * SCALE, 1_075) == 5_625 * SCALE // 1_000
+
+
+def test_get_new_current_fees_batch():
+    params = FeeParams(SCALE // 100, SCALE * 5 // 100, 1_000)
+    metas = [FeeMeta(1_000, ratio, 100) for ratio in (0, SCALE // 200, SCALE * 3 // 100)]
+    times = [100, 350, 1_099, 1_100, 5_000]
+    expected = [[get_new_current_fees(params, meta, now) for now in times] for meta in metas]
+    fees = get_new_current_fees_batch(
+        params.min_fee,
+        1_000,
+        100,
+        np.array([[meta.fee_ratio] for meta in metas], dtype=object),
+        np.array([times], dtype=object),
+    )
+    assert fees.tolist() == expected
+
+
+def test_simulate_deposits_batch():
+    rng = random.Random(0)
+    scenarios = [
+        (
+            FeeParams(rng.randrange(0, SCALE // 100), SCALE * 5 // 100, rng.randrange(1, 1_000)),
+            [rng.randrange(1, 100 * SCALE) for _ in range(5)],
+            sorted(rng.randrange(1_000, 3_000) for _ in range(5)),
+        )
+        for _ in range(50)
+    ]
+    time_to_wait, fee_ratio, last_action_timestamp, balance = simulate_deposits_batch(
+        [params.min_fee for params, _, _ in scenarios],
+        [params.max_fee for params, _, _ in scenarios],
+        [params.decrease_period for params, _, _ in scenarios],
+        [amounts for _, amounts, _ in scenarios],
+        [times for _, _, times in scenarios],
+    )
+    for i, (params, amounts, times) in enumerate(scenarios):
+        model = WithdrawalFeeModel(params)
+        for amount, now in zip(amounts, times):
+            model.mint("alice", amount, now)
+        assert model.meta("alice") == (time_to_wait[i], fee_ratio[i], last_action_timestamp[i])
+        assert model.balances["alice"] == balance[i]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_model_matches_pool(chain, pool, lpToken, alice, bob, decimals, seed):
+    rng = random.Random(seed)
+    params = FeeParams(
+        rng.choice([0, SCALE // 100]), rng.choice([SCALE * 2 // 100, SCALE * 5 // 100]), 1_000
+    )
+    driver = PoolDriver(chain, pool, lpToken, params, [alice, bob])
+    driver.deposit(alice, rng.randrange(1, 100) * 10**decimals)
+
+    for _ in range(8):
+        action = rng.choice(["deposit", "transfer", "redeem", "advance"])
+        sender, recipient = rng.sample([alice, bob], 2)
+        balance = lpToken.balanceOf(sender)
+        if action == "deposit" or balance == 0:
+            driver.deposit(sender, rng.randrange(1, 100) * 10**decimals)
+        elif action == "transfer":
+            driver.transfer(sender, recipient, rng.randrange(1, balance + 1))
+        elif action == "redeem" and balance < lpToken.totalSupply():
+            driver.redeem(sender, rng.randrange(1, balance + 1))
+        else:
+            driver.advance(rng.randrange(1, 600))
+        driver.check(alice)
+        driver.check(bob)
+
+
+def test_staking_matches_eager_fees(chain, pool, lpToken, stakerVault, alice, decimals):
+    params = FeeParams(0, SCALE * 5 // 100, 1_000)
+    driver = PoolDriver(chain, pool, lpToken, params, [alice])
+    driver.deposit(alice, 10 * 10**decimals)
+    meta = pool.withdrawalFeeMetas(alice)
+
+    # transfers to and from the staker vault never update fees
+    staked = lpToken.balanceOf(alice) // 2
+    lpToken.approve(stakerVault, staked, {"from": alice})
+    driver.advance(100)
+    stakerVault.stake(staked, {"from": alice})
+    assert pool.withdrawalFeeMetas(alice) == meta
+
+    # the staked balance is still weighted in on the next deposit
+    driver.advance(200)
+    driver.deposit(alice, 5 * 10**decimals)
+    assert pool.withdrawalFeeMetas(alice) == driver.model.meta(alice.address)
+
+    stakerVault.unstake(staked, {"from": alice})
+    driver.check(alice)
+
+
+def test_redeem_does_not_update_fees(chain, pool, lpToken, alice, decimals):
+    params = FeeParams(SCALE // 100, SCALE * 5 // 100, 1_000)
+    driver = PoolDriver(chain, pool, lpToken, params, [alice])
+    driver.deposit(alice, 10 * 10**decimals)
+    driver.advance(300)
+    driver.deposit(alice, 10 * 10**decimals)
+    meta = pool.withdrawalFeeMetas(alice)
+    driver.advance(100)
+    driver.redeem(alice, lpToken.balanceOf(alice) // 3)
+    assert pool.withdrawalFeeMetas(alice) == meta
+    driver.check(alice)
@@ -0,0 +1,71 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+from support.constants import Roles
+from support.utils import scale
+
+pytestmark = pytest.mark.usefixtures("setUpVault", "addInitialLiquidity")
+
+TARGET_ALLOC = 0.9
+DEVIATION_BOUND = 0.05
+
+
+@pytest.fixture
+def setUpVault(admin, vault, mockStrategy, harvestRouter, role_manager):
+    vault.setStrategy(mockStrategy, {"from": admin})
+    vault.activateStrategy({"from": admin})
+    mockStrategy.setVault(vault, {"from": admin})
+    vault.setTargetAllocation(10**18 * TARGET_ALLOC)
+    vault.setBound(10**18 * DEVIATION_BOUND)
+    role_manager.grantRole(Roles.MAINTENANCE.value, harvestRouter, {"from": admin})
+
+
+def _mock_profit(coin, strategy, amount, admin):
+    if coin == ZERO_ADDRESS:
+        admin.transfer(strategy, amount)
+    else:
+        coin.mint_for_testing(strategy, amount, {"from": admin})
+
+
+def test_harvest_many(harvestRouter, vault, mockStrategy, coin, decimals, admin):
+    profit = scale(1, decimals)
+    _mock_profit(coin, mockStrategy, profit, admin)
+    net_profit = profit - profit * vault.performanceFee() // scale(1)
+
+    tx = harvestRouter.harvestMany([vault], 0, {"from": admin})
+    assert tx.return_value == 1
+    assert tx.events["Harvest"]["netProfit"] == net_profit
+    event = tx.events["VaultsHarvested"]
+    assert event["vaults"] == [vault]
+    assert event["profits"] == [net_profit]
+    assert event["losses"] == [0]
+
+
+def test_harvest_all(harvestRouter, vault, admin):
+    tx = harvestRouter.harvestAll(0, {"from": admin})
+    assert tx.return_value == 1
+    assert tx.events["VaultsHarvested"]["vaults"] == [vault]
+    assert tx.events["VaultsHarvested"]["profits"] == [0]
+
+
+def test_harvest_many_skips_below_threshold(harvestRouter, vault, admin):
+    # the mock strategy has nothing harvestable
+    assert not harvestRouter.shouldHarvest(vault, scale(1), {"gas_price": 1})
+    tx = harvestRouter.harvestMany([vault, ZERO_ADDRESS], scale(1), {"from": admin, "gas_price": 1})
+    assert tx.return_value == 0
+    assert "VaultsHarvested" not in tx.events
+    assert "Harvest" not in tx.events
+
+
+def test_harvest_many_unauthorized(harvestRouter, vault, alice):
+    with brownie.reverts("unauthorized access"):
+        harvestRouter.harvestMany([vault], 0, {"from": alice})
+
+
+def test_set_harvest_gas_estimate(harvestRouter, admin, alice):
+    with brownie.reverts("unauthorized access"):
+        harvestRouter.setHarvestGasEstimate(300_000, {"from": alice})
+    tx = harvestRouter.setHarvestGasEstimate(300_000, {"from": admin})
+    assert tx.events["HarvestGasEstimateSet"]["harvestGasEstimate"] == 300_000
+    assert harvestRouter.harvestGasEstimate() == 300_000
@@ -0,0 +1,88 @@
+import math
+
+import pytest
+from brownie import web3
+
+from support.harvest_scheduler import (
+    SECONDS_PER_YEAR,
+    HarvestConfig,
+    HarvestScheduler,
+    deployed_strategies,
+    make_target,
+    optimal_harvest_interval,
+)
+from support.utils import scale
+
+pytestmark = pytest.mark.usefixtures("setUpVault", "addInitialLiquidity")
+
+
+@pytest.fixture
+def setUpVault(admin, vault, mockStrategy):
+    vault.setStrategy(mockStrategy, {"from": admin})
+    vault.activateStrategy({"from": admin})
+    mockStrategy.setVault(vault, {"from": admin})
+    vault.setTargetAllocation(scale("0.9"))
+    vault.setBound(scale("0.05"))
+
+
+@pytest.fixture
+def scheduler(admin, mockStrategy):
+    # price the underlying 1:1 with ETH whatever its decimals
+    return HarvestScheduler(
+        [make_target("MockStrategy", mockStrategy)],
+        admin,
+        web3,
+        pricer=lambda _: scale(1),
+        config=HarvestConfig(apy=0.1, execute=True),
+    )
+
+
+def test_optimal_harvest_interval():
+    gas_cost, reward_rate, apy = scale("0.01"), scale(1) / 86400, 0.1
+    interval = optimal_harvest_interval(gas_cost, reward_rate, apy)
+    expected = math.sqrt(2 * gas_cost * SECONDS_PER_YEAR / (reward_rate * apy))
+    assert interval == pytest.approx(expected)
+    assert optimal_harvest_interval(gas_cost, 0, apy) == math.inf
+
+
+def test_deployed_strategies():
+    strategies = deployed_strategies(1)
+    assert [name for name, _ in strategies] == ["MeroTriHopCvx"] * 3 + ["MeroEthCvx"]
+    assert deployed_strategies(1337) == []
+
+
+def test_poll_without_rewards(scheduler, mockStrategy, vault):
+    (estimate,) = scheduler.poll()
+    assert estimate.target.vault == vault
+    assert estimate.harvestable == 0
+    assert estimate.gas > 0
+    assert not estimate.should_harvest
+    assert scheduler.execute([estimate]) == []
+
+
+def test_harvest_when_rewards_cover_gas(scheduler, mockStrategy, decimals, chain):
+    mockStrategy.setHarvestable(scale(1, decimals))
+    (estimate,) = scheduler.poll(chain.time())
+    assert estimate.value == scale(1)
+    assert estimate.reward_rate is None
+    assert estimate.should_harvest
+
+    (result,) = scheduler.execute([estimate])
+    assert result.success
+    assert mockStrategy.harvestable() == 0
+
+
+def test_schedule_from_reward_rate(scheduler, mockStrategy, decimals, chain):
+    now = chain.time()
+    mockStrategy.setHarvestable(scale(1, decimals))
+    scheduler.poll(now)
+    mockStrategy.setHarvestable(scale(2, decimals))
+    (estimate,) = scheduler.poll(now + 1000)
+
+    assert estimate.reward_rate == pytest.approx(scale(1) / 1000)
+    assert estimate.optimal_interval == pytest.approx(
+        optimal_harvest_interval(estimate.gas_cost, estimate.reward_rate, 0.1)
+    )
+    optimal_value = max(estimate.reward_rate * estimate.optimal_interval, estimate.gas_cost)
+    assert estimate.should_harvest == (estimate.value >= optimal_value)
+    assert estimate.next_harvest >= now + 1000
@@ -0,0 +1,173 @@
+import random
+
+import pytest
+from brownie import ZERO_ADDRESS
+
+from support.models.vault import (
+    SCALE,
+    PoolParams,
+    Simulator,
+    TraceEntry,
+    VaultParams,
+    load_trace_csv,
+    load_vault_params,
+    simulate,
+    sweep,
+    trace_from_events,
+)
+from support.utils import scale
+
+PARAMS = VaultParams(
+    debt_limit=SCALE * 5 // 100, target_allocation=SCALE * 9 // 10, bound=SCALE * 5 // 100
+)
+
+
+def test_deposit_allocates_to_strategy():
+    report = simulate([TraceEntry("deposit", 1_000 * SCALE)], PARAMS)
+    assert report.strategy_balance == 900 * SCALE
+    assert report.vault_idle == 100 * SCALE
+    assert report.pool_balance == 0
+    assert report.counters.strategy_deposits == 1
+    assert report.strategy_interactions == 1
+
+
+def test_redeem_within_bound_does_not_rebalance():
+    trace = [TraceEntry("deposit", 1_000 * SCALE), TraceEntry("redeem", 50 * SCALE)]
+    report = simulate(trace, PARAMS)
+    assert report.strategy_interactions == 1
+    assert report.strategy_balance == 900 * SCALE
+    assert report.vault_idle == 50 * SCALE
+
+
+def test_redeem_outside_bound_rebalances():
+    trace = [TraceEntry("deposit", 1_000 * SCALE), TraceEntry("redeem", 60 * SCALE)]
+    report = simulate(trace, PARAMS)
+    assert report.counters.strategy_withdrawals == 1
+    assert report.strategy_balance == 846 * SCALE
+    assert report.vault_idle == 94 * SCALE
+    assert not report.shortfalls
+
+
+def test_shortfall_leaves_state_unchanged():
+    simulator = Simulator(PARAMS)
+    simulator.run([TraceEntry("deposit", 1_000 * SCALE), TraceEntry("loss", 500 * SCALE)])
+    before = simulator.report()
+    report = simulator.run([TraceEntry("redeem", 600 * SCALE)])
+    assert len(report.shortfalls) == 1
+    assert report.shortfalls[0].requested == 600 * SCALE
+    assert report.shortfall_amount == 600 * SCALE
+    assert report.strategy_balance == before.strategy_balance
+    assert report.vault_idle == before.vault_idle
+
+
+def test_harvest_loss_above_debt_limit_stops_strategy():
+    trace = [
+        TraceEntry("deposit", 1_000 * SCALE),
+        TraceEntry("loss", 100 * SCALE),
+        TraceEntry("harvest", 0),
+    ]
+    report = simulate(trace, PARAMS)
+    assert not report.strategy_active
+    assert report.counters.emergency_stops == 1
+    assert report.strategy_balance == 0
+    assert report.vault_idle == 900 * SCALE
+
+
+def test_harvest_loss_covered_by_reserve():
+    simulator = Simulator(PARAMS)
+    simulator.vault.reserve_balance = 100 * SCALE
+    simulator.vault.now = PARAMS.reserve_withdrawal_delay
+    trace = [
+        TraceEntry("deposit", 1_000 * SCALE),
+        TraceEntry("loss", 100 * SCALE),
+        TraceEntry("harvest", 0),
+    ]
+    report = simulator.run(trace)
+    assert report.strategy_active
+    assert report.total_debt == 0
+    assert simulator.vault.reserve_balance == 0
+    assert report.strategy_balance + report.vault_idle == 1_000 * SCALE
+
+
+def test_sweep_wider_bound_interacts_less():
+    rng = random.Random(0)
+    trace = [TraceEntry("deposit", 1_000 * SCALE)]
+    trace += [
+        TraceEntry(rng.choice(["deposit", "redeem"]), rng.randrange(1, 50) * SCALE)
+        for _ in range(100)
+    ]
+    bounds = [SCALE // 100, SCALE * 2 // 10]
+    results = {
+        overrides["bound"]: report for overrides, report in sweep(trace, PARAMS, bound=bounds)
+    }
+    narrow, wide = results[bounds[0]], results[bounds[1]]
+    assert wide.strategy_interactions < narrow.strategy_interactions
+
+
+def test_required_reserves_keep_funds_in_pool():
+    trace = [TraceEntry("deposit", 1_000 * SCALE), TraceEntry("lock", 500 * SCALE)]
+    trace.append(TraceEntry("deposit", 1 * SCALE))
+    pool_params = PoolParams(required_reserves=SCALE // 10, reserve_deviation=SCALE // 100)
+    report = simulate(trace, PARAMS, pool_params)
+    assert report.pool_balance == 50 * SCALE
+
+
+def test_load_vault_params():
+    params = load_vault_params("merodai")
+    assert params.target_allocation == scale("0.9")
+    assert params.bound == scale("0.05")
+    assert params.debt_limit == scale("0.2")
+
+
+def test_load_trace_csv(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text("action,amount,timestamp\ndeposit,1.5,10\nredeem,1,20\n")
+    assert load_trace_csv(path, decimals=6) == [
+        TraceEntry("deposit", 1_500_000, 10),
+        TraceEntry("redeem", 1_000_000, 20),
+    ]
+
+
+def test_trace_from_events():
+    events = [
+        {"event": "Redeem", "args": {"redeemAmount": 3}, "blockNumber": 2, "logIndex": 0},
+        {"event": "Deposit", "args": {"depositAmount": 5}, "blockNumber": 1, "logIndex": 1},
+        {"event": "Transfer", "args": {"value": 5}, "blockNumber": 1, "logIndex": 0},
+    ]
+    assert trace_from_events(events) == [TraceEntry("deposit", 5), TraceEntry("redeem", 3)]
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_model_matches_chain(
+    admin, alice, pool, vault, mockStrategy, coin, lpToken, decimals, seed
+):
+    vault.setStrategy(mockStrategy, {"from": admin})
+    vault.activateStrategy({"from": admin})
+    mockStrategy.setVault(vault, {"from": admin})
+    vault.setTargetAllocation(PARAMS.target_allocation)
+    vault.setBound(PARAMS.bound)
+    pool.updateMaxWithdrawalFee(0, {"from": admin})
+    pool.updateMinWithdrawalFee(0, {"from": admin})
+    if coin != ZERO_ADDRESS:
+        coin.mint_for_testing(alice, 1_000 * 10**decimals, {"from": admin})
+        coin.approve(pool, 2**256 - 1, {"from": alice})
+
+    simulator = Simulator(PARAMS)
+    model = simulator.pool
+    rng = random.Random(seed)
+    for _ in range(10):
+        balance = lpToken.balanceOf(alice)
+        if balance == 0 or rng.random() < 0.5:
+            amount = rng.randrange(1, 10) * 10**decimals
+            value = amount if coin == ZERO_ADDRESS else 0
+            pool.deposit(amount, {"from": alice, "value": value})
+            model.deposit(amount)
+        else:
+            amount = rng.randrange(1, balance + 1)
+            pool.redeem(amount, {"from": alice})
+            model.redeem_lp(amount)
+        assert pool.totalUnderlying() == model.total_underlying()
+        assert vault.getTotalUnderlying() == model.vault.total_underlying()
+        assert vault.currentAllocated() == model.vault.current_allocated
+        assert mockStrategy.balance() == model.vault.strategy_balance
+        assert lpToken.totalSupply() == model.lp_supply
@@ -7,6 +7,8 @@ from brownie._config import CONFIG
 from brownie.network import priority_fee
 from brownie.project.main import get_loaded_projects
 
+from fixtures.protocol_snapshot import protocol_scope
+
 pytest_plugins = [
     "fixtures.deployments",
     "fixtures.mainnet_deployments",
@@ -15,6 +17,8 @@ pytest_plugins = [
     "fixtures.mocks",
     "fixtures.setup",
     "fixtures.inflation_kickoff",
+    "fixtures.protocol_snapshot",
+    "fixtures.workers",
 ]
 
 _pooldata = {}
@@ -29,6 +33,42 @@ def pytest_addoption(parser):
     parser.addoption(
         "--skip-stateful", action="store_true", help="stateful tests should be skipped"
     )
+    parser.addoption(
+        "--gas-benchmark",
+        action="store_true",
+        help="run the gas benchmarks in tests/benchmarks",
+    )
+    parser.addoption(
+        "--gas-output",
+        default="reports/gas_benchmarks.json",
+        help="file where gas benchmark results are written",
+    )
+    parser.addoption(
+        "--gas-baseline",
+        default="scripts/profiling/gas_baseline.json",
+        help="gas benchmark results to compare against",
+    )
+    parser.addoption(
+        "--gas-tolerance",
+        type=float,
+        default=0.02,
+        help="maximum relative gas increase over the baseline",
+    )
+    parser.addoption(
+        "--update-gas-baseline",
+        action="store_true",
+        help="overwrite the gas baseline with the results of this run",
+    )
+    parser.addoption(
+        "--protocol-snapshot",
+        action="store_true",
+        help="deploy the core protocol once per pool and revert to it between modules",
+    )
+    parser.addoption(
+        "--timing-report",
+        action="store_true",
+        help="print the setup, call and teardown time of every test module",
+    )
 
 
 def pytest_sessionstart():
@@ -64,8 +104,8 @@ def pytest_generate_tests(metafunc):
             pool = pool + "_pool"
         poolType = metafunc.config.getoption("type")
 
-        if test_path.parts[1] in ("common",):
-            # Common tests
+        if test_path.parts[1] in ("common", "benchmarks"):
+            # Common tests and gas benchmarks
             if pool in pools:
                 params = [pool]
             else:
@@ -116,6 +156,10 @@ def pytest_ignore_collect(path, config):
     if path_parts[:1] == ("fixtures",):
         return None
 
+    # gas benchmarks only run on demand
+    if path_parts[:1] == ("benchmarks",):
+        return None if config.getoption("gas_benchmark") else True
+
     # don't run erc20 tests for eth pools
     if path_parts[:1] == ("erc20",):
         if config.getoption("type") == "eth":
@@ -153,7 +197,7 @@ def set_priority_fee():
 
 
 # main parametrized fixture, used to pass data about each pool into the other fixtures
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def pool_data(request):
     return _pooldata[request.param]
 
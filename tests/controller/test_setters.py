@@ -311,3 +311,105 @@ def test_transition_to_one_keeper_gauge(
     assert inflation_manager.getKeeperGaugeForPool(pool) == singleKeeperGauge
     assert inflation_manager.getKeeperGaugeForPool(otherPool) == singleKeeperGauge
     assert inflation_manager.totalKeeperPoolWeight() == 0
+
+
+def test_set_same_amm_gauge_twice(inflation_manager, mockAmmGauge, admin, mockAmmToken):
+    inflation_manager.setAmmGauge(mockAmmToken, mockAmmGauge, {"from": admin})
+    tx = inflation_manager.setAmmGauge(mockAmmToken, mockAmmGauge, {"from": admin})
+    assert tx.return_value == False
+    assert inflation_manager.getAmmGaugeForToken(mockAmmToken) == mockAmmGauge
+    assert mockAmmGauge.killed() == False
+
+
+def test_remove_keeper_gauge_after_fee_handler_update(
+    inflation_manager, admin, minter, pool, topUpAction, keeperGauge, lpToken
+):
+    inflation_manager.setKeeperGauge(pool, keeperGauge, {"from": admin})
+    inflation_manager.setMinter(minter, {"from": admin})
+    feeHandler = interface.IActionFeeHandler(topUpAction.feeHandler())
+    assert feeHandler.isKeeperGaugeUsed(keeperGauge) == False
+    feeHandler.setInitialKeeperGaugeForToken(lpToken, keeperGauge, {"from": admin})
+    assert feeHandler.isKeeperGaugeUsed(keeperGauge) == True
+    with brownie.reverts("Gauge still active"):
+        inflation_manager.removeKeeperGauge(pool, {"from": admin})
+
+    feeHandler.updateKeeperGauge(lpToken, ZERO_ADDRESS, {"from": admin})
+    assert feeHandler.isKeeperGaugeUsed(keeperGauge) == False
+    inflation_manager.removeKeeperGauge(pool, {"from": admin})
+    assert keeperGauge.killed() == True
+    assert inflation_manager.getKeeperGaugeForPool(pool) == ZERO_ADDRESS
+
+
+@pytest.fixture
+def gauges_set_before_upgrade(
+    inflation_manager, mockKeeperGauge, mockAmmGauge, mockAmmToken, admin, minter, pool
+):
+    inflation_manager.setMinter(minter, {"from": admin})
+    inflation_manager.setKeeperGauge(pool, mockKeeperGauge, {"from": admin})
+    inflation_manager.setAmmGauge(mockAmmToken, mockAmmGauge, {"from": admin})
+    # gauges set before the upgrade are missing from the indexes
+    inflation_manager.callClearGaugeIndexes(mockKeeperGauge, mockAmmGauge)
+
+
+@pytest.mark.usefixtures("gauges_set_before_upgrade")
+def test_rotate_gauges_before_indexes_initialized(
+    inflation_manager,
+    MockKeeperGauge,
+    MockAmmGauge,
+    mockKeeperGauge,
+    mockAmmGauge,
+    mockAmmToken,
+    address_provider,
+    admin,
+    pool,
+):
+    assert inflation_manager.gaugeIndexesInitialized() == False
+
+    tx = inflation_manager.setAmmGauge(mockAmmToken, mockAmmGauge, {"from": admin})
+    assert tx.return_value == False
+    assert mockAmmGauge.killed() == False
+
+    secondAmmGauge = admin.deploy(MockAmmGauge, address_provider, mockAmmToken)
+    inflation_manager.setAmmGauge(mockAmmToken, secondAmmGauge, {"from": admin})
+    assert inflation_manager.getAmmGaugeForToken(mockAmmToken) == secondAmmGauge
+    assert mockAmmGauge.killed() == True
+
+    secondKeeperGauge = admin.deploy(MockKeeperGauge, address_provider, pool)
+    inflation_manager.setKeeperGauge(pool, secondKeeperGauge, {"from": admin})
+    assert inflation_manager.getKeeperGaugeForPool(pool) == secondKeeperGauge
+    assert mockKeeperGauge.killed() == True
+    inflation_manager.removeKeeperGauge(pool, {"from": admin})
+    assert inflation_manager.getKeeperGaugeForPool(pool) == ZERO_ADDRESS
+
+
+@pytest.mark.usefixtures("gauges_set_before_upgrade")
+def test_initialize_gauge_indexes_on_upgrade(
+    inflation_manager,
+    MockInflationManager,
+    meroProxyAdmin,
+    mockKeeperGauge,
+    mockAmmGauge,
+    mockAmmToken,
+    address_provider,
+    admin,
+    alice,
+    bob,
+):
+    newInflationManager = admin.deploy(MockInflationManager, address_provider)
+    meroProxyAdmin.upgradeAndCall(
+        inflation_manager,
+        newInflationManager,
+        inflation_manager.initializeGaugeIndexes.encode_input(),
+        {"from": admin},
+    )
+    assert inflation_manager.gaugeIndexesInitialized() == True
+    with brownie.reverts("contract can only be initialized once"):
+        inflation_manager.initializeGaugeIndexes({"from": alice})
+
+    assert inflation_manager.getKeeperGaugePoolCount(mockKeeperGauge) == 1
+    assert inflation_manager.getAmmGaugeToken(mockAmmGauge) == mockAmmToken
+
+    inflation_manager.setKeeperGauge(bob, mockKeeperGauge, {"from": admin})
+    assert inflation_manager.getKeeperGaugePoolCount(mockKeeperGauge) == 2
+    inflation_manager.removeKeeperGauge(bob, {"from": admin})
+    assert inflation_manager.getKeeperGaugePoolCount(mockKeeperGauge) == 1
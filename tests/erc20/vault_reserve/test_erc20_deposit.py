@@ -18,3 +18,17 @@ def test_reserve_deposit_multiple_coins(vaultReserve, admin, vault, coin, decima
         vault.depositToReserve(_coin, 10**_decimals, {"from": admin})
         assert _coin.balanceOf(vaultReserve) == 10**_decimals
         assert vaultReserve.getBalance(vault, _coin) == 10**_decimals
+
+
+def test_reserve_deposit_many(vaultReserve, admin, vault, coin, decimals):
+    mockCoin = admin.deploy(MockErc20, 6)
+    coin.mint_for_testing(vault, 10**decimals, {"from": admin})
+    mockCoin.mint_for_testing(vault, 10**6, {"from": admin})
+    vault.depositManyToReserve([coin, mockCoin], [10**decimals, 10**6], {"from": admin})
+    assert vaultReserve.getBalances(vault, [coin, mockCoin]) == [10**decimals, 10**6]
+    assert mockCoin.balanceOf(vaultReserve) == 10**6
+
+
+def test_reserve_deposit_many_length_mismatch(admin, vault, coin, decimals):
+    with brownie.reverts("invalid argument"):
+        vault.depositManyToReserve([coin], [10**decimals, 1], {"from": admin})
@@ -46,3 +46,31 @@ def test_reserve_withdraw_multiple_coins(
     vault.withdrawFromReserve(coin, 10**decimals, {"from": admin})
     assert coin.balanceOf(vault) == 10**decimals
     assert coin.balanceOf(vaultReserve) == 0
+
+
+def test_reserve_withdraw_many(vaultReserve, admin, vault, coin, decimals, chain):
+    mockCoin = admin.deploy(MockErc20, 6)
+    mockCoin.mint_for_testing(vault, 10**6)
+    vault.depositToReserve(mockCoin, 10**6, {"from": admin})
+
+    tx = vault.withdrawManyFromReserve(
+        [coin, mockCoin], [10**decimals, 0.5 * 10**6], {"from": admin}
+    )
+    assert len(tx.events["Withdraw"]) == 2
+    assert coin.balanceOf(vault) == 10**decimals
+    assert mockCoin.balanceOf(vault) == 0.5 * 10**6
+    assert vaultReserve.getBalances(vault, [coin, mockCoin]) == [0, 0.5 * 10**6]
+
+    # the delay applies to the batch as a whole
+    with reverts("Reserve access exceeded"):
+        vault.withdrawManyFromReserve([mockCoin], [1], {"from": admin})
+    chain.sleep(vaultReserve.minWithdrawalDelay())
+    vault.withdrawManyFromReserve([mockCoin], [0.5 * 10**6], {"from": admin})
+    assert mockCoin.balanceOf(vaultReserve) == 0
+
+
+def test_reserve_withdraw_many_reverts(admin, vault, coin, decimals):
+    with reverts("invalid argument"):
+        vault.withdrawManyFromReserve([coin], [], {"from": admin})
+    with reverts("insufficient balance"):
+        vault.withdrawManyFromReserve([coin, coin], [10**decimals, 1], {"from": admin})
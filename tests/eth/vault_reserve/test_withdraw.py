@@ -1,3 +1,6 @@
+import brownie
+
+
 def test_withdraw_eth(vaultReserve, coin, admin, decimals, pool):
     # work around to give the `vault` permission to `admin`
     pool.setVault(admin, {"from": admin})
@@ -10,3 +13,18 @@ def test_withdraw_eth(vaultReserve, coin, admin, decimals, pool):
     wei_used_for_gas = tx.gas_used * tx.gas_price
     assert admin.balance() == previous_balance + 10**decimals - wei_used_for_gas
     assert vaultReserve.getBalance(admin, coin) == 0
+
+
+def test_deposit_and_withdraw_many_eth(vaultReserve, coin, admin, decimals, pool):
+    pool.setVault(admin, {"from": admin})
+    with brownie.reverts("invalid msg.value"):
+        vaultReserve.depositMany(
+            [coin, coin], [10**decimals, 10**decimals], {"value": 10**decimals, "from": admin}
+        )
+    vaultReserve.depositMany(
+        [coin, coin], [10**decimals, 10**decimals], {"value": 2 * 10**decimals, "from": admin}
+    )
+    assert vaultReserve.getBalance(admin, coin) == 2 * 10**decimals
+    vaultReserve.withdrawMany([coin, coin], [10**decimals, 10**decimals], {"from": admin})
+    assert vaultReserve.balance() == 0
+    assert vaultReserve.getBalance(admin, coin) == 0
@@ -5,6 +5,7 @@ import pytest
 from brownie import ZERO_ADDRESS, MockErc20, MockCurveSwap, interface  # type: ignore
 from support.utils import scale
 from support.mainnet_contracts import TokenAddresses, VendorAddresses
+from fixtures.protocol_snapshot import protocol_scope
 
 UNSCALED_MINT_AMOUNT = 500_000
 DEFAULT_MINT_AMOUNT = scale(UNSCALED_MINT_AMOUNT)
@@ -123,12 +124,12 @@ def mint_crv_for(account, amount=DEFAULT_MINT_AMOUNT):
     return interface.ERC20(TokenAddresses.CRV).balanceOf(account)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def decimals(pool_data):
     return pool_data.get("decimals")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def coin(pool_data, admin, isForked, decimals, MockErc20):
     underlying = pool_data.get("underlying", False)
     if isForked:
@@ -184,7 +185,7 @@ def curveCoins(coin, isForked, admin):
                 return [admin.deploy(MockErc20, 18), coin, admin.deploy(MockErc20, 6)]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def dai(admin, alice, bob, isForked, MockErc20, interface):
     if not isForked:
         return admin.deploy(MockErc20, 18)
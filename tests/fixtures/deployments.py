@@ -6,6 +6,8 @@ from support.mainnet_contracts import VendorAddresses, TokenAddresses
 from support.convert import format_to_bytes
 from support.utils import scale
 
+from fixtures.protocol_snapshot import protocol_scope
+
 
 AAVE_PROTOCOL = format_to_bytes("Aave", 32)
 COMPOUND_PROTOCOL = format_to_bytes("Compound", 32)
@@ -68,7 +70,7 @@ def _pool(
     return contract, lpToken, stakerVault
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def poolSetUp(
     pool_data,
     StakerVault,
@@ -112,7 +114,7 @@ def poolSetUp(
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def poolFactory(controller, PoolFactory, admin):
     return admin.deploy(PoolFactory, controller)
 
@@ -194,12 +196,12 @@ def minter(MockMEROMinter, address_provider, admin):
     return minter
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def gas_bank(admin, GasBank, controller):
     return admin.deploy(GasBank, controller)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def oracleProvider(admin, ChainlinkOracleProvider, role_manager):
     contract = admin.deploy(
         ChainlinkOracleProvider, role_manager, VendorAddresses.CHAINLINK_FEED_REGISTRY
@@ -208,7 +210,7 @@ def oracleProvider(admin, ChainlinkOracleProvider, role_manager):
     return contract
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def partially_initialized_address_provider(
     admin, role_manager, uninitialized_address_provider, treasury
 ):
@@ -216,7 +218,7 @@ def partially_initialized_address_provider(
     return uninitialized_address_provider
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def address_provider(
     admin,
     vaultReserve,
@@ -249,7 +251,7 @@ def address_provider(
     return partially_initialized_address_provider
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def uninitialized_address_provider(AddressProvider, admin, MeroUpgradeableProxy, meroProxyAdmin):
     addressProvider = admin.deploy(AddressProvider)
     addressProviderProxyAddress = admin.deploy(MeroUpgradeableProxy, addressProvider, meroProxyAdmin, b"")
@@ -257,7 +259,7 @@ def uninitialized_address_provider(AddressProvider, admin, MeroUpgradeableProxy,
     return addressProviderProxy
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def inflation_manager(
     MockInflationManager, admin, partially_initialized_address_provider, MeroUpgradeableProxy, meroProxyAdmin
 ):
@@ -267,7 +269,7 @@ def inflation_manager(
     return addressProviderProxy
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def controller(
     Controller, admin, partially_initialized_address_provider, MeroUpgradeableProxy, meroProxyAdmin
 ):
@@ -285,7 +287,7 @@ def mock_price_oracle(admin, MockPriceOracle):
     return admin.deploy(MockPriceOracle)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def topUpAction(
     TopUpActionLibrary,
     MockTopUpAction,
@@ -408,7 +410,7 @@ def setUpStrategyForVault(strategy, admin, vault):
     strategy.setVault(vault, {"from": admin})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def role_manager(admin, RoleManager, uninitialized_address_provider, meroProxyAdmin, MeroRoleManagerUpgradeableProxy ):
     role_manager = admin.deploy(RoleManager, uninitialized_address_provider)
     roleManagerProxyAddress = admin.deploy(MeroRoleManagerUpgradeableProxy , role_manager, meroProxyAdmin, b"")
@@ -418,7 +420,7 @@ def role_manager(admin, RoleManager, uninitialized_address_provider, meroProxyAd
     return roleManagerProxy
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def vaultReserve(admin, VaultReserve, role_manager):
     return admin.deploy(VaultReserve, role_manager)
 
@@ -485,7 +487,7 @@ def meroLocker(admin, MeroLocker, meroToken, lpToken, role_manager):
     return admin.deploy(MeroLocker, lpToken, meroToken, role_manager)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 @pytest.mark.mainnetFork
 def aaveHandler(AaveHandler, admin):
     return admin.deploy(
@@ -493,14 +495,14 @@ def aaveHandler(AaveHandler, admin):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 @pytest.mark.mainnetFork
 def ctoken_registry(admin, CTokenRegistry, isForked):
     if isForked:
         return admin.deploy(CTokenRegistry, VendorAddresses.COMPOUND_COMPTROLLER)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 @pytest.mark.mainnetFork
 def compoundHandler(CompoundHandler, ctoken_registry, admin, isForked):
     if isForked:
@@ -555,11 +557,21 @@ def apyHelper(admin, ApyHelper, address_provider):
     return admin.deploy(ApyHelper, address_provider)
 
 
+@pytest.fixture(scope="module")
+def protocolLens(admin, ProtocolLens, address_provider):
+    return admin.deploy(ProtocolLens, address_provider)
+
+
+@pytest.fixture(scope="module")
+def harvestRouter(admin, HarvestRouter, address_provider):
+    return admin.deploy(HarvestRouter, address_provider)
+
+
 @pytest.fixture(scope="module")
 def governanceTimelock(GovernanceTimelock, admin):
     return admin.deploy(GovernanceTimelock)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope=protocol_scope)
 def meroProxyAdmin(MeroProxyAdmin, admin):
     return admin.deploy(MeroProxyAdmin)
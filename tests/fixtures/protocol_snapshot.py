@@ -0,0 +1,162 @@
+"""Session-wide snapshot of the deployed protocol.
+
+With `--protocol-snapshot`, the fixtures in `PROTOCOL_FIXTURES` are session-scoped
+instead of module-scoped: the core protocol is deployed once per pool config, an
+EVM snapshot is taken, and every test module starts from (and is reverted to)
+this snapshot instead of a fresh chain.
+
+Without the option, these fixtures stay module-scoped and brownie's own
+`module_isolation` resets the chain between test modules.
+
+With `--timing-report`, the setup, call and teardown time of every test module
+is printed at the end of the run.
+"""
+
+import time
+from collections import defaultdict
+
+import pytest
+from brownie import chain
+from brownie._config import __version__ as brownie_version
+
+PROTOCOL_FIXTURES = {
+    "pool_data",
+    "decimals",
+    "coin",
+    "dai",
+    "meroProxyAdmin",
+    "uninitialized_address_provider",
+    "role_manager",
+    "partially_initialized_address_provider",
+    "controller",
+    "vaultReserve",
+    "gas_bank",
+    "oracleProvider",
+    "poolFactory",
+    "inflation_manager",
+    "address_provider",
+    "aaveHandler",
+    "ctoken_registry",
+    "compoundHandler",
+    "topUpAction",
+    "poolSetUp",
+}
+
+
+def protocol_scope(fixture_name, config):
+    if config.getoption("protocol_snapshot"):
+        return "session"
+    return "module"
+
+
+# `chain.snapshot()` and `chain.revert()` only keep the id of the last snapshot, which
+# `fn_isolation` replaces before every test. The id of the protocol snapshot is read and
+# restored through `Chain._snapshot_id`, brownie's only private attribute used here, so the
+# option is limited to the brownie version pinned in requirements.txt.
+SUPPORTED_BROWNIE_VERSION = "1.18.1"
+
+
+def _take_snapshot():
+    chain.snapshot()
+    return chain._snapshot_id
+
+
+def _revert_to_snapshot(snapshot_id):
+    chain._snapshot_id = snapshot_id
+    chain.revert()
+    return chain._snapshot_id
+
+
+class ProtocolSnapshot:
+    """Keeps the id of the EVM snapshot taken once the protocol fixtures are deployed."""
+
+    def __init__(self):
+        self.snapshot_id = None
+        self.outdated = False
+
+    def start_module(self):
+        if self.outdated:
+            # protocol fixtures were (re)deployed for this module
+            self.snapshot_id = _take_snapshot()
+            self.outdated = False
+        else:
+            self.restore()
+
+    def restore(self):
+        if self.snapshot_id is None:
+            chain.reset()
+            return
+        self.snapshot_id = _revert_to_snapshot(self.snapshot_id)
+
+
+protocol_snapshot = ProtocolSnapshot()
+
+
+class ProtocolSnapshotIsolation:
+    """Replaces brownie's `module_isolation` when `--protocol-snapshot` is given."""
+
+    @pytest.fixture(scope="module")
+    def module_isolation(self):
+        protocol_snapshot.start_module()
+        yield
+        protocol_snapshot.restore()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if not config.getoption("protocol_snapshot"):
+        return
+    if brownie_version != SUPPORTED_BROWNIE_VERSION:
+        raise pytest.UsageError(
+            f"--protocol-snapshot requires eth-brownie=={SUPPORTED_BROWNIE_VERSION}, "
+            f"found {brownie_version}"
+        )
+    # registered after brownie's fixtures so that this `module_isolation` takes precedence
+    config.pluginmanager.register(ProtocolSnapshotIsolation(), "protocol-snapshot-isolation")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_fixture_setup(fixturedef, request):
+    if fixturedef.argname in PROTOCOL_FIXTURES and fixturedef.scope == "session":
+        protocol_snapshot.outdated = True
+
+
+_module_durations = defaultdict(lambda: defaultdict(float))
+_session_start = None
+
+
+def pytest_sessionstart(session):
+    global _session_start
+    _session_start = time.perf_counter()
+
+
+def pytest_runtest_logreport(report):
+    module = report.nodeid.split("::")[0]
+    _module_durations[module][report.when] += report.duration
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("timing_report") or not _module_durations:
+        return
+    width = max(len(module) for module in _module_durations)
+    terminalreporter.section("module timings")
+    terminalreporter.write_line(
+        f"{'module':<{width}} {'setup':>9} {'call':>9} {'teardown':>9} {'total':>9}"
+    )
+    totals = defaultdict(float)
+    for module, durations in sorted(_module_durations.items()):
+        for when, duration in durations.items():
+            totals[when] += duration
+        terminalreporter.write_line(_format_timings(module, durations, width))
+    terminalreporter.write_line(_format_timings("total", totals, width))
+    mode = "protocol snapshot" if config.getoption("protocol_snapshot") else "module reset"
+    elapsed = time.perf_counter() - _session_start
+    terminalreporter.write_line(f"isolation: {mode}, wall time: {elapsed:.2f}s")
+
+
+def _format_timings(name, durations, width):
+    setup, call, teardown = (durations[when] for when in ("setup", "call", "teardown"))
+    return (
+        f"{name:<{width}} {setup:>8.2f}s {call:>8.2f}s {teardown:>8.2f}s "
+        f"{setup + call + teardown:>8.2f}s"
+    )
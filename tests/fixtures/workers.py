@@ -0,0 +1,37 @@
+"""Distribution of the test suite across xdist workers (`brownie test -n auto`).
+
+Brownie starts a separate development chain for every worker, on the port of the
+active network offset by the worker id. By default, xdist would send the tests of
+a module to any worker, so that every worker deploys the module fixtures again
+for each pool it runs. Instead, tests are grouped by module and `pool_data`
+parametrization: a worker runs all the tests of a module for a given pool, and
+large modules (e.g. the withdrawal fee tests) are spread across workers by pool.
+"""
+
+import re
+
+import pytest
+
+_POOL_PARAM = re.compile(r"\[(?:[^\]]*-)?(\w+_pool)(?:-[^\]]*)?\]$")
+
+
+def scheduling_group(nodeid):
+    module = nodeid.split("::", 1)[0]
+    match = _POOL_PARAM.search(nodeid)
+    if match is None:
+        return module
+    return f"{module}[{match.group(1)}]"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption("dist") not in ("load", "loadscope"):
+        return None
+
+    from xdist.scheduler import LoadScopeScheduling
+
+    class PoolScopeScheduling(LoadScopeScheduling):
+        def _split_scope(self, nodeid):
+            return scheduling_group(nodeid)
+
+    return PoolScopeScheduling(config, log)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from brownie import web3
+
+from support.exchange_rates import (
+    SCALE,
+    SECONDS_PER_YEAR,
+    ExchangeRateStore,
+    backfill_from_archive,
+    backfill_from_events,
+    rates_from_events,
+    rolling_apy,
+    rolling_apys,
+)
+from support.utils import scale
+
+
+def test_store_append_only(tmp_path):
+    store = ExchangeRateStore.for_pool(tmp_path, "0xABC")
+    assert len(store) == 0
+    assert store.last_block is None
+    assert store.append([2, 1], [20, 10], [2 * SCALE, SCALE]) == 2
+    # blocks at or before the last stored one are ignored
+    assert store.append([2, 3, 3], [20, 30, 30], [SCALE, 3 * SCALE, 4 * SCALE]) == 1
+    records = store.load()
+    assert store.last_block == 3
+    assert records["block"].tolist() == [1, 2, 3]
+    assert records["timestamp"].tolist() == [10, 20, 30]
+    assert records["rate"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_rolling_apy():
+    day = 86400
+    timestamps = np.arange(0, 60 * day, day // 2)
+    rates = 1.1 ** (timestamps / SECONDS_PER_YEAR)
+    apys = rolling_apys({"timestamp": timestamps, "rate": rates})
+    for window, name in [(day, "1d"), (7 * day, "7d"), (30 * day, "30d")]:
+        apy = apys[name]
+        covered = timestamps >= window
+        assert np.isnan(apy[~covered]).all()
+        assert np.allclose(apy[covered], 0.1)
+
+
+def test_rolling_apy_interpolates_window_start():
+    year = SECONDS_PER_YEAR
+    apy = rolling_apy([0, year, 3 * year], [1.0, 1.0, 3.0], year)
+    assert np.isnan(apy[0])
+    assert apy[1] == 0
+    # the rate a year before the last record is 2.0
+    assert apy[2] == pytest.approx(0.5)
+
+
+def test_rates_from_events():
+    events = [
+        {
+            "event": "Deposit",
+            "args": {"depositAmount": 3, "mintedLpTokens": 2},
+            "blockNumber": 5,
+            "logIndex": 1,
+        },
+        {
+            "event": "DepositFor",
+            "args": {"depositAmount": 2, "mintedLpTokens": 2},
+            "blockNumber": 5,
+            "logIndex": 0,
+        },
+        {"event": "Redeem", "args": {}, "blockNumber": 6, "logIndex": 0},
+    ]
+    assert rates_from_events(events) == {5: 3 * SCALE // 2}
+
+
+@pytest.mark.usefixtures("mintAlice", "approveAlice")
+def test_backfill_matches_pool(tmp_path, pool, coin, alice, admin, decimals):
+    start_block = web3.eth.block_number
+    pool.deposit(scale(10, decimals), {"from": alice})
+    # increase the exchange rate
+    coin.mint_for_testing(pool, scale(5, decimals), {"from": admin})
+    pool.deposit(scale(3, decimals), {"from": alice})
+    end_block = web3.eth.block_number
+
+    events_store = ExchangeRateStore(tmp_path / "events.bin")
+    assert backfill_from_events(events_store, pool, web3, start_block) == 2
+    assert events_store.load()["rate"].tolist() == pytest.approx([1.0, 1.5])
+
+    archive_store = ExchangeRateStore(tmp_path / "archive.bin")
+    backfill_from_archive(archive_store, pool, web3, start_block, end_block)
+    records = archive_store.load()
+    assert records["block"].tolist() == list(range(start_block, end_block + 1))
+    assert records["rate"][-1] == pool.exchangeRate() / SCALE
+    # rerunning does not duplicate records
+    assert backfill_from_archive(archive_store, pool, web3, start_block, end_block) == 0
@@ -0,0 +1,67 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+from support.utils import scale
+
+
+def test_get_pool_state(protocolLens, pool, coin, lpToken, stakerVault):
+    state = protocolLens.getPoolState(pool)
+    assert state["pool"] == pool
+    assert state["underlying"] == coin
+    assert state["lpToken"] == lpToken
+    assert state["lpTotalSupply"] == lpToken.totalSupply()
+    assert state["totalUnderlying"] == pool.totalUnderlying()
+    assert state["exchangeRate"] == pool.exchangeRate()
+    assert not state["isShutdown"]
+    assert state["vault"] == ZERO_ADDRESS
+    assert state["strategy"] == ZERO_ADDRESS
+    assert state["stakerVault"] == stakerVault
+    assert state["totalStaked"] == stakerVault.getPoolTotalStaked()
+    assert state["minWithdrawalFee"] == pool.minWithdrawalFee()
+    assert state["maxWithdrawalFee"] == pool.maxWithdrawalFee()
+    assert state["withdrawalFeeDecreasePeriod"] == pool.withdrawalFeeDecreasePeriod()
+
+
+@pytest.mark.usefixtures("setUpStrategyForVault")
+def test_get_pool_state_with_vault(protocolLens, pool, vault, strategy):
+    state = protocolLens.getPoolState(pool)
+    assert state["vault"] == vault
+    assert state["vaultTotalUnderlying"] == vault.getTotalUnderlying()
+    assert state["targetAllocation"] == vault.targetAllocation()
+    assert state["strategy"] == strategy
+    assert state["strategyBalance"] == strategy.balance()
+    assert state["harvestable"] == strategy.harvestable()
+
+
+@pytest.mark.usefixtures("mintAlice", "approveAlice")
+def test_get_pool_state_after_deposit(protocolLens, pool, alice, decimals):
+    pool.deposit(scale(10, decimals), {"from": alice})
+    state = protocolLens.getPoolState(pool)
+    assert state["totalUnderlying"] == scale(10, decimals)
+    assert state["lpTotalSupply"] == scale(10, decimals)
+
+
+def test_get_pool_states_paginates(protocolLens, address_provider, pool, cappedPool):
+    pools = address_provider.allPools()
+    assert len(pools) == 2
+
+    states, next_cursor = protocolLens.getPoolStates(0, 1)
+    assert [state["pool"] for state in states] == [pools[0]]
+    assert next_cursor == 1
+
+    states, next_cursor = protocolLens.getPoolStates(next_cursor, 1)
+    assert [state["pool"] for state in states] == [pools[1]]
+    assert next_cursor == 0
+
+    states, next_cursor = protocolLens.getPoolStates(0, 10)
+    assert [state["pool"] for state in states] == pools
+    assert next_cursor == 0
+
+    states, next_cursor = protocolLens.getPoolStates(2, 10)
+    assert len(states) == 0
+    assert next_cursor == 0
+
+
+def test_get_all_pool_states(protocolLens, address_provider, pool):
+    states = protocolLens.getAllPoolStates()
+    assert [state["pool"] for state in states] == address_provider.allPools()
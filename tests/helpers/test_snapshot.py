@@ -0,0 +1,59 @@
+import pytest
+from brownie import multicall
+
+from support.snapshot import Multicall, SnapshotReader, diff_snapshots
+from support.utils import scale
+
+
+@pytest.fixture(scope="module")
+def multicall2(admin):
+    return multicall.deploy({"from": admin})
+
+
+@pytest.fixture
+def reader(address_provider, multicall2):
+    return SnapshotReader(address_provider, Multicall(multicall2.address))
+
+
+def test_snapshot_pool(reader, pool, lpToken, stakerVault, coin, chain):
+    snapshot = reader.snapshot()
+    assert snapshot.block_number == chain.height
+    assert len(snapshot.pools) == 1
+
+    pool_snapshot = snapshot.pool(pool.address)
+    assert pool_snapshot.name == pool.name()
+    assert pool_snapshot.underlying == coin
+    assert pool_snapshot.lp_token == lpToken
+    assert pool_snapshot.lp_total_supply == lpToken.totalSupply()
+    assert pool_snapshot.exchange_rate == pool.exchangeRate()
+    assert pool_snapshot.total_underlying == pool.totalUnderlying()
+    assert not pool_snapshot.is_shutdown
+    assert pool_snapshot.vault is None
+    assert pool_snapshot.staker_vault.address == stakerVault
+    assert pool_snapshot.staker_vault.total_staked == stakerVault.getPoolTotalStaked()
+
+
+@pytest.mark.usefixtures("setUpStrategyForVault")
+def test_snapshot_vault_and_strategy(reader, pool, vault, strategy):
+    vault_snapshot = reader.snapshot().pool(pool.address).vault
+    assert vault_snapshot.address == vault
+    assert vault_snapshot.total_underlying == vault.getTotalUnderlying()
+    assert vault_snapshot.strategy.address == strategy
+    assert vault_snapshot.strategy.name == strategy.name()
+    assert vault_snapshot.strategy.balance == strategy.balance()
+    assert vault_snapshot.strategy.harvestable == strategy.harvestable()
+
+
+@pytest.mark.usefixtures("mintAlice", "approveAlice")
+def test_diff_snapshots(reader, pool, alice, decimals):
+    before = reader.snapshot()
+    assert diff_snapshots(before, reader.snapshot()) == []
+
+    pool.deposit(scale(10, decimals), {"from": alice})
+    after = reader.snapshot()
+    changes = diff_snapshots(before, after)
+    assert len(changes) == 1
+    assert changes[0].address == pool
+    assert changes[0].old == before.pool(pool.address)
+    assert changes[0].new == after.pool(pool.address)
+    assert set(changes[0].fields) == {"lp_total_supply", "total_underlying"}
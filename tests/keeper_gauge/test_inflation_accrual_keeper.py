@@ -322,3 +322,50 @@ def test_inflation_correct_when_transcending_inflation_update(
         keeper_rate_new * (end_time - decayTime)
 
     assert keeperGauge.perPeriodTotalInflation(1) == expected
+
+
+def test_claim_matches_sum_over_epochs(
+    admin,
+    keeperGauge,
+    topUpActionFeeHandler,
+    alice,
+    bob,
+    pool,
+    chain,
+    inflation_manager,
+    lpToken,
+):
+    inflation_manager.updateKeeperPoolWeight(pool, 0.5 * 1e18, {"from": admin})
+    fees = {alice: {}, bob: {}}
+    schedule = [(alice, bob), (bob,), (), (alice,), (alice, bob), ()]
+    for epoch, keepers in enumerate(schedule):
+        for keeper in keepers:
+            amount = (epoch + 1) * 10**18
+            topUpActionFeeHandler.callReportFees(keeper, amount, lpToken)
+            fees[keeper][epoch] = amount
+        chain.sleep(TEST_DELAY)
+        inflation_manager.advanceKeeperGaugeEpoch(pool, {"from": admin})
+
+    def expected(keeper, start, end):
+        total = 0
+        for i in range(start, end):
+            period_total_fees = keeperGauge.perPeriodTotalFees(i)
+            if period_total_fees > 0:
+                share = fees[keeper].get(i, 0) * 10**18 // period_total_fees
+                total += share * keeperGauge.perPeriodTotalInflation(i) // 10**18
+        return total
+
+    end_epoch = len(schedule)
+    tx = keeperGauge.claimRewards["address,uint256"](alice, 4, {"from": alice})
+    assert tx.return_value == expected(alice, 0, 4)
+    with reverts("zero transfer not allowed"):
+        keeperGauge.claimRewards["address,uint256"](alice, 2, {"from": alice})
+    assert keeperGauge.claimableRewards(alice) == expected(alice, 4, end_epoch)
+    tx = keeperGauge.claimRewards(alice, {"from": alice})
+    assert tx.return_value == expected(alice, 4, end_epoch)
+    assert keeperGauge.claimableRewards(alice) == 0
+
+    assert keeperGauge.claimableRewards(bob) == expected(bob, 0, end_epoch)
+    tx = keeperGauge.claimRewards["address,uint256"](bob, 1, {"from": bob})
+    assert tx.return_value == expected(bob, 0, 1)
+    assert keeperGauge.claimableRewards(bob) == expected(bob, 1, end_epoch)
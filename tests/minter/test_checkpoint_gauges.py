@@ -0,0 +1,67 @@
+import brownie
+import pytest
+
+KEEPER, LP, AMM = range(3)
+DECAY_PERIOD = 365 * 86400
+
+
+pytestmark = pytest.mark.usefixtures("setup_gauges")
+
+
+@pytest.fixture
+def setup_gauges(inflation_manager, admin, keeperGauge, ammGauge, mockAmmToken, pool, minter):
+    inflation_manager.setMinter(minter, {"from": admin})
+    inflation_manager.setKeeperGauge(pool, keeperGauge, {"from": admin})
+    inflation_manager.setAmmGauge(mockAmmToken, ammGauge, {"from": admin})
+    inflation_manager.updateKeeperPoolWeight(pool, 1e18, {"from": admin})
+    inflation_manager.updateAmmTokenWeight(mockAmmToken, 1e18, {"from": admin})
+
+
+def test_checkpoint_gauges_before_decay(inflation_manager, alice):
+    with brownie.reverts("inflation decay not due yet"):
+        inflation_manager.checkpointGauges(KEEPER, 0, 1, {"from": alice})
+
+
+def test_checkpoint_gauges_in_batches(
+    inflation_manager, minter, keeperGauge, ammGauge, alice, chain
+):
+    decay = minter.getNextInflationDecay()
+    assert decay == minter.lastInflationDecay() + DECAY_PERIOD
+    chain.sleep(DECAY_PERIOD)
+
+    tx = inflation_manager.checkpointGauges(KEEPER, 0, 5, {"from": alice})
+    assert tx.return_value == 1
+    assert tx.events["GaugesCheckpointed"][0]["updateEndTime"] == decay
+    assert keeperGauge.lastUpdated() == decay
+    assert inflation_manager.checkpointEndTime() == decay
+    assert inflation_manager.checkpointCursors(KEEPER) == 1
+
+    with brownie.reverts("invalid index"):
+        inflation_manager.checkpointGauges(AMM, 1, 1, {"from": alice})
+
+    keeper_inflation = keeperGauge.perPeriodTotalInflation(keeperGauge.epoch())
+    minter.executeInflationRateUpdate()
+    # the keeper gauge is not checkpointed again, the AMM gauge is
+    assert keeperGauge.perPeriodTotalInflation(keeperGauge.epoch()) == keeper_inflation
+    assert keeperGauge.lastUpdated() == decay
+    assert ammGauge.ammLastUpdated() == decay
+
+    with brownie.reverts("inflation decay not due yet"):
+        inflation_manager.checkpointGauges(AMM, 0, 1, {"from": alice})
+
+
+def test_checkpoint_gauges_matches_full_checkpoint(
+    inflation_manager, minter, keeperGauge, ammGauge, alice, chain
+):
+    chain.sleep(DECAY_PERIOD)
+    for kind in (KEEPER, LP, AMM):
+        count = inflation_manager.getGaugesCount(kind)
+        tx = inflation_manager.checkpointGauges(kind, 0, count, {"from": alice})
+        assert tx.return_value == count
+    keeper_inflation = keeperGauge.perPeriodTotalInflation(keeperGauge.epoch())
+    amm_integral = ammGauge.ammStakedIntegral()
+
+    tx = minter.executeInflationRateUpdate()
+    assert "GaugesCheckpointed" not in tx.events
+    assert keeperGauge.perPeriodTotalInflation(keeperGauge.epoch()) == keeper_inflation
+    assert ammGauge.ammStakedIntegral() == amm_integral
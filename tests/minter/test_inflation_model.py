@@ -0,0 +1,67 @@
+import pytest
+
+from support.models.inflation import (
+    DAY,
+    INFLATION_DECAY_PERIOD,
+    SCALE,
+    MinterParams,
+    Rates,
+    chain_rates,
+    cumulative_emissions,
+    find_period,
+    load_weights,
+    project,
+    rate_schedule,
+)
+
+PARAMS = MinterParams()
+
+
+def test_rate_schedule():
+    schedule = rate_schedule(PARAMS, 3)
+    assert schedule[0].keeper == 500_000 * SCALE // INFLATION_DECAY_PERIOD
+    assert schedule[1].keeper == PARAMS.annual_inflation_rate_keeper // INFLATION_DECAY_PERIOD
+    assert schedule[1].lp == schedule[0].lp * 6 // 10
+    assert schedule[2].amm == schedule[1].amm * 4 // 10
+    assert find_period(PARAMS, schedule[2]) == 2
+    assert find_period(PARAMS, Rates(1, 2, 3)) is None
+
+
+def test_cumulative_emissions():
+    schedule = rate_schedule(PARAMS, 2)
+    elapsed = [0, DAY, INFLATION_DECAY_PERIOD + DAY]
+    emissions = cumulative_emissions(PARAMS, elapsed)
+    assert emissions[0].tolist() == [0, 0, 0]
+    assert emissions[1][0] == pytest.approx(schedule[0].lp * DAY / SCALE)
+    first_year = schedule[0].lp * INFLATION_DECAY_PERIOD
+    assert emissions[2][0] == pytest.approx((first_year + schedule[1].lp * DAY) / SCALE)
+
+
+def test_project_splits_by_weights():
+    weights = load_weights()
+    duration = 3 * INFLATION_DECAY_PERIOD + DAY // 2
+    projection = project(PARAMS, weights, duration)
+    assert len(projection.timestamps) == 3 * 365 + 1
+    total_lp = projection.total("lp")
+    assert total_lp == pytest.approx(cumulative_emissions(PARAMS, [duration])[0][0])
+    assert projection.total("lp", "meroDAI") == pytest.approx(0.4 * total_lp)
+    assert projection.total("amm", "TAT") == pytest.approx(projection.total("amm"))
+
+
+def test_project_what_if_weights():
+    weights = load_weights()
+    what_if = weights.update("lp", meroDAI=0.0, meroUSDC=0.4)
+    assert "meroDAI" not in what_if.lp
+    assert weights.lp["meroDAI"] == 0.4
+    projection = project(PARAMS, what_if, INFLATION_DECAY_PERIOD, step=12)
+    assert projection.total("lp", "meroUSDC") == pytest.approx(0.5 * projection.total("lp"))
+
+
+def test_model_matches_chain(minter, chain):
+    params = MinterParams.from_minter(minter)
+    schedule = rate_schedule(params, 4)
+    assert chain_rates(minter) == schedule[0]
+    for period in range(1, 4):
+        chain.sleep(INFLATION_DECAY_PERIOD)
+        minter.executeInflationRateUpdate()
+        assert chain_rates(minter) == schedule[period]
@@ -144,3 +144,56 @@ def test_unstake_for(stakerVault, pool, lpToken, alice, bob, address_provider, a
     assert lpToken.balanceOf(alice) == 1e18
     assert stakerVault.balanceOf(alice) == 0
     assert stakerVault.balanceOf(bob) == 0
+
+
+def test_staked_by_actions(stakerVault, lpToken, address_provider, admin, alice, bob, charlie):
+    address_provider.addAction(bob, {"from": admin})
+    address_provider.addAction(charlie, {"from": admin})
+    lpToken.mint_for_testing(alice, 3e18, {"from": admin})
+    lpToken.approve(stakerVault, 3e18, {"from": alice})
+
+    stakerVault.stake(1e18, {"from": alice})
+    assert stakerVault.getStakedByActions() == 0
+
+    stakerVault.stakeFor(bob, 2e18, {"from": alice})
+    assert stakerVault.getStakedByActions() == 2e18
+
+    stakerVault.transfer(bob, 1e18, {"from": alice})
+    assert stakerVault.getStakedByActions() == 3e18
+
+    stakerVault.transfer(charlie, 1e18, {"from": bob})
+    assert stakerVault.getStakedByActions() == 3e18
+
+    stakerVault.transferFrom(bob, alice, 5e17, {"from": bob})
+    assert stakerVault.getStakedByActions() == 25e17
+
+    stakerVault.unstake(1e18, {"from": charlie})
+    assert stakerVault.getStakedByActions() == 15e17
+    assert stakerVault.getStakedByActions() == (
+        stakerVault.balanceOf(bob) + stakerVault.balanceOf(charlie)
+    )
+
+
+def test_add_action_holding_stake(
+    stakerVault, lpToken, address_provider, admin, alice, bob, charlie
+):
+    lpToken.mint_for_testing(alice, 3e18, {"from": admin})
+    lpToken.approve(stakerVault, 3e18, {"from": alice})
+    stakerVault.stakeFor(bob, 2e18, {"from": alice})
+    address_provider.addAction(charlie, {"from": admin})
+    stakerVault.stakeFor(charlie, 1e18, {"from": alice})
+
+    # bob already holds staked tokens when registered as an action
+    tx = address_provider.addAction(bob, {"from": admin})
+    assert tx.events["StakedByActionsSynced"]["stakedByActions"] == 3e18
+    assert stakerVault.getStakedByActions() == 3e18
+
+    # the action can then move all of its stake
+    stakerVault.transfer(alice, 1e18, {"from": bob})
+    stakerVault.unstake(1e18, {"from": bob})
+    assert stakerVault.getStakedByActions() == 1e18
+    stakerVault.unstake(1e18, {"from": charlie})
+    assert stakerVault.getStakedByActions() == 0
+
+    tx = stakerVault.syncStakedByActions({"from": alice})
+    assert tx.return_value == 0
@@ -0,0 +1,99 @@
+import brownie
+import pytest
+
+from support.utils import scale
+
+WITHDRAW_DELAY = 86400 * 10
+INCREASE_DELAY = 86400 * 20
+
+pytestmark = pytest.mark.usefixtures("setup_gauges")
+
+
+@pytest.fixture
+def claimZap(
+    admin, ClaimZap, address_provider, meroLocker, meroToken, role_manager, inflation_manager
+):
+    zap = admin.deploy(ClaimZap, address_provider, meroLocker, meroToken)
+    role_manager.addGaugeZap(zap, {"from": admin})
+    inflation_manager.whitelistGauge(zap, {"from": admin})
+    return zap
+
+
+@pytest.fixture
+def setup_gauges(
+    admin,
+    alice,
+    chain,
+    inflation_manager,
+    minter,
+    pool,
+    lpToken,
+    keeperGauge,
+    ammGauge,
+    mockAmmToken,
+    topUpActionFeeHandler,
+    meroLocker,
+):
+    inflation_manager.setMinter(minter, {"from": admin})
+    inflation_manager.setKeeperGauge(pool, keeperGauge, {"from": admin})
+    inflation_manager.updateKeeperPoolWeight(pool, scale(1), {"from": admin})
+    topUpActionFeeHandler.setInitialKeeperGaugeForToken(lpToken, keeperGauge, {"from": admin})
+    inflation_manager.setAmmGauge(mockAmmToken, ammGauge, {"from": admin})
+    inflation_manager.updateAmmTokenWeight(mockAmmToken, scale(1), {"from": admin})
+    meroLocker.initialize(scale(1), scale(5), INCREASE_DELAY, WITHDRAW_DELAY, {"from": admin})
+
+    mockAmmToken.mint(alice, scale(4))
+    mockAmmToken.approve(ammGauge, scale(4), {"from": alice})
+    ammGauge.stake(scale(4), {"from": alice})
+    topUpActionFeeHandler.callReportFees(alice, scale(1), lpToken)
+    chain.sleep(86400)
+    inflation_manager.advanceKeeperGaugeEpoch(pool, {"from": admin})
+
+
+def test_claim_rewards(claimZap, ammGauge, keeperGauge, meroToken, alice):
+    keeper_rewards = keeperGauge.claimableRewards(alice)
+    assert keeper_rewards > 0
+    tx = claimZap.claimRewards([ammGauge, keeperGauge], False, {"from": alice})
+    amm_rewards = tx.events["RewardClaimed"][0]["amount"]
+    assert amm_rewards > 0
+    assert tx.return_value == amm_rewards + keeper_rewards
+    assert len(tx.events["TokensMinted"]) == 1
+    assert meroToken.balanceOf(alice) == tx.return_value
+    assert tx.events["RewardsClaimed"][0]["locked"] is False
+    assert keeperGauge.claimableRewards(alice) == 0
+    assert ammGauge.claimableRewards(alice) == 0
+
+    # nothing left to claim
+    tx = claimZap.claimRewards([keeperGauge], False, {"from": alice})
+    assert tx.return_value == 0
+    assert "TokensMinted" not in tx.events
+
+
+def test_claim_rewards_and_lock(claimZap, ammGauge, keeperGauge, meroToken, meroLocker, alice):
+    tx = claimZap.claimRewards([ammGauge, keeperGauge], True, {"from": alice})
+    assert tx.return_value > 0
+    assert meroToken.balanceOf(alice) == 0
+    assert meroToken.balanceOf(claimZap) == 0
+    assert meroLocker.balanceOf(alice) == tx.return_value
+    assert tx.events["RewardsClaimed"][0]["locked"] is True
+
+
+def test_claim_rewards_for(claimZap, keeperGauge, meroToken, alice, bob):
+    keeper_rewards = keeperGauge.claimableRewards(alice)
+    tx = claimZap.claimRewardsFor(alice, [keeperGauge], {"from": bob})
+    assert tx.return_value == keeper_rewards
+    assert meroToken.balanceOf(alice) == keeper_rewards
+
+
+def test_claim_rewards_unknown_gauge(claimZap, keeperGauge, alice, bob):
+    with brownie.reverts("Gauge does not exist"):
+        claimZap.claimRewards([keeperGauge, bob], False, {"from": alice})
+
+
+def test_collect_rewards_requires_zap(ammGauge, keeperGauge, role_manager, admin, alice):
+    with brownie.reverts("unauthorized access"):
+        keeperGauge.collectRewards(alice, {"from": alice})
+    # the gauge zap role alone does not allow collecting rewards without minting them
+    role_manager.addGaugeZap(admin, {"from": admin})
+    with brownie.reverts("unauthorized access"):
+        ammGauge.collectRewards(alice, {"from": admin})
@@ -0,0 +1,120 @@
+import brownie
+import pytest
+
+from support.utils import scale
+
+
+@pytest.fixture(scope="module")
+def poolRouter(admin, PoolRouter, address_provider):
+    return admin.deploy(PoolRouter, address_provider)
+
+
+@pytest.fixture
+def fundAlice(admin, alice, coin, poolRouter, decimals):
+    coin.mint_for_testing(alice, scale(100, decimals), {"from": admin})
+    coin.approve(poolRouter, 2**256 - 1, {"from": alice})
+
+
+@pytest.mark.usefixtures("fundAlice")
+def test_deposit(poolRouter, pool, cappedPool, lpToken, stakerVault, coin, alice, decimals):
+    amount = scale(10, decimals)
+    operations = [
+        (pool, amount, amount, False),
+        (cappedPool, amount, 0, False),
+        (pool, amount, 0, True),
+    ]
+    tx = poolRouter.deposit(operations, {"from": alice})
+
+    assert tx.return_value == [amount, amount, amount]
+    # both deposits with the same underlying are pulled in a single transfer
+    assert len([t for t in tx.events["Transfer"] if t["from"] == alice]) == 1
+    assert coin.balanceOf(alice) == scale(70, decimals)
+    assert lpToken.balanceOf(alice) == amount
+    assert stakerVault.balanceOf(alice) == amount
+    assert brownie.interface.IERC20(cappedPool.getLpToken()).balanceOf(alice) == amount
+
+    event = tx.events["Deposited"]
+    assert event["account"] == alice
+    assert event["pools"] == [pool, cappedPool, pool]
+    assert event["mintedLpTokens"] == [amount, amount, amount]
+
+
+@pytest.mark.usefixtures("fundAlice")
+def test_deposit_min_out(poolRouter, pool, alice, decimals):
+    amount = scale(10, decimals)
+    with brownie.reverts("invalid amount"):
+        poolRouter.deposit([(pool, amount, amount + 1, False)], {"from": alice})
+
+
+@pytest.mark.usefixtures("fundAlice")
+def test_deposit_invalid(poolRouter, pool, alice, bob, decimals):
+    amount = scale(10, decimals)
+    with brownie.reverts("address not found"):
+        poolRouter.deposit([(bob, amount, 0, False)], {"from": alice})
+    with brownie.reverts("invalid msg.value"):
+        poolRouter.deposit([(pool, amount, 0, False)], {"from": alice, "value": 1})
+
+
+@pytest.mark.usefixtures("fundAlice")
+def test_redeem(poolRouter, pool, lpToken, stakerVault, coin, alice, decimals):
+    amount = scale(10, decimals)
+    pool.setMinWithdrawalFee(0)
+    pool.setMaxWithdrawalFee(0)
+    poolRouter.deposit([(pool, amount, 0, False), (pool, amount, 0, True)], {"from": alice})
+    lpToken.approve(poolRouter, 2**256 - 1, {"from": alice})
+    stakerVault.approve(poolRouter, 2**256 - 1, {"from": alice})
+
+    # redeems the LP tokens of alice first and unstakes the rest
+    tx = poolRouter.redeem([(pool, amount * 3 // 2, 0, True)], {"from": alice})
+    assert tx.return_value == [amount * 3 // 2]
+    assert lpToken.balanceOf(alice) == 0
+    assert stakerVault.balanceOf(alice) == amount // 2
+    assert coin.balanceOf(alice) == scale(100, decimals) - amount // 2
+    assert lpToken.balanceOf(poolRouter) == 0
+    assert coin.balanceOf(poolRouter) == 0
+
+    event = tx.events["Redeemed"]
+    assert event["pools"] == [pool]
+    assert event["redeemAmounts"] == [amount * 3 // 2]
+
+    with brownie.reverts():
+        poolRouter.redeem([(pool, amount, 0, False)], {"from": alice})
+
+
+@pytest.mark.usefixtures("fundAlice")
+def test_redeem_staked_withdrawal_fee(
+    poolRouter, pool, lpToken, stakerVault, coin, admin, alice, bob, charlie, chain, decimals
+):
+    amount = scale(10, decimals)
+    pool.setMaxWithdrawalFee(0.02 * 1e18, {"from": admin})
+    pool.setMinWithdrawalFee(0, {"from": admin})
+    pool.setWithdrawalFeeDecreasePeriod(86400, {"from": admin})
+    now = chain.time()
+    pool.setTime(now)
+
+    # the withdrawal fee of the router has fully decreased when alice and bob stake
+    coin.mint_for_testing(charlie, amount, {"from": admin})
+    coin.approve(poolRouter, amount, {"from": charlie})
+    poolRouter.deposit([(pool, amount, 0, True)], {"from": charlie})
+    pool.setTime(now + 86400)
+    for account in (alice, bob):
+        coin.mint_for_testing(account, amount, {"from": admin})
+        coin.approve(pool, amount, {"from": account})
+        pool.deposit(amount, {"from": account})
+        lpToken.approve(stakerVault, amount, {"from": account})
+        stakerVault.stake(amount, {"from": account})
+    pool.setTime(now + 86400 + 3600)
+    lpToken.approve(poolRouter, amount, {"from": alice})
+    stakerVault.approve(poolRouter, amount, {"from": alice})
+
+    fee = pool.getWithdrawalFee(alice, amount)
+    assert fee > 0
+    assert pool.getWithdrawalFee(bob, amount) == fee
+
+    expected = (amount - fee) * pool.exchangeRate() // 10**18
+    tx = poolRouter.redeem([(pool, amount, 0, True)], {"from": alice})
+    assert tx.return_value == [expected]
+
+    expected = (amount - fee) * pool.exchangeRate() // 10**18
+    tx = pool.unstakeAndRedeem(amount, 0, {"from": bob})
+    assert tx.return_value == expected